@@ -9,14 +9,14 @@ from datetime import datetime
 from http import HTTPStatus
 from logging.config import dictConfig
 from multiprocessing import Process
-from threading import Thread
-from typing import Any, Dict, List, NoReturn, Union
+from typing import Any, Dict, List, NoReturn, Tuple, Union
 
 from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse
+from fastapi.responses import (FileResponse, HTMLResponse, RedirectResponse,
+                               Response)
 
-from api import authenticator
+from api import authenticator, workers
 from api.models import GetData, GetText, InvestmentFilter
 from api.report_gatherer import Investment
 from executors.commander import timed_delay
@@ -24,10 +24,12 @@ from executors.offline import offline_communicator
 from executors.word_match import word_match
 from modules.audio import speaker, tts_stt
 from modules.conditions import conversation, keywords
+from modules.database import database
 from modules.exceptions import APIResponse
 from modules.models import config, models
 from modules.offline import compatibles
-from modules.utils import support
+from modules.scheduler import store
+from modules.utils import support, usage
 
 OFFLINE_PROTECTOR = [Depends(dependency=authenticator.offline_has_access)]
 ROBINHOOD_PROTECTOR = [Depends(dependency=authenticator.robinhood_has_access)]
@@ -50,6 +52,9 @@ logging.getLogger("uvicorn.access").propagate = False  # Disables access logger
 
 logger = logging.getLogger('uvicorn.default')
 
+offline_pool = workers.WorkerPool(workers=models.env.offline_workers, queue_depth=models.env.offline_queue,
+                                  queue_timeout=models.env.offline_queue_timeout)
+
 app = FastAPI(
     title="Jarvis API",
     description="Handles offline communication with **Jarvis** and generates a one time auth token for **Robinhood**."
@@ -59,17 +64,6 @@ app = FastAPI(
 )
 
 
-def remove_file(delay: int, filepath: str) -> NoReturn:
-    """Deletes the requested file after a certain time.
-
-    Args:
-        delay: Delay in seconds after which the requested file is to be deleted.
-        filepath: Filepath that has to be removed.
-    """
-    time.sleep(delay)
-    os.remove(filepath) if os.path.isfile(filepath) else logger.error(f"{filepath} not found.")
-
-
 def run_robinhood() -> NoReturn:
     """Runs in a dedicated process during startup, if the file was modified earlier than the past hour."""
     if os.path.isfile(models.fileio.robinhood):
@@ -112,6 +106,12 @@ async def start_robinhood() -> Any:
         Process(target=run_robinhood).start()
 
 
+@app.on_event(event_type='shutdown')
+async def stop_workers() -> NoReturn:
+    """Stops the worker pool that executes offline commands."""
+    offline_pool.shutdown()
+
+
 @app.get(path="/", response_class=RedirectResponse, include_in_schema=False)
 async def redirect_index() -> str:
     """Redirect to docs in ``read-only`` mode.
@@ -156,8 +156,111 @@ async def _offline_compatible() -> Dict[str, List[str]]:
     return {"compatible": offline_compatible}
 
 
-@app.post(path='/speech-synthesis', response_class=FileResponse, dependencies=OFFLINE_PROTECTOR)
-async def speech_synthesis(input_data: GetText, raise_for_status: bool = True) -> Union[FileResponse, None]:
+@app.post(path='/alarms', dependencies=OFFLINE_PROTECTOR)
+async def list_alarms() -> Dict[str, List[Dict[str, Any]]]:
+    """Lists the alarms ordered by their next fire time.
+
+    Returns:
+        dict:
+        Returns the list of alarms as a dictionary.
+    """
+    return {"alarms": store.alarms.entries()}
+
+
+@app.delete(path='/alarms/{identifier}', dependencies=OFFLINE_PROTECTOR)
+async def cancel_alarm(identifier: int) -> NoReturn:
+    """Cancels an alarm.
+
+    Args:
+        identifier: ID of the alarm.
+
+    Raises:
+        - 200: If the alarm was cancelled.
+        - 404: If there is no alarm with the given ID.
+    """
+    if store.alarms.remove(identifier=identifier):
+        raise APIResponse(status_code=HTTPStatus.OK.real, detail=f"Alarm {identifier} has been cancelled.")
+    raise APIResponse(status_code=HTTPStatus.NOT_FOUND.real, detail=f"Alarm {identifier} was not found.")
+
+
+@app.post(path='/reminders', dependencies=OFFLINE_PROTECTOR)
+async def list_reminders() -> Dict[str, List[Dict[str, Any]]]:
+    """Lists the reminders ordered by their next fire time.
+
+    Returns:
+        dict:
+        Returns the list of reminders as a dictionary.
+    """
+    return {"reminders": store.reminders.entries()}
+
+
+@app.delete(path='/reminders/{identifier}', dependencies=OFFLINE_PROTECTOR)
+async def cancel_reminder(identifier: int) -> NoReturn:
+    """Cancels a reminder.
+
+    Args:
+        identifier: ID of the reminder.
+
+    Raises:
+        - 200: If the reminder was cancelled.
+        - 404: If there is no reminder with the given ID.
+    """
+    if store.reminders.remove(identifier=identifier):
+        raise APIResponse(status_code=HTTPStatus.OK.real, detail=f"Reminder {identifier} has been cancelled.")
+    raise APIResponse(status_code=HTTPStatus.NOT_FOUND.real, detail=f"Reminder {identifier} was not found.")
+
+
+@app.post(path='/delays', dependencies=OFFLINE_PROTECTOR)
+async def list_delays() -> Dict[str, List[Dict[str, Any]]]:
+    """Lists the delayed commands ordered by their execution time.
+
+    Returns:
+        dict:
+        Returns the list of delayed commands as a dictionary.
+    """
+    return {"delays": store.delays.entries()}
+
+
+@app.delete(path='/delays/{identifier}', dependencies=OFFLINE_PROTECTOR)
+async def cancel_delay(identifier: int) -> NoReturn:
+    """Cancels a delayed command.
+
+    Args:
+        identifier: ID of the delayed command.
+
+    Raises:
+        - 200: If the delayed command was cancelled.
+        - 404: If there is no delayed command with the given ID.
+    """
+    if store.delays.remove(identifier=identifier):
+        raise APIResponse(status_code=HTTPStatus.OK.real, detail=f"Delayed command {identifier} has been cancelled.")
+    raise APIResponse(status_code=HTTPStatus.NOT_FOUND.real, detail=f"Delayed command {identifier} was not found.")
+
+
+@app.post(path='/usage', dependencies=OFFLINE_PROTECTOR)
+async def usage_counts() -> Dict[str, int]:
+    """Returns the number of times each function responded through the speaker.
+
+    Returns:
+        dict:
+        Function names and their counts, ordered from the most to the least used.
+    """
+    return usage.counter.counts()
+
+
+@app.post(path='/database-metrics', dependencies=OFFLINE_PROTECTOR)
+async def database_metrics() -> Dict[str, Dict[str, Union[int, float]]]:
+    """Returns the latency of the statements executed by the API.
+
+    Returns:
+        dict:
+        Number of executions, average and maximum latency in milliseconds for each statement.
+    """
+    return database.metrics()
+
+
+@app.post(path='/speech-synthesis', response_class=Response, dependencies=OFFLINE_PROTECTOR)
+async def speech_synthesis(input_data: GetText, raise_for_status: bool = True) -> Union[Response, None]:
     """Process request to convert text to speech if docker container is running.
 
     Args:
@@ -169,13 +272,15 @@ async def speech_synthesis(input_data: GetText, raise_for_status: bool = True) -
             - voice: Voice model ot be used.
 
     Returns:
-        FileResponse:
+        Response:
         Audio file to be downloaded.
 
     Raises:
-        - 404: If audio file was not found after successful response.
         - 500: If the connection to speech synthesizer fails.
         - 204: If speech synthesis file wasn't found.
+
+    See Also:
+        - Synthesis runs in the offline worker pool, and the audio is returned from memory for each request.
     """
     if not (text := input_data.text.strip()):
         logger.error('Empty requests cannot be processed.')
@@ -183,21 +288,24 @@ async def speech_synthesis(input_data: GetText, raise_for_status: bool = True) -
             raise APIResponse(status_code=HTTPStatus.NO_CONTENT.real, detail=HTTPStatus.NO_CONTENT.__dict__['phrase'])
         else:
             return
-    if not speaker.speech_synthesizer(text=text, timeout=input_data.timeout or len(text), quality=input_data.quality,
-                                      voice=input_data.voice):
+    logger.info(f"Request for speech synthesis: {text}")
+    try:
+        content = await offline_pool.submit(speaker.synthesize, timing=workers.Timing(),
+                                            text=speaker.normalize(text=text), timeout=input_data.timeout or len(text),
+                                            quality=input_data.quality, voice=input_data.voice)
+    except APIResponse:
+        if raise_for_status:
+            raise
+        return
+    if not content:
         logger.error("Speech synthesis could not process the request.")
         if raise_for_status:
             raise APIResponse(status_code=HTTPStatus.INTERNAL_SERVER_ERROR.real,
                               detail=HTTPStatus.INTERNAL_SERVER_ERROR.__dict__['phrase'])
         else:
             return
-    if os.path.isfile(path=models.fileio.speech_synthesis_wav):
-        Thread(target=remove_file, kwargs={'delay': 2, 'filepath': models.fileio.speech_synthesis_wav}).start()
-        return FileResponse(path=models.fileio.speech_synthesis_wav, media_type='application/octet-stream',
-                            filename="synthesized.wav", status_code=HTTPStatus.OK.real)
-    logger.error(f'File Not Found: {models.fileio.speech_synthesis_wav}')
-    if raise_for_status:
-        raise APIResponse(status_code=HTTPStatus.NOT_FOUND.real, detail=HTTPStatus.NOT_FOUND.__dict__['phrase'])
+    return Response(content=content, media_type='application/octet-stream', status_code=HTTPStatus.OK.real,
+                    headers={'Content-Disposition': 'attachment; filename="synthesized.wav"'})
 
 
 @app.get(path="/health", include_in_schema=False)
@@ -206,38 +314,21 @@ async def health() -> NoReturn:
     raise APIResponse(status_code=HTTPStatus.OK, detail=HTTPStatus.OK.__dict__['phrase'])
 
 
-@app.post(path="/offline-communicator", dependencies=OFFLINE_PROTECTOR)
-async def offline_communicator_api(request: Request, input_data: GetData) -> Union[FileResponse, NoReturn]:
-    """Offline Communicator API endpoint for Jarvis.
+def offline_executor(command: str, native_audio: bool) -> Tuple[str, Union[bytes, None]]:
+    """Executes an offline command in a worker thread.
 
     Args:
-        - request: Takes the ``Request`` class as an argument.
-        - input_data: Takes the following arguments as ``GetData`` class instead of a QueryString.
-
-            - command: The task which Jarvis has to do.
+        command: The task which Jarvis has to do.
+        native_audio: Boolean flag to convert the response into an audio file.
 
     Raises:
-        - 200: A dictionary with the command requested and the response for it from Jarvis.
-        - 204: If empty command was received.
+        - 200: For multiple commands and delayed commands.
         - 422: If the request is not part of offline compatible words.
 
-    See Also:
-        - Keeps waiting for the record ``response`` in the database table ``offline``
+    Returns:
+        tuple:
+        Returns the response from Jarvis and the wav content of the response if requested.
     """
-    logger.info(f"Connection received from {request.client.host} via {request.headers.get('host')} using "
-                f"{request.headers.get('user-agent')}")
-    if not (command := input_data.command.strip()):
-        raise APIResponse(status_code=HTTPStatus.NO_CONTENT.real, detail=HTTPStatus.NO_CONTENT.__dict__['phrase'])
-
-    logger.info(f"Request: {command}")
-    if 'alarm' in command.lower() or 'remind' in command.lower():
-        command = command.lower()
-    else:
-        command = command.translate(str.maketrans('', '', string.punctuation))  # Remove punctuations from string
-    if command.lower() == 'test':
-        logger.info("Test message received.")
-        raise APIResponse(status_code=HTTPStatus.OK.real, detail="Test message received.")
-
     if ' and ' in command and not word_match(phrase=command, match_list=keywords.avoid):
         and_response = ""
         for each in command.split(' and '):
@@ -273,18 +364,66 @@ async def offline_communicator_api(request: Request, input_data: GetData) -> Uni
                                      f'{models.env.title}!')
     response = offline_communicator(command=command)
     logger.info(f"Response: {response}")
-    if input_data.native_audio:
-        native_audio_wav = tts_stt.text_to_audio(text=response)
-        logger.info(f"Storing response as {native_audio_wav} in native audio.")
-        Thread(target=remove_file, kwargs={'delay': 2, 'filepath': native_audio_wav}).start()
-        return FileResponse(path=native_audio_wav, media_type='application/octet-stream',
-                            filename="synthesized.wav", status_code=HTTPStatus.OK.real)
+    if native_audio:
+        return response, tts_stt.text_to_audio(text=response)
+    return response, None
+
+
+@app.post(path="/offline-communicator", dependencies=OFFLINE_PROTECTOR)
+async def offline_communicator_api(request: Request, input_data: GetData) -> Union[Response, NoReturn]:
+    """Offline Communicator API endpoint for Jarvis.
+
+    Args:
+        - request: Takes the ``Request`` class as an argument.
+        - input_data: Takes the following arguments as ``GetData`` class instead of a QueryString.
+
+            - command: The task which Jarvis has to do.
+
+    Raises:
+        - 200: A dictionary with the command requested and the response for it from Jarvis.
+        - 204: If empty command was received.
+        - 422: If the request is not part of offline compatible words.
+        - 429: If all the workers are busy and the queue is full.
+        - 503: If the request was not picked up by a worker within the queue timeout.
+
+    See Also:
+        - Commands are executed in a bounded worker pool, so that the event loop is never blocked.
+        - Queue wait and execution time are returned in the ``Server-Timing`` header.
+    """
+    logger.info(f"Connection received from {request.client.host} via {request.headers.get('host')} using "
+                f"{request.headers.get('user-agent')}")
+    if not (command := input_data.command.strip()):
+        raise APIResponse(status_code=HTTPStatus.NO_CONTENT.real, detail=HTTPStatus.NO_CONTENT.__dict__['phrase'])
+
+    logger.info(f"Request: {command}")
+    if 'alarm' in command.lower() or 'remind' in command.lower():
+        command = command.lower()
+    else:
+        command = command.translate(str.maketrans('', '', string.punctuation))  # Remove punctuations from string
+    if command.lower() == 'test':
+        logger.info("Test message received.")
+        raise APIResponse(status_code=HTTPStatus.OK.real, detail="Test message received.")
+
+    timing = workers.Timing()
+    try:
+        response, native_audio = await offline_pool.submit(offline_executor, timing=timing, command=command,
+                                                           native_audio=input_data.native_audio)
+    except APIResponse as error:
+        error.headers = {**(error.headers or {}), **timing.headers}
+        raise
+    finally:
+        logger.info(f"Queue wait: {timing.queue_wait}ms, Execution: {timing.execution}ms")
+    if native_audio:
+        logger.info(f"Sending response as {len(native_audio)} bytes of native audio.")
+        return Response(content=native_audio, media_type='application/octet-stream', status_code=HTTPStatus.OK.real,
+                        headers={**timing.headers, 'Content-Disposition': 'attachment; filename="synthesized.wav"'})
     if input_data.speech_timeout:
-        logger.info(f"Storing response as {models.fileio.speech_synthesis_wav}")
+        logger.info("Sending response as synthesized audio.")
         if binary := await speech_synthesis(input_data=GetText(text=response, timeout=input_data.speech_timeout,
                                                                quality="low"), raise_for_status=False):
+            binary.headers.update(timing.headers)
             return binary
-    raise APIResponse(status_code=HTTPStatus.OK.real, detail=response)
+    raise APIResponse(status_code=HTTPStatus.OK.real, detail=response, headers=timing.headers)
 
 
 @app.get(path="/favicon.ico", include_in_schema=False)
@@ -0,0 +1,156 @@
+# noinspection PyUnresolvedReferences
+"""Module for a bounded worker pool that runs blocking commands away from the event loop.
+
+>>> Workers
+
+"""
+
+import asyncio
+import contextvars
+import math
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from http import HTTPStatus
+from threading import Lock
+from typing import Any, Callable, Dict, Union
+
+from modules.exceptions import APIResponse
+
+
+class Timing:
+    """Holds the time a request spent waiting in the queue and executing in a worker.
+
+    >>> Timing
+
+    """
+
+    def __init__(self):
+        """Instantiates the timing object with the time of submission."""
+        self.submitted = time.perf_counter()
+        self.started: Union[float, None] = None
+        self.finished: Union[float, None] = None
+
+    @property
+    def queue_wait(self) -> float:
+        """Milliseconds spent in the queue before a worker picked up the request."""
+        return round(((self.started or time.perf_counter()) - self.submitted) * 1_000, 2)
+
+    @property
+    def execution(self) -> float:
+        """Milliseconds spent executing the request in a worker."""
+        if not self.started:
+            return 0.0
+        return round(((self.finished or time.perf_counter()) - self.started) * 1_000, 2)
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Timings as a ``Server-Timing`` header.
+
+        Returns:
+            dict:
+            Header name and its value.
+        """
+        return {"Server-Timing": f"queue;dur={self.queue_wait}, exec;dur={self.execution}"}
+
+
+class WorkerPool:
+    """Runs blocking functions in a fixed number of threads, and rejects requests once the queue is full.
+
+    >>> WorkerPool
+
+    See Also:
+        - Requests beyond ``workers + queue_depth`` are rejected right away with a ``429``.
+        - Requests that are not picked up by a worker within ``queue_timeout`` are dropped with a ``503``.
+        - ``Retry-After`` is estimated from the average execution time and the number of pending requests.
+        - Every function runs in a copy of the caller's context, so context variables never leak between requests.
+    """
+
+    def __init__(self, workers: int, queue_depth: int, queue_timeout: Union[int, float]):
+        """Instantiates the thread pool.
+
+        Args:
+            workers: Number of requests to be executed concurrently.
+            queue_depth: Number of requests that can wait for a worker.
+            queue_timeout: Seconds a request can wait for a worker before it is dropped.
+        """
+        self.workers = workers
+        self.queue_depth = queue_depth
+        self.queue_timeout = queue_timeout
+        self.pending = 0
+        self.average = 1.0
+        self._lock = Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="OfflineWorker")
+
+    def retry_after(self) -> Dict[str, str]:
+        """Estimates the number of seconds after which the pool is likely to have a free slot.
+
+        Returns:
+            dict:
+            ``Retry-After`` header and its value.
+        """
+        return {"Retry-After": str(max(math.ceil(self.average * self.pending / self.workers), 1))}
+
+    def _release(self, future: Future) -> None:
+        """Frees up a slot once a request is complete or cancelled.
+
+        Args:
+            future: Future object of the request.
+        """
+        with self._lock:
+            self.pending -= 1
+
+    def _execute(self, timing: Timing, func: Callable, kwargs: Dict[str, Any]) -> Any:
+        """Executes the function in a worker thread while recording the timings.
+
+        Args:
+            timing: Timing object of the request.
+            func: Function to be executed.
+            kwargs: Keyword arguments for the function.
+
+        Returns:
+            Any:
+            Returns whatever the function returns.
+        """
+        timing.started = time.perf_counter()
+        try:
+            return func(**kwargs)
+        finally:
+            timing.finished = time.perf_counter()
+            with self._lock:
+                # Exponential moving average of the execution time in seconds
+                self.average = 0.8 * self.average + 0.2 * (timing.finished - timing.started)
+
+    async def submit(self, func: Callable, timing: Timing, **kwargs) -> Any:
+        """Submits a function to the pool and waits for its result without blocking the event loop.
+
+        Args:
+            func: Blocking function to be executed.
+            timing: Timing object that gets updated with the queue wait and execution time.
+            **kwargs: Keyword arguments for the function.
+
+        Raises:
+            - 429: If the pool and its queue are full.
+            - 503: If the request was not picked up by a worker within the queue timeout.
+
+        Returns:
+            Any:
+            Returns whatever the function returns.
+        """
+        with self._lock:
+            if self.pending >= self.workers + self.queue_depth:
+                raise APIResponse(status_code=HTTPStatus.TOO_MANY_REQUESTS.real,
+                                  detail=HTTPStatus.TOO_MANY_REQUESTS.__dict__['phrase'], headers=self.retry_after())
+            self.pending += 1
+        context = contextvars.copy_context()
+        future = self._executor.submit(context.run, self._execute, timing, func, kwargs)
+        future.add_done_callback(self._release)
+        wrapped = asyncio.wrap_future(future)
+        done, _ = await asyncio.wait({wrapped}, timeout=self.queue_timeout)
+        if not done and timing.started is None and future.cancel():
+            raise APIResponse(status_code=HTTPStatus.SERVICE_UNAVAILABLE.real,
+                              detail=HTTPStatus.SERVICE_UNAVAILABLE.__dict__['phrase'], headers=self.retry_after())
+        return await wrapped
+
+    def shutdown(self) -> None:
+        """Stops accepting requests and lets the ones that are already submitted finish in the background."""
+        self._executor.shutdown(wait=False)
@@ -1,23 +1,25 @@
 import os
-import pathlib
 import random
 import subprocess
 import time
 from datetime import datetime, timedelta
-from typing import NoReturn
+from multiprocessing import Process
+from typing import Any, Dict, NoReturn, Union
 
 from executors.logger import logger
 from executors.volume import volume
 from executors.word_match import word_match
 from modules.audio import listener, speaker
 from modules.conditions import conversation
+from modules.control import channel
 from modules.models import models
+from modules.scheduler import store
 from modules.utils import shared, support
 
 
 def create_alarm(hour: str, minute: str, am_pm: str, phrase: str, timer: str = None,
                  repeat: bool = False, day: str = None) -> NoReturn:
-    """Creates the lock file necessary to set an alarm/timer.
+    """Stores the alarm/timer in the alarm store.
 
     Args:
         hour: Hour of alarm time.
@@ -28,14 +30,19 @@ def create_alarm(hour: str, minute: str, am_pm: str, phrase: str, timer: str = N
         repeat: Boolean flag if the alarm should be repeated every day.
         day: Day of week when the alarm should be repeated.
     """
-    if not os.path.isdir('alarm'):
-        os.mkdir('alarm')
+    try:
+        clock = datetime.strptime(f"{hour} {minute} {am_pm}", "%I %M %p").strftime("%H:%M")
+    except ValueError as error:
+        logger.error(error)
+        speaker.speak(text=f"I'm sorry {models.env.title}! "
+                           f"I wasn't able to understand the time {hour}:{minute} {am_pm}")
+        return
     if repeat:
-        pathlib.Path(f'alarm/{hour}_{minute}_{am_pm}_repeat.lock').touch()
+        store.alarms.add(clock=clock, days=store.EVERYDAY)
     elif day:
-        pathlib.Path(f'alarm/{day}_{hour}_{minute}_{am_pm}_repeat.lock').touch()
+        store.alarms.add(clock=clock, days=[store.WEEKDAYS.index(day)])
     else:
-        pathlib.Path(f'alarm/{hour}_{minute}_{am_pm}.lock').touch()
+        store.alarms.add(clock=clock)
     if 'wake' in phrase:
         speaker.speak(text=f"{random.choice(conversation.acknowledgement)}! "
                            f"I will wake you up at {hour}:{minute} {am_pm}.")
@@ -101,7 +108,7 @@ def set_alarm(phrase: str) -> None:
                                f"I don't think a time like that exists on Earth.")
     else:
         speaker.speak(text=f"Please tell me a time {models.env.title}!")
-        if shared.called_by_offline:
+        if shared.called_by_offline.get():
             return
         speaker.speak(run=True)
         if converted := listener.listen(timeout=3, phrase_limit=4):
@@ -111,22 +118,39 @@ def set_alarm(phrase: str) -> None:
                 set_alarm(converted)
 
 
+def describe(entry: Dict[str, Any]) -> str:
+    """Describes an alarm in words.
+
+    Args:
+        entry: Alarm from the alarm store.
+
+    Returns:
+        str:
+        Time of the alarm along with the days on which it repeats.
+    """
+    when = entry["fire_at"].strftime("%I:%M %p")
+    if len(entry["days"]) == 7:
+        return f"{when} every day"
+    if entry["days"]:
+        return f"{when} every {' and '.join(store.WEEKDAYS[day] for day in entry['days'])}"
+    return when
+
+
 def kill_alarm(phrase: str) -> None:
-    """Removes lock file to stop the alarm which rings only when the certain lock file is present.
+    """Removes the alarm from the alarm store.
 
     Args:
         phrase: Takes the voice recognized statement as argument and extracts time from it.
     """
     word = 'timer' if 'timer' in phrase else 'alarm'
-    alarm_state = support.lock_files(alarm_files=True)
+    alarm_state = store.alarms.entries()
     if not alarm_state:
         speaker.speak(text=f"You have no {word}s set {models.env.title}!")
     elif len(alarm_state) == 1:
-        hour, minute, am_pm = alarm_state[0][0:2], alarm_state[0][3:5], alarm_state[0][6:8]
-        os.remove(f"alarm/{alarm_state[0]}")
-        speaker.speak(text=f"Your {word} at {hour}:{minute} {am_pm} has been silenced {models.env.title}!")
+        store.alarms.remove(identifier=alarm_state[0]["id"])
+        speaker.speak(text=f"Your {word} at {describe(entry=alarm_state[0])} has been silenced {models.env.title}!")
     else:
-        speaker.speak(text=f"Your {word}s are at {', and '.join(alarm_state).replace('.lock', '')}. "
+        speaker.speak(text=f"Your {word}s are at {', and '.join(describe(entry=entry) for entry in alarm_state)}. "
                            f"Please let me know which {word} you want to remove.", run=True)
         if not (converted := listener.listen(timeout=3, phrase_limit=4)):
             return
@@ -140,8 +164,13 @@ def kill_alarm(phrase: str) -> None:
             minute = 0
         hour, minute = f"{hour:02}", f"{minute:02}"
         am_pm = str(am_pm).replace('a.m.', 'AM').replace('p.m.', 'PM')
-        if os.path.exists(f'alarm/{hour}_{minute}_{am_pm}.lock'):
-            os.remove(f"alarm/{hour}_{minute}_{am_pm}.lock")
+        try:
+            clock = datetime.strptime(f"{hour} {minute} {am_pm}", "%I %M %p").strftime("%H:%M")
+        except ValueError:
+            clock = None
+        if matched := [entry for entry in alarm_state if entry["clock"] == clock]:
+            for entry in matched:
+                store.alarms.remove(identifier=entry["id"])
             speaker.speak(text=f"Your {word} at {hour}:{minute} {am_pm} has been silenced {models.env.title}!")
         else:
             speaker.speak(text=f"I wasn't able to find your {word} at {hour}:{minute} {am_pm}. Try again.")
@@ -156,3 +185,31 @@ def alarm_executor() -> NoReturn:
         os.system(f'start wmplayer {models.indicators.alarm}')
     time.sleep(200)
     volume(level=models.env.volume)
+
+
+def alarm_due(now: datetime) -> Union[datetime, None]:
+    """Gets the next time when an alarm has to ring.
+
+    Args:
+        now: Current datetime.
+
+    Returns:
+        datetime:
+        Datetime of the earliest alarm, ``None`` if there are no alarms.
+    """
+    return store.alarms.upcoming()
+
+
+def alarm_checker(now: datetime) -> NoReturn:
+    """Rings the alarms that are due, the repeated alarms are moved to their next occurrence by the store.
+
+    Args:
+        now: Current datetime.
+
+    See Also:
+        - The alarm is also announced by the main process as an alert, which interrupts any other speech.
+    """
+    if due := store.alarms.pop_due(now=now):
+        Process(target=alarm_executor).start()
+        channel.announce(text=f"It's {due[0]['fire_at'].strftime('%I:%M %p')} {models.env.title}! "
+                              "Your alarm is ringing.", caller="alarm")
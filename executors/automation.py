@@ -1,8 +1,8 @@
 import os
 import warnings
-from datetime import datetime
+from datetime import datetime, timedelta
 from string import punctuation
-from typing import Union
+from typing import Dict, List, NoReturn, Tuple, Union
 
 import yaml
 from deepdiff import DeepDiff
@@ -11,6 +11,9 @@ from executors.logger import logger
 from executors.word_match import word_match
 from modules.audio import speaker
 from modules.models import models
+from modules.scheduler import scheduler
+
+WEEKDAYS = ["MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY", "SATURDAY", "SUNDAY"]
 
 
 def automation_handler(phrase: str) -> None:
@@ -37,94 +40,189 @@ def automation_handler(phrase: str) -> None:
             speaker.speak(text=f"I couldn't not find the source file to disable automation {models.env.title}!")
 
 
-def rewrite_automator(write_data: dict) -> None:
+def rewrite_automator(write_data: dict, filepath: str = models.fileio.automation) -> None:
     """Rewrites the automation file with the updated dictionary.
 
     Args:
         write_data: Takes the new dictionary as an argument.
+        filepath: Path of the automation file.
     """
     logger.info("Data has been modified. Rewriting automation data into YAML file.")
-    with open(models.fileio.automation) as file:
+    with open(filepath) as file:
         try:
             read_data = yaml.load(stream=file, Loader=yaml.FullLoader) or {}
         except yaml.YAMLError as error:
             logger.error(error)
             read_data = {}
     logger.info(DeepDiff(read_data, write_data, ignore_order=True))
-    with open(models.fileio.automation, 'w') as file:
+    with open(filepath, 'w') as file:
         yaml.dump(data=write_data, stream=file, indent=2, sort_keys=False)
 
 
-def auto_helper(offline_list: list) -> Union[str, None]:
-    """Runs in a thread to help the automator function in the main module.
+def automation_days(day: Union[str, List[str], None]) -> Union[List[int], None]:
+    """Converts the ``day`` value of an automation entry into a list of weekdays.
 
     Args:
-        offline_list: List of offline compatible keywords.
+        day: Day value from the automation file. Can be a day name, ``weekday``, ``weekend`` or a list of day names.
 
     Returns:
-        str:
-        Task to be executed.
+        list:
+        List of weekdays (Monday is 0) on which the automation should run, ``None`` if it should run every day.
     """
-    try:
-        with open(models.fileio.automation) as read_file:
-            automation_data = yaml.load(stream=read_file, Loader=yaml.FullLoader) or {}
-    except yaml.YAMLError as error:
-        logger.error(error)
-        warnings.warn(
-            "AUTOMATION FILE :: Invalid file format."
-        )
-        logger.error(f"Invalid file format. "
-                     f"Logging automation data and removing the file to avoid endless errors.\n"
-                     f"{''.join(['*' for _ in range(120)])}"
-                     f"\n\n{read_file.read()}\n\n"
-                     f"{''.join(['*' for _ in range(120)])}")
-        os.remove(models.fileio.automation)
+    if not day:
         return
+    if isinstance(day, list):
+        return [WEEKDAYS.index(d.upper()) for d in day if d.upper() in WEEKDAYS]
+    day = day.upper()
+    if day == "WEEKEND":
+        return [5, 6]
+    if day == "WEEKDAY":
+        return [0, 1, 2, 3, 4]
+    return [WEEKDAYS.index(day)] if day in WEEKDAYS else []
+
+
+def parse_automation(automation_data: dict, offline_list: list) -> Tuple[Dict[str, dict], List[str]]:
+    """Validates the automation data and converts each entry into its fire time, task and days.
+
+    Args:
+        automation_data: Data loaded from the automation file.
+        offline_list: List of offline compatible keywords.
 
+    Returns:
+        tuple:
+        Returns the valid entries indexed by their time, and the list of invalid entries.
+    """
+    entries, invalid = {}, []
     for automation_time, automation_info in automation_data.items():
-        if not (exec_task := automation_info.get("task")) or \
+        if not isinstance(automation_info, dict) or not (exec_task := automation_info.get("task")) or \
                 not word_match(phrase=exec_task, match_list=offline_list):
             logger.error("Following entry doesn't have a task or the task is not a part of offline compatible.")
             logger.error(f"{automation_time} - {automation_info}")
-            automation_data.pop(automation_time)
-            rewrite_automator(write_data=automation_data)
-            break  # Using break instead of continue as python doesn't like dict size change in-between a loop
+            invalid.append(automation_time)
+            continue
         try:
-            datetime.strptime(automation_time, "%I:%M %p")
-        except ValueError:
+            fire_time = datetime.strptime(automation_time, "%I:%M %p")
+        except (TypeError, ValueError):
             logger.error(f"Incorrect Datetime format: {automation_time}. "
                          "Datetime string should be in the format: 6:00 AM. "
                          f"Removing the key-value from {models.fileio.automation}")
-            automation_data.pop(automation_time)
-            rewrite_automator(write_data=automation_data)
-            break  # Using break instead of continue as python doesn't like dict size change in-between a loop
-
-        if day := automation_info.get("day"):
-            today = datetime.today().strftime("%A").upper()
-            if isinstance(day, list):
-                if today not in [d.upper() for d in day]:
-                    continue
-            elif isinstance(day, str):
-                day = day.upper()
-                if day == "WEEKEND" and today in ["SATURDAY", "SUNDAY"]:
-                    pass
-                elif day == "WEEKDAY" and today in ["MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY"]:
-                    pass
-                elif today == day:
-                    pass
-                else:
-                    continue
-
-        if automation_time != datetime.now().strftime("%I:%M %p"):
-            if automation_info.get("status"):
-                logger.info(f"Reverting execution status flag for task: {exec_task} runs at {automation_time}")
-                del automation_data[automation_time]["status"]
-                rewrite_automator(write_data=automation_data)
+            invalid.append(automation_time)
             continue
+        entries[automation_time] = {
+            "hour": fire_time.hour,
+            "minute": fire_time.minute,
+            "task": exec_task.translate(str.maketrans("", "", punctuation)),  # Remove punctuations from the str
+            "days": automation_days(day=automation_info.get("day"))
+        }
+    return entries, invalid
 
-        if automation_info.get("status"):
-            continue
-        exec_task = exec_task.translate(str.maketrans("", "", punctuation))  # Remove punctuations from the str
-        automation_data[automation_time]["status"] = True
-        rewrite_automator(write_data=automation_data)
-        return exec_task
+
+class Schedule:
+    """Holds the automation file as an in-memory schedule, and reloads it only when the file changes.
+
+    >>> Schedule
+
+    See Also:
+        - The file is parsed only when its modified time, inode or size changes.
+        - Invalid entries are removed from the file once, when it is loaded.
+        - Execution state is held in memory, so the file is never re-written to flag the tasks that have run.
+    """
+
+    def __init__(self, filepath: str, offline_list: list):
+        """Instantiates the schedule without loading the file.
+
+        Args:
+            filepath: Path of the automation file.
+            offline_list: List of offline compatible keywords.
+        """
+        self.filepath = filepath
+        self.offline_list = offline_list
+        self.signature = None
+        self.entries: Dict[str, dict] = {}
+        self.by_time: Dict[Tuple[int, int], List[str]] = {}
+        self.executed: Dict[str, datetime] = {}
+
+    def reload(self) -> NoReturn:
+        """Loads the automation file if it has changed since it was last loaded."""
+        try:
+            stat = os.stat(self.filepath)
+            signature = stat.st_mtime_ns, stat.st_ino, stat.st_size
+        except OSError:
+            signature = None
+        if signature == self.signature:
+            return
+        self.signature = signature
+        self.entries, self.by_time = {}, {}
+        if not signature:
+            return
+        logger.info(f"Loading automation schedule from {self.filepath}")
+        try:
+            with open(self.filepath) as read_file:
+                automation_data = yaml.load(stream=read_file, Loader=yaml.FullLoader) or {}
+        except yaml.YAMLError as error:
+            logger.error(error)
+            warnings.warn(
+                "AUTOMATION FILE :: Invalid file format."
+            )
+            with open(self.filepath) as read_file:
+                logger.error(f"Invalid file format. "
+                             f"Logging automation data and removing the file to avoid endless errors.\n"
+                             f"{''.join(['*' for _ in range(120)])}"
+                             f"\n\n{read_file.read()}\n\n"
+                             f"{''.join(['*' for _ in range(120)])}")
+            os.remove(self.filepath)
+            self.signature = None
+            return
+        self.entries, invalid = parse_automation(automation_data=automation_data, offline_list=self.offline_list)
+        if invalid:
+            rewrite_automator(write_data={k: v for k, v in automation_data.items() if k not in invalid},
+                              filepath=self.filepath)
+            stat = os.stat(self.filepath)
+            self.signature = stat.st_mtime_ns, stat.st_ino, stat.st_size
+        for automation_time, entry in self.entries.items():
+            self.by_time.setdefault((entry["hour"], entry["minute"]), []).append(automation_time)
+        self.executed = {key: value for key, value in self.executed.items() if key in self.entries}
+
+    def next_run(self, now: datetime) -> Union[datetime, None]:
+        """Computes the next time when an automation task is due.
+
+        Args:
+            now: Current datetime.
+
+        Returns:
+            datetime:
+            Datetime when the next task is due, ``None`` if there is nothing to automate.
+        """
+        self.reload()
+        upcoming = []
+        current = scheduler.minute_start(now)
+        for automation_time, entry in self.entries.items():
+            if entry["days"] == []:
+                continue  # None of the days are valid
+            after = current + timedelta(minutes=1) if self.executed.get(automation_time) == current else now
+            upcoming.append(scheduler.next_occurrence(clock=automation_time, fmt="%I:%M %p", now=after,
+                                                      days=entry["days"]))
+        return min(upcoming) if upcoming else None
+
+    def pending(self, now: datetime) -> List[str]:
+        """Gets the tasks that are due at the current minute and marks them as executed.
+
+        Args:
+            now: Current datetime.
+
+        Returns:
+            list:
+            List of tasks to be executed.
+        """
+        self.reload()
+        current = scheduler.minute_start(now)
+        tasks = []
+        for automation_time in self.by_time.get((now.hour, now.minute), []):
+            entry = self.entries[automation_time]
+            if entry["days"] is not None and now.weekday() not in entry["days"]:
+                continue
+            if self.executed.get(automation_time) == current:
+                continue
+            self.executed[automation_time] = current
+            tasks.append(entry["task"])
+        return tasks
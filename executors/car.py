@@ -1,16 +1,15 @@
 import json
 import urllib.error
 import urllib.request
-from threading import Thread
 from typing import Tuple, Union
 
+import requests
 import yaml
-from playsound import playsound
 
 from executors.location import get_location_from_coordinates
 from executors.logger import logger
-from modules.audio import speaker
-from modules.car import connector, controller
+from modules.audio import sounds, speaker
+from modules.car import controller, session
 from modules.models import models
 from modules.temperature import temperature
 from modules.utils import shared, support
@@ -56,8 +55,8 @@ def car(phrase: str) -> None:
     disconnected = f"I wasn't able to connect your car {models.env.title}! Please check the logs for more information."
 
     if "start" in phrase or "set" in phrase or "turn on" in phrase:
-        if not shared.called_by_offline:
-            playsound(sound=models.indicators.exhaust, block=False)
+        if not shared.called_by_offline.get():
+            sounds.play(sound=models.indicators.exhaust, block=False)
         extras = ""
         if target_temp := support.extract_nos(input_=phrase, method=int):
             if target_temp < 57:
@@ -89,50 +88,65 @@ def car(phrase: str) -> None:
         else:
             speaker.speak(text=disconnected)
     elif "turn off" in phrase or "stop" in phrase:
-        if not shared.called_by_offline:
-            playsound(sound=models.indicators.exhaust, block=False)
+        if not shared.called_by_offline.get():
+            sounds.play(sound=models.indicators.exhaust, block=False)
         if car_name := vehicle(operation="STOP"):
             speaker.speak(text=f"Your {car_name} has been turned off {models.env.title}!")
         else:
             speaker.speak(text=disconnected)
     elif "secure" in phrase or "guardian" in phrase or "security" in phrase:
-        if not shared.called_by_offline:
-            playsound(sound=models.indicators.exhaust, block=False)
+        if not shared.called_by_offline.get():
+            sounds.play(sound=models.indicators.exhaust, block=False)
         if car_name := vehicle(operation="SECURE"):
             speaker.speak(text=f"Guardian mode has been enabled {models.env.title}! Your {car_name} is now secure.")
         else:
             speaker.speak(text=disconnected)
     elif "unlock" in phrase:
-        if not shared.called_by_offline:
-            playsound(sound=models.indicators.exhaust, block=False)
+        if not shared.called_by_offline.get():
+            sounds.play(sound=models.indicators.exhaust, block=False)
         if car_name := vehicle(operation="UNLOCK"):
             speaker.speak(text=f"Your {car_name} has been unlocked {models.env.title}!")
         else:
             speaker.speak(text=disconnected)
     elif "lock" in phrase:
-        if not shared.called_by_offline:
-            playsound(sound=models.indicators.exhaust, block=False)
+        if not shared.called_by_offline.get():
+            sounds.play(sound=models.indicators.exhaust, block=False)
         if car_name := vehicle(operation="LOCK"):
             speaker.speak(text=f"Your {car_name} has been locked {models.env.title}!")
         else:
             speaker.speak(text=disconnected)
     elif "honk" in phrase or "blink" in phrase or "horn" in phrase:
-        if not shared.called_by_offline:
-            playsound(sound=models.indicators.exhaust, block=False)
+        if not shared.called_by_offline.get():
+            sounds.play(sound=models.indicators.exhaust, block=False)
         if car_name := vehicle(operation="HONK"):
             speaker.speak(text=f"I've made your {car_name} honk and blink {models.env.title}!")
         else:
             speaker.speak(text=disconnected)
     elif "locate" in phrase or "where" in phrase:
-        if not shared.called_by_offline:
-            playsound(sound=models.indicators.exhaust, block=False)
+        if not shared.called_by_offline.get():
+            sounds.play(sound=models.indicators.exhaust, block=False)
         if location := vehicle(operation="LOCATE"):
             speaker.speak(text=location)
         else:
             speaker.speak(text=disconnected)
     else:
         speaker.speak(text=f"I didn't quite get that {models.env.title}! What do you want me to do to your car?")
-        Thread(target=support.unrecognized_dumper, args=[{"CAR": phrase}]).start()
+        support.unrecognized_dumper(train_data={"CAR": phrase})
+
+
+def vehicle_brand(control: controller.Control) -> str:
+    """Gets the vehicle's brand from the session, requesting the vehicle attributes only the first time.
+
+    Args:
+        control: Control object of the primary vehicle.
+
+    Returns:
+        str:
+        Returns the vehicle's brand.
+    """
+    if not session.session.brand:
+        session.session.set_brand(brand=control.get_attributes().get("vehicleBrand", "car"))
+    return session.session.brand
 
 
 def vehicle(operation: str, temp: int = None) -> Union[str, dict, None]:
@@ -147,13 +161,10 @@ def vehicle(operation: str, temp: int = None) -> Union[str, dict, None]:
         Returns the vehicle's name.
     """
     try:
-        connection = connector.Connect(username=models.env.car_email, password=models.env.car_pass)
-        connection.connect()
-        if not connection.head:
+        connection, vin = session.session.get()
+        if not connection:
             return
-        vehicles = connection.get_vehicles(headers=connection.head).get("vehicles")
-        primary_vehicle = [each_vehicle for each_vehicle in vehicles if each_vehicle.get("role") == "Primary"][0]
-        control = controller.Control(vin=primary_vehicle.get("vin"), connection=connection)
+        control = controller.Control(vin=vin, connection=connection)
 
         response = {}
         if operation == "LOCK":
@@ -195,12 +206,14 @@ def vehicle(operation: str, temp: int = None) -> Union[str, dict, None]:
                 address = data['formattedAddress']
             else:
                 address = data
-            return f"Your {control.get_attributes().get('vehicleBrand', 'car')} is at {address}"
+            return f"Your {vehicle_brand(control=control)} is at {address}"
         if response.get("failureDescription"):
             logger.fatal(response)
             return
-        return control.get_attributes().get("vehicleBrand", "car")
-    except (urllib.error.HTTPError, urllib.error.URLError) as error:
+        return vehicle_brand(control=control)
+    except (urllib.error.HTTPError, urllib.error.URLError, requests.exceptions.RequestException) as error:
         logger.error(error.__dict__)
+        if getattr(error, "code", None) in (401, 403):
+            session.session.invalidate()  # forces a new login on the next command
         if hasattr(error, "url") and hasattr(error, "code"):
             logger.error(f"Failed to connect to {error.url} with error code: {error.code} while performing {operation}")
@@ -1,19 +1,18 @@
 import random
-import time
-from multiprocessing import Process
+from datetime import datetime, timedelta
 from threading import Thread
 from typing import Tuple, Union
 
 from executors.conditions import conditions
 from executors.controls import sleep_control
 from executors.logger import logger
-from executors.offline import offline_communicator
 from executors.others import time_travel
 from executors.word_match import word_match
 from modules.audio import listener, speaker
 from modules.conditions import conversation, keywords
 from modules.models import models
 from modules.offline import compatibles
+from modules.scheduler import store
 from modules.utils import shared, support
 
 offline_list = compatibles.offline_compatible()
@@ -72,24 +71,8 @@ def delay_calculator(phrase: str) -> Union[int, float]:
     return count * delay
 
 
-def delay_condition(phrase: str, delay: Union[int, float]) -> None:
-    """Delays the execution after sleeping for the said time, after which it is sent to ``offline_communicator``.
-
-    Args:
-        phrase: Takes the phrase spoken as an argument.
-        delay: Sleeps for the number of seconds.
-    """
-    logger.info(f"'{phrase}' will be executed after {support.time_converter(seconds=delay)}")
-    time.sleep(delay)
-    logger.info(f"Executing '{phrase}'")
-    try:
-        offline_communicator(command=phrase)
-    except Exception as error:
-        logger.error(error)
-
-
 def timed_delay(phrase: str) -> Tuple[str, Union[int, float]]:
-    """Checks pre-conditions if a delay is necessary.
+    """Checks pre-conditions if a delay is necessary, and stores the task to be executed by the automator.
 
     Args:
         phrase: Takes the phrase spoken as an argument.
@@ -104,7 +87,8 @@ def timed_delay(phrase: str) -> Tuple[str, Union[int, float]]:
         split_ = phrase.split('after')
         if task := split_[0].strip():
             delay = delay_calculator(phrase=split_[1].strip())
-            Process(target=delay_condition, kwargs={'phrase': task, 'delay': delay}).start()
+            store.delays.add_at(fire_at=datetime.now() + timedelta(seconds=delay), message=task)
+            logger.info(f"'{task}' will be executed after {support.time_converter(seconds=delay)}")
             return task, delay
 
 
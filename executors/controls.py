@@ -17,12 +17,12 @@ from executors.volume import volume
 from executors.word_match import word_match
 from modules.audio import listener, speaker, voices
 from modules.conditions import conversation, keywords
-from modules.database import database
+from modules.control import channel
 from modules.exceptions import StopSignal
 from modules.models import models
+from modules.scheduler import store
 from modules.utils import shared, support
 
-db = database.Database(database=models.fileio.base_db)
 ram = support.size_converter(byte_size=models.settings.ram).replace('.0', '')
 
 
@@ -60,23 +60,18 @@ def restart(ask: bool = True) -> NoReturn:
 
 def exit_process() -> NoReturn:
     """Function that holds the list of operations done upon exit."""
-    reminders = {}
-    alarms = support.lock_files(alarm_files=True)
-    if reminder_files := support.lock_files(reminder_files=True):
-        for file in reminder_files:
-            split_val = file.replace('.lock', '').split('|')
-            reminders.update({split_val[0]: split_val[-1]})
+    reminders = store.reminders.entries()
+    alarms = store.alarms.entries()
     if reminders:
-        logger.info(f'JARVIS::Deleting Reminders - {reminders}')
+        logger.info(f'JARVIS::Pending Reminders - {reminders}')
         if len(reminders) == 1:
             speaker.speak(text=f'You have a pending reminder {models.env.title}!')
         else:
             speaker.speak(text=f'You have {len(reminders)} pending reminders {models.env.title}!')
-        for key, value in reminders.items():
-            speaker.speak(text=f"{value.replace('_', ' ')} at {key.lstrip('0').replace('00', '').replace('_', ' ')}")
+        for each_reminder in reminders:
+            speaker.speak(text=f"{each_reminder['message']} at {each_reminder['fire_at'].strftime('%I:%M %p')}")
     if alarms:
-        alarms = ', and '.join(alarms) if len(alarms) != 1 else ''.join(alarms)
-        alarms = alarms.replace('.lock', '').replace('_', ':').replace(':PM', ' PM').replace(':AM', ' AM')
+        alarms = ', and '.join(each_alarm['fire_at'].strftime('%I:%M %p') for each_alarm in alarms)
         speaker.speak(text=f"You have a pending alarm at {alarms} {models.env.title}!")
     if reminders or alarms:
         speaker.speak(text="This will not be executed while I'm asleep!")
@@ -101,7 +96,7 @@ def sleep_control() -> bool:
     else:
         ctypes.windll.user32.LockWorkStation()
     if not (shared.called['report'] or shared.called['time_travel']):
-        speaker.speak(text=random.choice(conversation.acknowledgement))
+        speaker.speak(text=random.choice(conversation.acknowledgement), run=True)
     return True
 
 
@@ -118,10 +113,7 @@ def check_memory_leak() -> NoReturn:
                 percent = support.size_converter(byte_size=percent_raw).replace(' B', ' %')
                 ram_used = support.size_converter(byte_size=proc.memory_info().rss)
                 logger.info(f"{process.pid}: {ram_used}/{ram} :: {percent}")
-                with db.connection:
-                    cursor = db.connection.cursor()
-                    cursor.execute("INSERT or REPLACE INTO restart (flag, caller) VALUES (?,?);", (True, func))
-                    cursor.connection.commit()
+                channel.request_restart(caller=func)
         except psutil.NoSuchProcess:
             logger.warning(f"{func}[{process.pid}] is not running anymore.")
             return func
@@ -129,7 +121,7 @@ def check_memory_leak() -> NoReturn:
 
 def sentry() -> bool:
     """Speaks sentry mode message and sets greeting value to false."""
-    speaker.speak(text=f"Activating sentry mode, enjoy yourself {models.env.title}!")
+    speaker.speak(text=f"Activating sentry mode, enjoy yourself {models.env.title}!", run=True)
     if shared.greeting:
         shared.greeting = False
     return True
@@ -150,16 +142,13 @@ def restart_control(phrase: str = None, quiet: bool = False) -> NoReturn:
         logger.info(f'Called by {caller}')
         if quiet:  # restarted due internal errors
             logger.info(f"Restarting {caller}")
-        elif shared.called_by_offline:  # restarted via automator
+        elif shared.called_by_offline.get():  # restarted via automator
             logger.info("Restarting all background processes!")
             caller = "OFFLINE"
         else:
             speaker.speak(text="I didn't quite get that. Did you mean restart your computer?")
             return
-        with db.connection:
-            cursor = db.connection.cursor()
-            cursor.execute("INSERT or REPLACE INTO restart (flag, caller) VALUES (?,?);", (True, caller))
-            cursor.connection.commit()
+        channel.request_restart(caller=caller)
 
 
 def stop_terminals(apps: tuple = ("iterm", "terminal")) -> NoReturn:
@@ -180,7 +169,9 @@ def terminator() -> NoReturn:
     """Exits the process with specified status without calling cleanup handlers, flushing stdio buffers, etc.
 
     Using this, eliminates the hassle of forcing multiple threads to stop.
+    The queued speech is spoken first, since the speech queue's thread is stopped along with the process.
     """
+    speaker.speak(run=True)
     proc = psutil.Process(pid=models.settings.pid)
     logger.info(f"Terminating process: {models.settings.pid}")
     process_info = proc.as_dict()
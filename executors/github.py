@@ -48,7 +48,7 @@ def github(phrase: str) -> None:
         speaker.speak(
             text=f'You have {total} repositories {models.env.title}, out of which {forked} are forked, {private} are '
                  f'private, {licensed} are licensed, and {archived} archived.')
-    elif not shared.called_by_offline:
+    elif not shared.called_by_offline.get():
         [result.append(clone_url) if clone_url not in result and re.search(rf'\b{word}\b', repo.lower()) else None
          for word in phrase.lower().split() for item in repos for repo, clone_url in item.items()]
         if result:
@@ -152,7 +152,7 @@ def speed_test() -> None:
     download_process = Process(target=st.download, kwargs={"threads": threads_per_core})
     upload_process.start()
     download_process.start()
-    if not shared.called_by_offline:
+    if not shared.called_by_offline.get():
         speaker.speak(text=f"Starting speed test {models.env.title}! I.S.P: {isp}. Location: {city} {state}", run=True)
     upload_process.join()
     download_process.join()
@@ -2,7 +2,6 @@ import os
 import random
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from multiprocessing.pool import ThreadPool
-from threading import Thread
 from typing import Callable, NoReturn, Union
 
 import yaml
@@ -112,7 +111,7 @@ def lights(phrase: str) -> Union[None, NoReturn]:
                            "lights.")
         return
     if not host_names:
-        Thread(target=support.unrecognized_dumper, args=[{'LIGHTS': phrase}]).start()
+        support.unrecognized_dumper(train_data={'LIGHTS': phrase})
         speaker.speak(text=f"I'm not sure which lights you meant {models.env.title}!")
         return
 
@@ -170,7 +169,6 @@ def lights(phrase: str) -> Union[None, NoReturn]:
         avail_check(function_to_call=cool)
     elif 'turn off' in phrase:
         speaker.speak(text=f'{random.choice(conversation.acknowledgement)}! Turning off {len(host_ip)} {plural}')
-        Thread(target=thread_worker, args=[cool]).run()
         avail_check(function_to_call=turn_off)
     elif 'warm' in phrase or 'yellow' in phrase:
         if 'yellow' in phrase:
@@ -204,4 +202,4 @@ def lights(phrase: str) -> Union[None, NoReturn]:
     else:
         speaker.speak(text=f"I didn't quite get that {models.env.title}! What do you want me to do to your "
                            f"{light_location} {plural}?")
-        Thread(target=support.unrecognized_dumper, args=[{'LIGHTS': phrase}]).start()
+        support.unrecognized_dumper(train_data={'LIGHTS': phrase})
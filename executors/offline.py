@@ -1,19 +1,17 @@
 import os
-import time
 from datetime import datetime
 from multiprocessing import Process
-from threading import Thread
 from typing import AnyStr, List, NoReturn, Union
 
 import requests
 from pydantic import HttpUrl
 
-from executors.alarm import alarm_executor
-from executors.automation import auto_helper
+from executors.alarm import alarm_checker, alarm_due
+from executors.automation import Schedule
 from executors.conditions import conditions
 from executors.crontab import crontab_executor
 from executors.logger import logger
-from executors.remind import reminder_executor
+from executors.remind import reminder_checker, reminder_due
 from executors.word_match import word_match
 from modules.conditions import keywords
 from modules.crontab import expression
@@ -21,8 +19,9 @@ from modules.database import database
 from modules.meetings import events, icalendar
 from modules.models import models
 from modules.offline import compatibles
+from modules.scheduler import scheduler, store
 from modules.timer.executor import RepeatedTimer
-from modules.utils import shared, support
+from modules.utils import shared
 
 db = database.Database(database=models.fileio.base_db)
 offline_compatible = compatibles.offline_compatible()
@@ -59,85 +58,105 @@ def automator() -> NoReturn:
                 9:00 PM:
                   task: set my bedroom lights to 5%
 
-        - Jarvis creates/swaps a ``status`` flag upon execution, so that it doesn't repeat execution within a minute.
+        - Jarvis keeps track of the execution in memory, so that it doesn't repeat execution within a minute.
+        - Sleeps until the next automation, cron, alarm, reminder, delayed command or sync is due, or until the
+          automation file or the schedule store is modified.
     """
     offline_list = offline_compatible + keywords.restart_control
-    start_events = start_meetings = start_cron = time.time()
     events.event_app_launcher() if models.settings.macos else None
-    dry_run = True
-    while True:
-        if os.path.isfile(models.fileio.automation):
-            if exec_task := auto_helper(offline_list=offline_list):
-                try:
-                    offline_communicator(command=exec_task)
-                except Exception as error:
-                    logger.error(error)
-
-        if start_events + models.env.sync_events <= time.time() or dry_run:
-            start_events = time.time()
-            event_process = Process(target=events.events_writer)
-            logger.info(f"Getting calendar events from {models.env.event_app}") if dry_run else None
-            event_process.start()
-            with db.connection:
-                cursor = db.connection.cursor()
-                cursor.execute("UPDATE children SET events=null")
-                cursor.execute("INSERT or REPLACE INTO children (events) VALUES (?);", (event_process.pid,))
-                db.connection.commit()
-
-        if start_meetings + models.env.sync_meetings <= time.time() or dry_run:
-            if dry_run and models.env.ics_url:
-                try:
-                    if requests.get(url=models.env.ics_url).status_code == 503:
-                        models.env.sync_meetings = 21_600  # Set to 6 hours if unable to connect to the meetings URL
-                except (ConnectionError, TimeoutError, requests.exceptions.RequestException,
-                        requests.exceptions.Timeout) as error:
-                    logger.error(error)
-                    models.env.sync_meetings = 99_999_999  # NEVER RUNs, as env vars are loaded only during start up
-            start_meetings = time.time()
-            meeting_process = Process(target=icalendar.meetings_writer)
-            logger.info("Getting calendar schedule from ICS.") if dry_run else None
-            meeting_process.start()
-            with db.connection:
-                cursor = db.connection.cursor()
-                cursor.execute("UPDATE children SET meetings=null")
-                cursor.execute("INSERT or REPLACE INTO children (meetings) VALUES (?);", (meeting_process.pid,))
-                db.connection.commit()
-
-        if start_cron + 60 <= time.time():  # Condition passes every minute
-            start_cron = time.time()
-            for cron in models.env.crontab:
-                job = expression.CronExpression(line=cron)
-                if job.check_trigger(date_tuple=tuple(map(int, datetime.now().strftime("%Y,%m,%d,%H,%M").split(",")))):
-                    cron_process = Process(target=crontab_executor, args=(job.comment,))
-                    cron_process.start()
-                    with db.connection:
-                        cursor = db.connection.cursor()
-                        cursor.execute("INSERT or REPLACE INTO children (crontab) VALUES (?);", (cron_process.pid,))
-                        db.connection.commit()
-
-        if alarm_state := support.lock_files(alarm_files=True):
-            for each_alarm in alarm_state:
-                if each_alarm == datetime.now().strftime("%I_%M_%p.lock") or \
-                        each_alarm == datetime.now().strftime("%I_%M_%p_repeat.lock") or \
-                        each_alarm == datetime.now().strftime("%A_%I_%M_%p_repeat.lock"):
-                    Process(target=alarm_executor).start()
-                    if each_alarm.endswith("_repeat.lock"):
-                        os.rename(os.path.join("alarm", each_alarm), os.path.join("alarm", f"_{each_alarm}"))
-                    else:
-                        os.remove(os.path.join("alarm", each_alarm))
-                elif each_alarm.startswith('_') and not \
-                        (each_alarm == datetime.now().strftime("_%I_%M_%p_repeat.lock") or
-                         each_alarm == datetime.now().strftime("_%A_%I_%M_%p_repeat.lock")):
-                    os.rename(os.path.join("alarm", each_alarm), os.path.join("alarm", each_alarm.lstrip("_")))
-        if reminder_state := support.lock_files(reminder_files=True):
-            for each_reminder in reminder_state:
-                remind_time, remind_msg = each_reminder.split('|')
-                remind_msg = remind_msg.rstrip('.lock').replace('_', ' ')
-                if remind_time == datetime.now().strftime("%I_%M_%p"):
-                    Thread(target=reminder_executor, args=[remind_msg]).start()
-                    os.remove(os.path.join("reminder", each_reminder))
-
-        dry_run = False
+    if models.env.ics_url:
+        try:
+            if requests.get(url=models.env.ics_url).status_code == 503:
+                models.env.sync_meetings = 21_600  # Set to 6 hours if unable to connect to the meetings URL
+        except (ConnectionError, TimeoutError, requests.exceptions.RequestException,
+                requests.exceptions.Timeout) as error:
+            logger.error(error)
+            models.env.sync_meetings = 99_999_999  # NEVER RUNs, as env vars are loaded only during start up
+    logger.info(f"Getting calendar events from {models.env.event_app}")
+    logger.info("Getting calendar schedule from ICS.")
+    store.import_lock_files()
+    tasks = scheduler.Scheduler()
+    tasks.watch(models.fileio.automation, models.fileio.schedule_db, f"{models.fileio.schedule_db}-wal")
+    automation = Schedule(filepath=models.fileio.automation, offline_list=offline_list)
+    tasks.add_job(name="automation", due=automation.next_run,
+                  action=lambda now: automation_runner(automation=automation, now=now))
+    tasks.add_job(name="alarm", due=alarm_due, action=alarm_checker)
+    tasks.add_job(name="reminder", due=reminder_due, action=reminder_checker)
+    tasks.add_job(name="delay", due=lambda now: store.delays.upcoming(), action=delay_runner)
+    if models.env.crontab:  # Cron jobs are compiled once, and the scheduler sleeps until the next trigger
+        crons = expression.CronSchedule(lines=models.env.crontab)
+        tasks.add_job(name="crontab", due=crons.next_trigger,
+                      action=lambda now: crontab_runner(crons=crons, now=now))
+    tasks.add_interval(name="events", interval=lambda: models.env.sync_events, action=events_syncer)
+    tasks.add_interval(name="meetings", interval=lambda: models.env.sync_meetings, action=meetings_syncer)
+    tasks.run()
+
+
+def automation_runner(automation: Schedule, now: datetime) -> NoReturn:
+    """Executes all the automation tasks that are due at the current minute.
+
+    Args:
+        automation: Automation schedule.
+        now: Current datetime.
+    """
+    for exec_task in automation.pending(now=now):
+        try:
+            offline_communicator(command=exec_task)
+        except Exception as error:
+            logger.error(error)
+
+
+def delay_runner(now: datetime) -> NoReturn:
+    """Executes all the delayed commands that are due.
+
+    Args:
+        now: Current datetime.
+    """
+    for each_delay in store.delays.pop_due(now=now):
+        logger.info(f"Executing '{each_delay['message']}'")
+        try:
+            offline_communicator(command=each_delay['message'])
+        except Exception as error:
+            logger.error(error)
+
+
+def crontab_runner(crons: expression.CronSchedule, now: datetime) -> NoReturn:
+    """Triggers the cron jobs that match the current minute.
+
+    Args:
+        crons: Compiled cron schedule.
+        now: Current datetime.
+    """
+    for job in crons.due(moment=now):
+        cron_process = Process(target=crontab_executor, args=(job.comment,))
+        cron_process.start()
+        db.write("INSERT or REPLACE INTO children (crontab) VALUES (?);", (cron_process.pid,))
+
+
+def events_syncer(now: datetime) -> NoReturn:
+    """Gets calendar events in a dedicated process and stores its PID.
+
+    Args:
+        now: Current datetime.
+    """
+    logger.debug(f"Syncing events at {now}")
+    event_process = Process(target=events.events_writer)
+    event_process.start()
+    db.write("UPDATE children SET events=null")
+    db.write("INSERT or REPLACE INTO children (events) VALUES (?);", (event_process.pid,))
+
+
+def meetings_syncer(now: datetime) -> NoReturn:
+    """Gets meetings from the ICS url in a dedicated process and stores its PID.
+
+    Args:
+        now: Current datetime.
+    """
+    logger.debug(f"Syncing meetings at {now}")
+    meeting_process = Process(target=icalendar.meetings_writer)
+    meeting_process.start()
+    db.write("UPDATE children SET meetings=null")
+    db.write("INSERT or REPLACE INTO children (meetings) VALUES (?);", (meeting_process.pid,))
 
 
 def get_tunnel() -> Union[HttpUrl, NoReturn]:
@@ -212,7 +231,7 @@ def on_demand_offline_automation(task: str) -> Union[str, None]:
 
 
 def offline_communicator(command: str) -> Union[AnyStr, HttpUrl]:
-    """Initiates conditions after flipping ``status`` flag in ``called_by_offline`` dict which suppresses the speaker.
+    """Initiates conditions after flipping the request scoped ``called_by_offline`` flag which suppresses the speaker.
 
     Args:
         command: Takes the command that has to be executed as an argument.
@@ -220,19 +239,27 @@ def offline_communicator(command: str) -> Union[AnyStr, HttpUrl]:
     Returns:
         AnyStr:
         Response from Jarvis.
+
+    See Also:
+        - The flag and the response are context variables, so concurrent requests from the API, Telegram bot and the
+          automator, each capture their own response.
     """
-    shared.called_by_offline = True
     # Specific for offline communication and not needed for live conversations
     if word_match(phrase=command, match_list=keywords.ngrok):
         if public_url := get_tunnel():
             return public_url
         else:
             raise LookupError("Failed to retrieve the public URL")
-    conditions(phrase=command, should_return=True)
-    shared.called_by_offline = False
-    if response := shared.text_spoken:
-        shared.text_spoken = None
+    offline_token = shared.called_by_offline.set(True)
+    spoken_token = shared.text_spoken.set(None)
+    try:
+        conditions(phrase=command, should_return=True)
+        response = shared.text_spoken.get()
+    finally:
+        shared.called_by_offline.reset(offline_token)
+        shared.text_spoken.reset(spoken_token)
+    if response:
         return response
     else:
-        logger.error(f"Offline request failed: {shared.text_spoken}")
+        logger.error(f"Offline request failed: {response}")
         return f"I was unable to process the request: {command}"
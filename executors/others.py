@@ -5,7 +5,6 @@ import subprocess
 import sys
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from threading import Thread
 from typing import NoReturn, Tuple
 
 import requests
@@ -14,7 +13,6 @@ from googlehomepush import GoogleHome
 from googlehomepush.http_server import serve_file
 from joke.jokes import chucknorris, geek, icanhazdad, icndb
 from newsapi import NewsApiClient, newsapi_exception
-from playsound import playsound
 from pychromecast.error import ChromecastConnectionError
 from randfacts import get_fact
 
@@ -26,7 +24,7 @@ from executors.robinhood import robinhood
 from executors.todo_list import todo
 from executors.weather import weather
 from executors.word_match import word_match
-from modules.audio import listener, speaker
+from modules.audio import listener, sounds, speaker
 from modules.audio.listener import listen
 from modules.conditions import keywords
 from modules.database import database
@@ -56,7 +54,7 @@ def apps(phrase: str) -> None:
     keyword = phrase.split()[-1] if phrase else None
     ignore = ['app', 'application']
     if not keyword or keyword in ignore:
-        if shared.called_by_offline:
+        if shared.called_by_offline.get():
             speaker.speak(text=f'I need an app name to open {models.env.title}!')
             return
         speaker.speak(text=f"Which app shall I open {models.env.title}?", run=True)
@@ -87,7 +85,7 @@ def apps(phrase: str) -> None:
 
     if not app_check:
         speaker.speak(text=f"I did not find the app {keyword}. Try again.")
-        Thread(target=support.unrecognized_dumper, args=[{'APPLICATIONS': keyword}]).start()
+        support.unrecognized_dumper(train_data={'APPLICATIONS': keyword})
         return
     app_status = os.system(f"open /Applications/'{keyword}' > /dev/null 2>&1")
     keyword = keyword.replace('.app', '')
@@ -150,7 +148,7 @@ def google_home(device: str = None, file: str = None) -> None:
     if not (network_id := vpn_checker()):
         return
 
-    if not shared.called_by_offline:
+    if not shared.called_by_offline.get():
         speaker.speak(text=f'Scanning your IP range for Google Home devices {models.env.title}!', run=True)
         sys.stdout.write('\rScanning your IP range for Google Home devices..')
     network_id = '.'.join(network_id.split('.')[0:3])
@@ -214,7 +212,7 @@ def jokes() -> NoReturn:
 
 def flip_a_coin() -> NoReturn:
     """Says ``heads`` or ``tails`` from a random choice."""
-    playsound(sound=models.indicators.coin, block=True) if not shared.called_by_offline else None
+    sounds.play(sound=models.indicators.coin, block=True) if not shared.called_by_offline.get() else None
     speaker.speak(text=f"""{random.choice(['You got', 'It landed on',
                                            "It's"])} {random.choice(['heads', 'tails'])} {models.env.title}""")
 
@@ -247,7 +245,7 @@ def meaning(phrase: str) -> None:
                 n += 1
                 mean = ', '.join(value[0:2])
                 speaker.speak(text=f'{keyword} is{repeated}{insert} {key}, which means {mean}.')
-            if shared.called_by_offline:
+            if shared.called_by_offline.get():
                 return
             speaker.speak(text=f'Do you wanna know how {keyword} is spelled?', run=True)
             response = listener.listen(timeout=3, phrase_limit=3)
@@ -290,8 +288,9 @@ def news(news_source: str = 'fox') -> None:
         return
 
     speaker.speak(text="News around you!")
-    speaker.speak(text=' '.join([article['title'] for article in all_articles['articles']]))
-    if shared.called_by_offline:
+    speaker.speak(text=' '.join([article['title'] for article in all_articles['articles']]),
+                  priority=speaker.Priority.REPORT)
+    if shared.called_by_offline.get():
         return
 
     if shared.called['report'] or shared.called['time_travel']:
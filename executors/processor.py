@@ -20,9 +20,10 @@ db = database.Database(database=models.fileio.base_db)
 @retry.retry(attempts=3, interval=2, warn=True)
 def delete_db() -> NoReturn:
     """Delete base db if exists. Called upon restart or shut down."""
-    if os.path.isfile(models.fileio.base_db):
-        logger.info(f"Removing {models.fileio.base_db}")
-        os.remove(models.fileio.base_db)
+    for filepath in (models.fileio.base_db, f"{models.fileio.base_db}-wal", f"{models.fileio.base_db}-shm"):
+        if os.path.isfile(filepath):
+            logger.info(f"Removing {filepath}")
+            os.remove(filepath)
     if os.path.isfile(models.fileio.base_db):
         raise FileExistsError(
             f"{models.fileio.base_db} still exists!"
@@ -43,6 +44,8 @@ def clear_db() -> NoReturn:
         cursor.execute("DELETE FROM stopper")
         logger.info(f"Deleting data from restart: {cursor.execute(f'SELECT * FROM restart').fetchall()}")
         cursor.execute("DELETE FROM restart")
+        logger.info(f"Deleting data from announcements: {cursor.execute(f'SELECT * FROM announcements').fetchall()}")
+        cursor.execute("DELETE FROM announcements")
         logger.info(f"Deleting data from children: {cursor.execute(f'SELECT * FROM children').fetchall()}")
         cursor.execute("DELETE FROM children")
 
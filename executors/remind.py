@@ -1,21 +1,23 @@
 import os
-import pathlib
 import random
 import re
 from datetime import datetime, timedelta
-from typing import NoReturn
+from threading import Thread
+from typing import NoReturn, Union
 
 from executors import communicator
 from executors.logger import logger
 from modules.audio import listener, speaker
 from modules.conditions import conversation
+from modules.control import channel
 from modules.models import models
+from modules.scheduler import store
 from modules.utils import shared, support
 from modules.windows import win_notifications
 
 
 def create_reminder(hour, minute, am_pm, message, to_about, timer: str = None) -> NoReturn:
-    """Creates the lock file necessary to set a reminder.
+    """Stores the reminder in the reminder store.
 
     Args:
         hour: Hour of reminder time.
@@ -25,9 +27,14 @@ def create_reminder(hour, minute, am_pm, message, to_about, timer: str = None) -
         to_about: remind to or remind about as said in phrase.
         timer: Number of minutes/hours to reminder.
     """
-    if not os.path.isdir('reminder'):
-        os.mkdir('reminder')
-    pathlib.Path(os.path.join("reminder", f"{hour}_{minute}_{am_pm}|{message.replace(' ', '_')}.lock")).touch()
+    try:
+        clock = datetime.strptime(f"{hour} {minute} {am_pm}", "%I %M %p").strftime("%H:%M")
+    except ValueError as error:
+        logger.error(error)
+        speaker.speak(text=f"I'm sorry {models.env.title}! "
+                           f"I wasn't able to understand the time {hour}:{minute} {am_pm}")
+        return
+    store.reminders.add(clock=clock, message=message)
     if timer:
         logger.info(f"Reminder created for '{message}' at {hour}:{minute} {am_pm}")
         speaker.speak(text=f"{random.choice(conversation.acknowledgement)}! "
@@ -67,7 +74,7 @@ def reminder(phrase: str) -> None:
                             timer=f"{hours} {hour_}", to_about=to_about)
             return
     if not (extracted_time := support.extract_time(input_=phrase)):
-        if shared.called_by_offline:
+        if shared.called_by_offline.get():
             speaker.speak(text='Reminder format should be::Remind me to do something, at some time.')
             return
         speaker.speak(text=f"When do you want to be reminded {models.env.title}?", run=True)
@@ -107,3 +114,31 @@ def reminder_executor(message: str) -> NoReturn:
         os.system(f"""osascript -e 'display notification "{message}" with title "REMINDER from Jarvis"'""")
     else:
         win_notifications.WindowsBalloonTip(msg=message, title="REMINDER from Jarvis")
+
+
+def reminder_due(now: datetime) -> Union[datetime, None]:
+    """Gets the next time when a reminder has to be notified.
+
+    Args:
+        now: Current datetime.
+
+    Returns:
+        datetime:
+        Datetime of the earliest reminder, ``None`` if there are no reminders.
+    """
+    return store.reminders.upcoming()
+
+
+def reminder_checker(now: datetime) -> NoReturn:
+    """Notifies the reminders that are due.
+
+    Args:
+        now: Current datetime.
+
+    See Also:
+        - The reminder is also announced by the main process as an alert, which interrupts any other speech.
+    """
+    for each_reminder in store.reminders.pop_due(now=now):
+        Thread(target=reminder_executor, args=[each_reminder["message"]]).start()
+        channel.announce(text=f"Reminder {models.env.title}! {each_reminder['message'] or ''}".strip(),
+                         caller="reminder")
@@ -26,7 +26,7 @@ def todo() -> None:
         else:
             result[category] = result[category] + ', ' + item  # updates category if already found in result
     if result:
-        if shared.called_by_offline:
+        if shared.called_by_offline.get():
             speaker.speak(text=json.dumps(result))
             return
         speaker.speak(text='Your to-do items are')
@@ -66,7 +66,7 @@ def add_todo() -> None:
                 return
     with tdb.connection:
         cursor = tdb.connection.cursor()
-        cursor.execute(f"INSERT OR REPLACE INTO tasks (category, item) VALUES {(category, item)}")
+        cursor.execute("INSERT OR REPLACE INTO tasks (category, item) VALUES (?,?)", (category, item))
     speaker.speak(text=f"I've added the item: {item} to the category: {category}. "
                        "Do you want to add anything else to your to-do list?", run=True)
     category_continue = listener.listen(timeout=3, phrase_limit=3)
@@ -84,7 +84,7 @@ def delete_todo_items() -> None:
         return
     with tdb.connection:
         cursor = tdb.connection.cursor()
-        cursor.execute(f"DELETE FROM tasks WHERE item='{item}' OR category='{item}'")
+        cursor.execute("DELETE FROM tasks WHERE item=? OR category=?", (item, item))
         cursor.connection.commit()
     speaker.speak(text=f'Done {models.env.title}!', run=True)
 
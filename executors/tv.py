@@ -14,29 +14,21 @@ from modules.audio import speaker
 from modules.conditions import conversation
 from modules.exceptions import TVError
 from modules.models import models
-from modules.tv.tv_controls import TV
+from modules.tv import tv_controls
 from modules.utils import shared, support
 from modules.wakeonlan import wakeonlan
 
 
-def television(phrase: str) -> None:
-    """Controls all actions on a TV (LG Web OS).
+def connect(phrase_lower: str) -> bool:
+    """Pings the TV, powers it on if necessary and opens a session.
 
     Args:
-        phrase: Takes the voice recognized statement as argument.
-    """
-    if not word_match(phrase=phrase,
-                      match_list=['turn on', 'connect', 'shutdown', 'shut down', 'turn off', 'increase',
-                                  'decrease', 'reduce', 'mute', 'stop', 'content', 'stop', 'pause', 'resume', 'play',
-                                  'rewind', 'forward', 'set', 'volume', 'volume', 'app', 'application', 'open',
-                                  'launch', "what's", 'currently', 'change', 'source']):
-        speaker.speak(text=f"I didn't quite get that {models.env.title}! What do you want me to do to your tv?")
-        Thread(target=support.unrecognized_dumper, args=[{'TV': phrase}]).start()
-        return
-
-    if not vpn_checker():
-        return
+        phrase_lower: Takes the voice recognized statement in lower case as argument.
 
+    Returns:
+        bool:
+        A boolean flag to indicate whether the command can be executed on the session.
+    """
     if not os.path.isfile(models.fileio.smart_devices):
         logger.warning(f"{models.fileio.smart_devices} not found.")
         support.no_env_vars()
@@ -50,20 +42,14 @@ def television(phrase: str) -> None:
         speaker.speak(text=f"I'm sorry {models.env.title}! I was unable to read your TV's source information.")
         return
 
-    if not models.env.tv_mac or not models.env.tv_client_key:
-        logger.warning("IP, MacAddress [or] ClientKey not found.")
-        support.no_env_vars()
-        return
-
     tv_ip_list = support.hostname_to_ip(hostname=smart_devices.get('tv', 'LGWEBOSTV'))
-    tv_ip_list = list(filter(None, tv_ip_list))
+    if tv_controls.session.ip_address:  # IP address that the TV was last reached on, including discovery results
+        tv_ip_list.insert(0, tv_controls.session.ip_address)
+    tv_ip_list = list(dict.fromkeys(filter(None, tv_ip_list)))
     if not tv_ip_list:
         speaker.speak(text=f"I'm sorry {models.env.title}! I wasn't able to get the IP address of your TV.")
         return
 
-    phrase_exc = phrase.replace('TV', '')
-    phrase_lower = phrase_exc.lower()
-
     def tv_status(attempt: int = 0) -> str:
         """Pings the tv and returns the status. 0 if able to ping, 256 if unable to ping.
 
@@ -96,7 +82,7 @@ def television(phrase: str) -> None:
         power_controller = wakeonlan.WakeOnLan()
         with ThreadPoolExecutor(max_workers=len(models.env.tv_mac)) as executor:
             executor.map(power_controller.send_packet, models.env.tv_mac)
-        if not shared.called_by_offline:
+        if not shared.called_by_offline.get():
             speaker.speak(text=f"Looks like your TV is powered off {models.env.title}! Let me try to turn it back on!",
                           run=True)
 
@@ -110,80 +96,109 @@ def television(phrase: str) -> None:
                                f"the same network as your TV, and your TV is connected to a power source.")
             return
 
-    if not shared.tv:
-        try:
-            shared.tv = TV(ip_address=tv_ip, client_key=models.env.tv_client_key)
-        except TVError as error:
-            logger.error(f"Failed to connect to the TV. {error}")
-            speaker.speak(text=f"I was unable to connect to the TV {models.env.title}! It appears to be a connection "
-                               "issue. You might want to try again later.")
-            return
-        if 'turn on' in phrase_lower or 'connect' in phrase_lower:
-            speaker.speak(text=f"TV features have been integrated {models.env.title}!")
-            return
+    try:
+        tv_controls.session.connect(ip_address=tv_ip, client_key=models.env.tv_client_key)
+    except TVError as error:
+        logger.error(f"Failed to connect to the TV. {error}")
+        speaker.speak(text=f"I was unable to connect to the TV {models.env.title}! It appears to be a connection "
+                           "issue. You might want to try again later.")
+        return
+    if 'turn on' in phrase_lower or 'connect' in phrase_lower:
+        speaker.speak(text=f"TV features have been integrated {models.env.title}!")
+        return
+    return True
+
+
+def television(phrase: str) -> None:
+    """Controls all actions on a TV (LG Web OS).
+
+    Args:
+        phrase: Takes the voice recognized statement as argument.
+    """
+    if not word_match(phrase=phrase,
+                      match_list=['turn on', 'connect', 'shutdown', 'shut down', 'turn off', 'increase',
+                                  'decrease', 'reduce', 'mute', 'stop', 'content', 'stop', 'pause', 'resume', 'play',
+                                  'rewind', 'forward', 'set', 'volume', 'volume', 'app', 'application', 'open',
+                                  'launch', "what's", 'currently', 'change', 'source']):
+        speaker.speak(text=f"I didn't quite get that {models.env.title}! What do you want me to do to your tv?")
+        support.unrecognized_dumper(train_data={'TV': phrase})
+        return
+
+    if not vpn_checker():
+        return
+
+    if not models.env.tv_mac or not models.env.tv_client_key:
+        logger.warning("IP, MacAddress [or] ClientKey not found.")
+        support.no_env_vars()
+        return
+
+    phrase_exc = phrase.replace('TV', '')
+    phrase_lower = phrase_exc.lower()
+
+    if not tv_controls.session.alive and not connect(phrase_lower=phrase_lower):
+        return
 
-    if shared.tv:
+    if tv := tv_controls.session.tv:
         if 'turn on' in phrase_lower or 'connect' in phrase_lower:
             speaker.speak(text=f'Your TV is already powered on {models.env.title}!')
         elif 'shutdown' in phrase_lower or 'shut down' in phrase_lower or 'turn off' in phrase_lower:
-            Thread(target=shared.tv.shutdown).start()
+            Thread(target=tv_controls.session.shutdown).start()
             speaker.speak(text=f'{random.choice(conversation.acknowledgement)}! Turning your TV off.')
-            shared.tv = None
         elif 'increase' in phrase_lower:
-            shared.tv.increase_volume()
+            tv.increase_volume()
             speaker.speak(text=f'{random.choice(conversation.acknowledgement)}!')
         elif 'decrease' in phrase_lower or 'reduce' in phrase_lower:
-            shared.tv.decrease_volume()
+            tv.decrease_volume()
             speaker.speak(text=f'{random.choice(conversation.acknowledgement)}!')
         elif 'mute' in phrase_lower:
-            shared.tv.mute()
+            tv.mute()
             speaker.speak(text=f'{random.choice(conversation.acknowledgement)}!')
         elif 'stop' in phrase_lower and 'content' in phrase_lower:
-            shared.tv.stop()
+            tv.stop()
             speaker.speak(text=f'{random.choice(conversation.acknowledgement)}!')
         elif 'stop' in phrase_lower or 'pause' in phrase_lower:
-            shared.tv.pause()
+            tv.pause()
             speaker.speak(text=f'{random.choice(conversation.acknowledgement)}!')
         elif 'resume' in phrase_lower or 'play' in phrase_lower:
-            shared.tv.play()
+            tv.play()
             speaker.speak(text=f'{random.choice(conversation.acknowledgement)}!')
         elif 'rewind' in phrase_lower:
-            shared.tv.rewind()
+            tv.rewind()
             speaker.speak(text=f'{random.choice(conversation.acknowledgement)}!')
         elif 'forward' in phrase_lower:
-            shared.tv.forward()
+            tv.forward()
             speaker.speak(text=f'{random.choice(conversation.acknowledgement)}!')
         elif 'set' in phrase_lower and 'volume' in phrase_lower:
             vol = support.extract_nos(input_=phrase_lower, method=int)
             if vol is None:
                 speaker.speak(text=f"Requested volume doesn't match the right format {models.env.title}!")
             else:
-                shared.tv.set_volume(target=vol)
+                tv.set_volume(target=vol)
                 speaker.speak(text=f"I've set the volume to {vol}% {models.env.title}.")
         elif 'volume' in phrase_lower:
-            speaker.speak(text=f"The current volume on your TV is, {shared.tv.get_volume()}%")
+            speaker.speak(text=f"The current volume on your TV is, {tv.get_volume()}%")
         elif 'app' in phrase_lower or 'application' in phrase_lower:
-            sys.stdout.write(f'\r{shared.tv.get_apps()}')
+            sys.stdout.write(f'\r{tv.get_apps()}')
             speaker.speak(text=f'App list on your screen {models.env.title}!', run=True)
             time.sleep(5)
         elif 'open' in phrase_lower or 'launch' in phrase_lower:
             cleaned = ' '.join([w for w in phrase.split() if w not in ['launch', 'open', 'tv', 'on', 'my', 'the']])
-            app_name = support.get_closest_match(text=cleaned, match_list=shared.tv.get_apps())
+            app_name = support.get_closest_match(text=cleaned, match_list=tv.get_apps())
             logger.info(f'{phrase} -> {app_name}')
-            shared.tv.launch_app(app_name=app_name)
+            tv.launch_app(app_name=app_name)
             speaker.speak(text=f"I've launched {app_name} on your TV {models.env.title}!")
         elif "what's" in phrase_lower or 'currently' in phrase_lower:
-            speaker.speak(text=f'{shared.tv.current_app()} is running on your TV.')
+            speaker.speak(text=f'{tv.current_app()} is running on your TV.')
         elif 'change' in phrase_lower or 'source' in phrase_lower:
             cleaned = ' '.join([word for word in phrase.split() if word not in ('set', 'the', 'source', 'on', 'my',
                                                                                 'of', 'to', 'tv')])
-            source = support.get_closest_match(text=cleaned, match_list=shared.tv.get_sources())
+            source = support.get_closest_match(text=cleaned, match_list=tv.get_sources())
             logger.info(f'{phrase} -> {source}')
-            shared.tv.set_source(val=source)
+            tv.set_source(val=source)
             speaker.speak(text=f"I've changed the source to {source}.")
         else:
             speaker.speak(text="I didn't quite get that.")
-            Thread(target=support.unrecognized_dumper, args=[{'TV': phrase}]).start()
+            support.unrecognized_dumper(train_data={'TV': phrase})
     else:
         phrase = phrase.replace('my', 'your').replace('please', '').replace('will you', '').strip()
         speaker.speak(text=f"I'm sorry {models.env.title}! I wasn't able to {phrase}, as the TV state is unknown!")
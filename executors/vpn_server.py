@@ -1,6 +1,5 @@
 import os
 from multiprocessing import Process
-from threading import Thread
 
 from vpn.controller import VPNServer
 
@@ -41,7 +40,7 @@ def vpn_server(phrase: str) -> None:
     else:
         speaker.speak(text=f"I don't understand the request {models.env.title}! "
                            "You can ask me to enable or disable the VPN server.")
-        Thread(target=support.unrecognized_dumper, args=[{'VPNServer': phrase}]).start()
+        support.unrecognized_dumper(train_data={'VPNServer': phrase})
 
 
 def vpn_server_switch(operation: str) -> None:
@@ -68,5 +67,5 @@ def vpn_server_switch(operation: str) -> None:
         vpn_object.delete_vpn_server()
     with db.connection:
         cursor = db.connection.cursor()
-        cursor.execute(f"DELETE FROM vpn WHERE state='{operation}'")
+        cursor.execute("DELETE FROM vpn WHERE state=?", (operation,))
         db.connection.commit()
@@ -23,7 +23,7 @@ def wikipedia_() -> None:
                 sys.stdout.write(f"\r{error}")
                 speaker.speak(text=f"Your keyword has multiple results {models.env.title}. {' '.join(error.options)}"
                                    "Please pick one and try again.")
-                if shared.called_by_offline:
+                if shared.called_by_offline.get():
                     return
                 speaker.speak(run=True)
                 if not (keyword1 := listener.listen(timeout=3, phrase_limit=5)):
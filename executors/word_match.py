@@ -18,7 +18,7 @@ def word_match(phrase: str, match_list: Iterable[str]) -> Union[str, NoReturn]:
     for word in match_list:
         if word in phrase.lower():  # include .split() for an exact match of words instead of a regex
             caller = sys._getframe(1).f_code.co_name  # noqa
-            if caller == 'auto_helper':
+            if caller == 'parse_automation':
                 return word
             logger.info(f'Matching word: {word}')
             logger.info(f'Called by {caller}')
@@ -1,12 +1,10 @@
 import logging
-import struct
 import sys
+from array import array
 from datetime import datetime
-from typing import NoReturn
+from typing import NoReturn, Tuple
 
 import pvporcupine
-import pyaudio
-from playsound import playsound
 
 from executors.commander import initiator
 from executors.communicator import notify
@@ -17,30 +15,35 @@ from executors.logger import custom_handler, logger
 from executors.offline import repeated_tasks
 from executors.processor import clear_db, start_processes, stop_processes
 from executors.system import hosted_device_info
-from modules.audio import listener, speaker
+from modules.audio import listener, sounds, speaker
+from modules.audio.capture import capture
+from modules.control import channel
 from modules.exceptions import StopSignal
 from modules.models import models
 from modules.utils import shared, support
 
 
-def restart_checker() -> NoReturn:
-    """Operations performed during internal/external request to restart."""
-    if flag := support.check_restart():
-        logger.info(f"Restart condition is set to {flag[0]} by {flag[1]}")
-        if flag[1] == "OFFLINE":
-            stop_processes()
-            logger.propagate = False
-            for _handler in logger.handlers:
-                if isinstance(_handler, logging.FileHandler):
-                    logger.removeHandler(hdlr=_handler)
-            handler = custom_handler()
-            logger.info(f"Switching to {handler.baseFilename}")
-            logger.addHandler(hdlr=handler)
-            starter()
-            shared.processes = start_processes()
-        else:
-            stop_processes(func_name=flag[1])
-            shared.processes[flag[1]] = start_processes(flag[1])
+def restart_checker(flag: Tuple[str, str]) -> NoReturn:
+    """Operations performed during internal/external request to restart.
+
+    Args:
+        flag: Flag and the caller that requested the restart.
+    """
+    logger.info(f"Restart condition is set to {flag[0]} by {flag[1]}")
+    if flag[1] == "OFFLINE":
+        stop_processes()
+        logger.propagate = False
+        for _handler in logger.handlers:
+            if isinstance(_handler, logging.FileHandler):
+                logger.removeHandler(hdlr=_handler)
+        handler = custom_handler()
+        logger.info(f"Switching to {handler.baseFilename}")
+        logger.addHandler(hdlr=handler)
+        starter()
+        shared.processes = start_processes()
+    else:
+        stop_processes(func_name=flag[1])
+        shared.processes[flag[1]] = start_processes(flag[1])
 
 
 class Activator:
@@ -49,7 +52,7 @@ class Activator:
     >>> Activator
 
     See Also:
-        - Creates an input audio stream from a microphone, monitors it, and detects the specified wake word.
+        - Reads the audio captured from the microphone, monitors it, and detects the specified wake word.
         - Once detected, Jarvis triggers the ``listener.listen()`` function with an ``acknowledgement`` sound played.
         - After processing the phrase, the converted text is sent as response to ``initiator()`` with a ``return`` flag.
         - The ``should_return`` flag ensures, the user is not disturbed when accidentally woke up by wake work engine.
@@ -73,7 +76,6 @@ class Activator:
         keyword_paths = [pvporcupine.KEYWORD_PATHS[x] for x in models.env.wake_words]
         self.input_device_index = input_device_index
 
-        self.py_audio = pyaudio.PyAudio()
         arguments = {
             "library_path": pvporcupine.LIBRARY_PATH,
             "sensitivities": models.env.sensitivity
@@ -87,32 +89,56 @@ class Activator:
             arguments["keyword_paths"] = keyword_paths
 
         self.detector = pvporcupine.create(**arguments)
-        self.audio_stream = self.open_stream()
+        self.reader = capture.begin(rate=self.detector.sample_rate, frame_length=self.detector.frame_length,
+                                    device_index=input_device_index).reader()
+        self.pcm = array('h', bytes(self.detector.frame_length * 2))
+        self.buffer = memoryview(self.pcm).cast('B')
+        self.show_status = True
         self.tasks = repeated_tasks()
+        self.control = channel.Subscriber(on_announce=self.alert)
+        self.control.start()
 
-    def open_stream(self) -> pyaudio.Stream:
-        """Initializes an audio stream.
+    def detect(self) -> int:
+        """Runs the wake word detection on the next frame of audio in the capture buffer.
 
         Returns:
-            pyaudio.Stream:
-            Audio stream from pyaudio.
+            int:
+            Index of the wake word that was detected, ``-1`` if none were detected.
+
+        See Also:
+            - The frame is copied into a sample buffer that is allocated once, instead of being unpacked into a tuple.
+            - Porcupine still copies the samples into a C array of its own for every frame.
+            - Run ``tests/frame_benchmark.py`` to compare the cost of each frame against unpacking.
+        """
+        self.reader.readinto(self.buffer)
+        result = self.detector.process(pcm=self.pcm)
+        if result is True or result is False:  # legacy versions return a boolean flag for a single wake word
+            return 0 if result else -1
+        return result
+
+    @staticmethod
+    def alert(text: str) -> NoReturn:
+        """Speaks an alert from a background process (eg: alarm or reminder), interrupting any other speech.
+
+        Args:
+            text: Text of the alert.
         """
-        return self.py_audio.open(
-            rate=self.detector.sample_rate,
-            channels=1,
-            format=pyaudio.paInt16,
-            input=True,
-            frames_per_buffer=self.detector.frame_length,
-            input_device_index=self.input_device_index
-        )
+        speaker.speak(text=text, priority=speaker.Priority.ALERT)
 
     def executor(self) -> NoReturn:
-        """Calls the listener for actionable phrase and runs the speaker node for response."""
+        """Calls the listener for actionable phrase and runs the speaker node for response.
+
+        See Also:
+            - The listener reads from the capture buffer right after the wake word, so nothing spoken after the wake
+              word is lost while the listener starts.
+            - Speech from the previous command is cancelled when the wake word is heard, and the response is not waited
+              for, so that the wake word can interrupt a long response.
+        """
         logger.debug(f"Detected {models.settings.bot} at {datetime.now()}")
-        playsound(sound=models.indicators.acknowledgement, block=False)
-        self.py_audio.close(stream=self.audio_stream)
+        speaker.output.cancel()
+        sounds.play(sound=models.indicators.acknowledgement, block=False)
         if phrase := listener.listen(timeout=models.env.timeout, phrase_limit=models.env.phrase_limit,
-                                     sound=False):
+                                     sound=False, position=self.reader.position):
             try:
                 initiator(phrase=phrase, should_return=True)
             except Exception as error:
@@ -120,41 +146,39 @@ class Activator:
                 notify(user=models.env.gmail_user, password=models.env.gmail_pass,
                        subject="UNKNOWN ERROR in main module", body=error.__str__(), number=models.env.phone_number)
                 speaker.speak(text=f"I'm sorry {models.env.title}! I ran into an unknown error. "
-                                   "Please check the logs for more information.")
-            speaker.speak(run=True)
-        self.audio_stream = self.open_stream()
+                                   "Please check the logs for more information.", priority=speaker.Priority.ALERT)
+        self.reader = capture.reader()  # skips the audio that was heard while executing
+        self.show_status = True
 
     def start(self) -> NoReturn:
-        """Runs ``audio_stream`` in a forever loop and calls ``initiator`` when the phrase ``Jarvis`` is heard."""
+        """Reads the capture buffer in a forever loop and calls ``initiator`` when the phrase ``Jarvis`` is heard.
+
+        See Also:
+            - Each frame is copied into a reusable sample buffer before it is handed to porcupine, refer ``detect``
+            - The status line is written only when it changes, which is at start up and after every wake word.
+        """
+        status = f"\rAwaiting: [{', '.join(models.env.wake_words).upper()}]"
         try:
             while True:
-                sys.stdout.write(f"\rAwaiting: [{', '.join(models.env.wake_words).upper()}]")
-                pcm = struct.unpack_from("h" * self.detector.frame_length,
-                                         self.audio_stream.read(num_frames=self.detector.frame_length,
-                                                                exception_on_overflow=False))
-                result = self.detector.process(pcm=pcm)
-                if models.settings.legacy:
-                    if len(models.env.wake_words) == 1 and result:
-                        models.settings.bot = models.env.wake_words[0]
-                        self.executor()
-                    elif len(models.env.wake_words) > 1 and result >= 0:
-                        models.settings.bot = models.env.wake_words[result]
-                        self.executor()
-                else:
-                    if result >= 0:
-                        models.settings.bot = models.env.wake_words[result]
-                        self.executor()
-                if models.settings.limited:
+                if self.show_status:
+                    sys.stdout.write(status)
+                    sys.stdout.flush()
+                    self.show_status = False
+                result = self.detect()
+                if result >= 0:
+                    models.settings.bot = models.env.wake_words[result]
+                    self.executor()
+                if models.settings.limited or not self.control.pending.is_set():
                     continue
-                support.flush_screen()
-                restart_checker()
-                if flag := support.check_stop():
+                if flag := self.control.check_restart():
+                    restart_checker(flag=flag)
+                    self.show_status = True
+                if flag := self.control.check_stop():
                     logger.info(f"Stopper condition is set to {flag[0]} by {flag[1]}")
                     self.stop()
                     terminator()
         except StopSignal:
             exit_process()
-            self.audio_stream = None
             self.stop()
             terminator()
 
@@ -163,28 +187,29 @@ class Activator:
 
         See Also:
             - Terminates/Kills all the background processes.
+            - Exports the unrecognized phrases logged during the session to the training data.
             - Releases resources held by porcupine.
-            - Closes audio stream.
-            - Releases port audio resources.
+            - Stops the audio capture, which closes the audio stream and releases port audio resources.
+            - Closes the output stream of the indicator sounds.
         """
         for task in self.tasks:
             task.stop()
+        self.control.stop()
         if not models.settings.limited:
             stop_processes()
         clear_db()
+        support.training_exporter()
         logger.info("Releasing resources acquired by Porcupine.")
         self.detector.delete()
-        if self.audio_stream and self.audio_stream.is_active():
-            logger.info("Closing Audio Stream.")
-            self.py_audio.close(stream=self.audio_stream)
-            self.audio_stream.close()
-        logger.info("Releasing PortAudio resources.")
-        self.py_audio.terminate()
+        logger.info("Stopping audio capture and releasing PortAudio resources.")
+        capture.stop()
+        sounds.mixer.close()
 
 
 def begin() -> NoReturn:
     """Starts main process to activate Jarvis after checking internet connection and initiating background processes."""
     logger.info(f"Current Process ID: {models.settings.pid}")
+    sounds.mixer.preload()
     starter()
     if ip_address() and public_ip_info():
         sys.stdout.write(f"\rINTERNET::Connected to {get_ssid() or 'the internet'}.")
@@ -197,7 +222,7 @@ def begin() -> NoReturn:
     if not models.settings.limited:
         shared.processes = start_processes()
     write_current_location()
-    playsound(sound=models.indicators.initialize, block=False)
+    sounds.play(sound=models.indicators.initialize, block=False)
     Activator().start()
 
 
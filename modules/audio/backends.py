@@ -0,0 +1,279 @@
+# noinspection PyUnresolvedReferences
+"""Module for a pool of speech synthesis backends with health checks, warm-up and least loaded routing.
+
+>>> Backends
+
+"""
+
+from threading import Event, Lock, Thread
+from typing import Dict, Iterable, List, NoReturn, Union
+
+import requests
+
+from executors.logger import logger
+from modules.models import models
+
+VOICE = "en-us_northern_english_male-glow_tts"
+
+
+class Backend:
+    """Holds the state of a speech synthesis endpoint.
+
+    >>> Backend
+
+    """
+
+    def __init__(self, url: str):
+        """Instantiates the backend as unhealthy, until it passes a health check.
+
+        Args:
+            url: Base URL of the endpoint.
+        """
+        self.url = url
+        self.healthy = False
+        self.warming = False
+        self.inflight = 0
+        self.failures = 0
+        self.requests = 0
+        self.latency = 0.0  # moving average of the response time in seconds
+
+    def stats(self) -> Dict[str, Union[str, bool, int, float]]:
+        """Gets the state of the backend.
+
+        Returns:
+            dict:
+            URL, health, requests in flight, total requests and the average latency.
+        """
+        return {"url": self.url, "healthy": self.healthy, "inflight": self.inflight, "requests": self.requests,
+                "latency": round(self.latency, 3)}
+
+
+class BackendPool:
+    """Routes speech synthesis requests to the least loaded healthy backend.
+
+    >>> BackendPool
+
+    See Also:
+        - Backends are health checked in a background thread, started on first use in each process.
+        - A backend that turns healthy synthesizes a short phrase for each voice, so that the voice model is loaded
+          before a request is routed to it. The warm-up runs in a thread of its own, so that a slow backend does not
+          hold up the health checks of the others.
+        - A backend that refuses a connection or fails repeatedly is taken out until it passes a health check again,
+          and the request is retried on another healthy backend.
+        - Requests are sent to the backend with the least requests in flight, and the lowest average latency.
+    """
+
+    def __init__(self, urls: Iterable[str], voices: Iterable[str] = (VOICE,), interval: Union[int, float] = 10,
+                 max_failures: int = 3):
+        """Instantiates the pool without starting the health checks.
+
+        Args:
+            urls: Base URLs of the backends.
+            voices: Voices loaded on each backend during warm-up.
+            interval: Seconds between each round of health checks.
+            max_failures: Consecutive failures after which a backend is taken out.
+        """
+        self.backends = [Backend(url=url.rstrip('/')) for url in urls]
+        self.voices = tuple(voices)
+        self.interval = interval
+        self.max_failures = max_failures
+        self.checked = Event()
+        self._stopped = Event()
+        self._lock = Lock()
+        self._checker: Union[Thread, None] = None
+
+    def start(self) -> NoReturn:
+        """Starts the health checks, if not started already."""
+        with self._lock:
+            if self._checker is None:
+                self._checker = Thread(target=self._run, daemon=True)
+                self._checker.start()
+
+    def stop(self) -> NoReturn:
+        """Stops the health checks."""
+        self._stopped.set()
+
+    def _run(self) -> NoReturn:
+        """Checks every backend at each interval until stopped."""
+        while True:
+            for backend in self.backends:
+                self.check(backend=backend)
+            if not any(backend.warming for backend in self.backends):  # set by the warm-up otherwise
+                self.checked.set()
+            if self._stopped.wait(timeout=self.interval):
+                return
+
+    def check(self, backend: Backend) -> bool:
+        """Checks the health of a backend, and starts warming it up if it just turned healthy.
+
+        Args:
+            backend: Backend to be checked.
+
+        Returns:
+            bool:
+            A boolean flag to indicate whether the backend is healthy.
+        """
+        try:
+            alive = requests.get(url=backend.url, timeout=1).ok
+        except (ConnectionError, TimeoutError, requests.exceptions.RequestException) as error:
+            logger.debug(error)
+            alive = False
+        if alive and not backend.healthy and not backend.warming:
+            backend.warming = True
+            Thread(target=self._recover, kwargs={"backend": backend}, daemon=True).start()
+        elif not alive and backend.healthy:
+            logger.warning(f"Speech synthesis backend {backend.url} is not responding.")
+            backend.healthy = False
+        return backend.healthy
+
+    def _recover(self, backend: Backend) -> NoReturn:
+        """Warms up a backend, and routes requests to it once the voice models are loaded.
+
+        Args:
+            backend: Backend that just turned healthy.
+        """
+        try:
+            self.warm_up(backend=backend)
+            backend.failures = 0
+            backend.healthy = True
+            logger.info(f"Speech synthesis backend {backend.url} is healthy.")
+        finally:
+            backend.warming = False
+            self.checked.set()
+
+    def warm_up(self, backend: Backend) -> NoReturn:
+        """Loads the voice models on a backend by synthesizing a short phrase with each voice.
+
+        Args:
+            backend: Backend to be warmed up.
+        """
+        for voice in self.voices:
+            try:
+                requests.post(url=f"{backend.url}/api/tts", headers={"Content-Type": "text/plain"},
+                              params={"voice": voice, "quality": "high"}, data="Hello", timeout=60)
+            except (ConnectionError, TimeoutError, requests.exceptions.RequestException) as error:
+                logger.error(f"Unable to warm up {voice} on {backend.url}: {error}")
+
+    @property
+    def healthy(self) -> List[Backend]:
+        """Backends that passed the latest health check."""
+        return [backend for backend in self.backends if backend.healthy]
+
+    def _acquire(self, exclude: List[Backend]) -> Union[Backend, None]:
+        """Picks the least loaded healthy backend and counts the request in flight.
+
+        Args:
+            exclude: Backends that were already tried for the request.
+
+        Returns:
+            Backend:
+            Backend to which the request is sent.
+        """
+        with self._lock:
+            candidates = [backend for backend in self.healthy if backend not in exclude]
+            if not candidates:
+                return
+            backend = min(candidates, key=lambda item: (item.inflight, item.latency))
+            backend.inflight += 1
+            return backend
+
+    def _release(self, backend: Backend, elapsed: float = None, failed: bool = False) -> NoReturn:
+        """Updates the state of a backend once a request is complete.
+
+        Args:
+            backend: Backend to which the request was sent.
+            elapsed: Seconds taken by the request, if it succeeded.
+            failed: Boolean flag to indicate that the request failed.
+        """
+        with self._lock:
+            backend.inflight -= 1
+            if failed:
+                backend.failures += 1
+                if backend.failures >= self.max_failures:
+                    logger.warning(f"Taking out {backend.url} after {backend.failures} failures.")
+                    backend.healthy = False
+                return
+            backend.failures = 0
+            backend.requests += 1
+            backend.latency = elapsed if not backend.latency else backend.latency * 0.8 + elapsed * 0.2
+
+    def synthesize(self, text: str, timeout: Union[int, float], quality: str = "high",
+                   voice: str = VOICE) -> Union[bytes, None]:
+        """Converts text to audio using the least loaded healthy backend.
+
+        Args:
+            text: Normalized text that has to be converted to audio.
+            timeout: Time to wait for a backend to process the request.
+            quality: Quality at which the conversion is to be done.
+            voice: Voice for speech synthesis.
+
+        Returns:
+            bytes:
+            Content of the wav file, ``None`` if no backend could process the request.
+        """
+        self.start()
+        self.checked.wait(timeout=2)  # waits for the first round of health checks, or the first warm-up only
+        tried = []
+        while backend := self._acquire(exclude=tried):
+            tried.append(backend)
+            try:
+                response = requests.post(url=f"{backend.url}/api/tts", headers={"Content-Type": "text/plain"},
+                                         params={"voice": voice, "quality": quality}, data=text.encode('utf-8'),
+                                         verify=False, timeout=timeout)
+            except (ConnectionError, requests.exceptions.ConnectionError) as error:
+                logger.error(error)
+                self._release(backend=backend, failed=True)
+                backend.healthy = False
+                continue
+            except (TimeoutError, requests.exceptions.RequestException) as error:
+                logger.error(error)
+                self._release(backend=backend, failed=True)
+                continue
+            if response.ok:
+                self._release(backend=backend, elapsed=response.elapsed.total_seconds())
+                return response.content
+            logger.error(f"{response.status_code}::{backend.url}/api/tts")
+            self._release(backend=backend, failed=True)
+            return
+        if not tried:
+            logger.debug("No healthy speech synthesis backend is available.")
+
+    def wait(self, timeout: Union[int, float]) -> bool:
+        """Waits for a backend to turn healthy.
+
+        Args:
+            timeout: Seconds to wait.
+
+        Returns:
+            bool:
+            A boolean flag to indicate whether a backend is healthy.
+        """
+        self.start()
+        for _ in range(int(timeout)):
+            if self.healthy:
+                return True
+            self._stopped.wait(timeout=1)
+        return bool(self.healthy)
+
+    def stats(self) -> List[Dict[str, Union[str, bool, int, float]]]:
+        """Gets the state of every backend.
+
+        Returns:
+            list:
+            List of backend states.
+        """
+        return [backend.stats() for backend in self.backends]
+
+
+def urls() -> List[str]:
+    """Gets the URLs of the local containers and the additional endpoints.
+
+    Returns:
+        list:
+        Base URLs of the speech synthesis backends.
+    """
+    return [f"http://{models.env.speech_synthesis_host}:{models.env.speech_synthesis_port + index}"
+            for index in range(models.env.speech_synthesis_containers)] + models.env.speech_synthesis_endpoints
+
+
+pool = BackendPool(urls=urls())
@@ -0,0 +1,165 @@
+# noinspection PyUnresolvedReferences
+"""Module for a content addressed disk cache that stores the audio generated by speech synthesis.
+
+>>> Cache
+
+"""
+
+import hashlib
+import os
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Union
+
+from executors.logger import logger
+from modules.models import models
+
+
+class SpeechCache:
+    """Stores synthesized audio on disk keyed by the text, voice and quality, and evicts the least recently used files.
+
+    >>> SpeechCache
+
+    See Also:
+        - Files are named after the key, so every process that shares the directory shares the cache.
+        - Recency is tracked with the modified time of each file, which is refreshed on every hit.
+        - The size limit is enforced by each process on the files it knows about, so it is a soft limit.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        """Loads the existing files in the cache directory ordered from the least to the most recently used.
+
+        Args:
+            directory: Directory where the audio files are stored.
+            max_bytes: Maximum size of the cache in bytes. Zero disables the cache.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.size = 0
+        self._lock = Lock()
+        self._index: OrderedDict = OrderedDict()
+        if not max_bytes or not os.path.isdir(directory):
+            return
+        entries = [entry for entry in os.scandir(directory) if entry.name.endswith('.wav')]
+        for entry in sorted(entries, key=lambda file: file.stat().st_mtime):
+            self._index[entry.name[:-4]] = entry.stat().st_size
+            self.size += entry.stat().st_size
+        self._evict()
+
+    @staticmethod
+    def key(text: str, voice: str, quality: str) -> str:
+        """Generates a key for the normalized text, voice and quality.
+
+        Args:
+            text: Text that was synthesized.
+            voice: Voice used for speech synthesis.
+            quality: Quality used for speech synthesis.
+
+        Returns:
+            str:
+            SHA-256 hash of the inputs.
+        """
+        normalized = " ".join(text.split())
+        return hashlib.sha256(f"{voice}\0{quality}\0{normalized}".encode()).hexdigest()
+
+    def filepath(self, key: str) -> str:
+        """Gets the path of the audio file for a key.
+
+        Args:
+            key: Key generated from the inputs.
+
+        Returns:
+            str:
+            Path of the audio file.
+        """
+        return os.path.join(self.directory, f"{key}.wav")
+
+    def get(self, text: str, voice: str, quality: str) -> Union[str, None]:
+        """Looks up the cache for an audio file.
+
+        Args:
+            text: Text that has to be synthesized.
+            voice: Voice for speech synthesis.
+            quality: Quality for speech synthesis.
+
+        Returns:
+            str:
+            Path of the cached audio file, if present.
+        """
+        if not self.max_bytes:
+            return
+        key = self.key(text=text, voice=voice, quality=quality)
+        filepath = self.filepath(key=key)
+        with self._lock:
+            try:
+                os.utime(filepath)
+                size = os.stat(filepath).st_size
+            except OSError:  # not cached yet or evicted by another process
+                self.misses += 1
+                if key in self._index:
+                    self.size -= self._index.pop(key)
+                return
+            self.hits += 1
+            if key not in self._index:
+                self.size += size
+            self._index[key] = size
+            self._index.move_to_end(key)
+        logger.info(f"Speech synthesis cache hit: {self.stats()}")
+        return filepath
+
+    def put(self, text: str, voice: str, quality: str, content: bytes) -> Union[str, None]:
+        """Stores an audio file in the cache.
+
+        Args:
+            text: Text that was synthesized.
+            voice: Voice used for speech synthesis.
+            quality: Quality used for speech synthesis.
+            content: Audio content.
+
+        Returns:
+            str:
+            Path of the cached audio file.
+        """
+        if not self.max_bytes or len(content) > self.max_bytes:
+            return
+        key = self.key(text=text, voice=voice, quality=quality)
+        filepath = self.filepath(key=key)
+        tmp_file = f"{filepath}.{os.getpid()}.tmp"
+        with self._lock:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                with open(tmp_file, 'wb') as file:
+                    file.write(content)
+                os.replace(tmp_file, filepath)  # atomic, so a reader never sees a partial file
+            except OSError as error:
+                logger.error(error)
+                return
+            self.size += len(content) - self._index.pop(key, 0)
+            self._index[key] = len(content)
+            self._evict()
+        return filepath
+
+    def _evict(self) -> None:
+        """Removes the least recently used files until the cache fits within the size limit."""
+        while self._index and self.size > self.max_bytes:
+            key, size = self._index.popitem(last=False)
+            self.size -= size
+            try:
+                os.remove(self.filepath(key=key))
+            except OSError as error:
+                logger.debug(error)
+
+    def stats(self) -> Dict[str, int]:
+        """Gets the cache statistics.
+
+        Returns:
+            dict:
+            Number of hits, misses, files and the size of the cache in bytes.
+        """
+        return {"hits": self.hits, "misses": self.misses, "files": len(self._index), "size": self.size}
+
+
+speech_cache = SpeechCache(directory=models.fileio.speech_synthesis_cache,
+                           max_bytes=models.env.speech_synthesis_cache * 1_048_576)
@@ -0,0 +1,236 @@
+# noinspection PyUnresolvedReferences
+"""Module for a continuously running audio capture that is shared by the wake word detector and the listener.
+
+>>> Capture
+
+"""
+
+from threading import Condition, Thread
+from typing import List, NoReturn, Union
+
+import pyaudio
+from speech_recognition import AudioSource
+
+from executors.logger import logger
+from modules.models import models
+
+
+class Reader:
+    """Reads frames from the capture ring buffer with its own position, independent of the other readers.
+
+    >>> Reader
+
+    """
+
+    def __init__(self, capture: 'Capture', position: int):
+        """Instantiates the reader at the given position.
+
+        Args:
+            capture: Capture object that owns the ring buffer.
+            position: Sequence number of the first frame to be read.
+        """
+        self.capture = capture
+        self.position = position
+
+    def read(self, size: int = None) -> bytes:
+        """Reads the next frame, waiting for it to be captured if necessary.
+
+        Args:
+            size: Number of frames requested. Ignored, since the capture delivers one frame at a time.
+
+        Raises:
+            OSError:
+            If the capture has stopped.
+
+        Returns:
+            bytes:
+            Frame of 16-bit PCM audio.
+        """
+        capture = self.capture
+        with capture.condition:
+            while self.position >= capture.written:
+                if not capture.running:
+                    raise OSError("Audio capture is not running.")
+                capture.condition.wait(timeout=1)
+            if (behind := capture.written - self.position) > capture.capacity:
+                logger.warning(f"Audio reader fell behind by {behind} frames, skipping to the oldest frame available.")
+                self.position = capture.written - capture.capacity
+            frame = capture.frames[self.position % capture.capacity]
+            self.position += 1
+        return frame
+
+    def readinto(self, buffer: memoryview) -> int:
+        """Copies the next frame into a preallocated buffer, waiting for it to be captured if necessary.
+
+        Args:
+            buffer: Writable byte view of the buffer, at least as long as a frame.
+
+        Raises:
+            OSError:
+            If the capture has stopped.
+
+        Returns:
+            int:
+            Number of bytes copied into the buffer.
+        """
+        frame = self.read()
+        buffer[:len(frame)] = frame
+        return len(frame)
+
+
+class Source(AudioSource):
+    """Audio source for ``speech_recognition`` that reads from the capture ring buffer instead of opening a microphone.
+
+    >>> Source
+
+    """
+
+    def __init__(self, capture: 'Capture', position: int = None, preroll: Union[int, float] = 0):
+        """Instantiates the source.
+
+        Args:
+            capture: Capture object that owns the ring buffer.
+            position: Sequence number of the frame from which the audio is read. Defaults to the latest frame.
+            preroll: Seconds of audio before the position that are included.
+        """
+        self.capture = capture
+        self.position = position
+        self.preroll = preroll
+        self.SAMPLE_RATE = capture.rate
+        self.SAMPLE_WIDTH = 2
+        self.CHUNK = capture.frame_length
+        self.stream: Union[Reader, None] = None
+
+    def __enter__(self) -> 'Source':
+        """Creates a reader for the ring buffer."""
+        self.stream = self.capture.reader(position=self.position, preroll=self.preroll)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> NoReturn:
+        """Releases the reader."""
+        self.stream = None
+
+
+class Capture(Thread):
+    """Reads the microphone in a dedicated thread and stores the most recent frames in a ring buffer.
+
+    >>> Capture
+
+    See Also:
+        - The input device is opened once, and every consumer reads from the ring buffer with its own position.
+        - Frames are stored as the bytes objects returned by the stream, so readers share them without copying.
+        - Readers that fall behind by more than the capacity of the ring buffer skip ahead to the oldest frame.
+    """
+
+    def __init__(self, seconds: Union[int, float] = 10):
+        """Instantiates the capture thread without opening the input device.
+
+        Args:
+            seconds: Seconds of audio held in the ring buffer.
+        """
+        super().__init__(daemon=True)
+        self.seconds = seconds
+        self.rate = 16_000
+        self.frame_length = 512
+        self.device_index: Union[int, None] = None
+        self.capacity = 0
+        self.frames: List[bytes] = []
+        self.written = 0
+        self.condition = Condition()
+        self.running = False
+        self.py_audio: Union[pyaudio.PyAudio, None] = None
+        self.stream: Union[pyaudio.Stream, None] = None
+
+    def begin(self, rate: int = None, frame_length: int = None, device_index: int = None) -> 'Capture':
+        """Opens the input device and starts capturing, if not already started.
+
+        Args:
+            rate: Sample rate. Defaults to 16 kHz, which is what porcupine expects.
+            frame_length: Number of samples in each frame. Defaults to 512, which is what porcupine expects.
+            device_index: Index of the input device to use.
+
+        Returns:
+            Capture:
+            Returns the capture object.
+        """
+        with self.condition:
+            if self.running:
+                return self
+            self.rate = rate or self.rate
+            self.frame_length = frame_length or self.frame_length
+            self.device_index = device_index
+            self.capacity = int(self.seconds * self.rate / self.frame_length)
+            self.frames = [bytes(self.frame_length * 2)] * self.capacity
+            self.py_audio = pyaudio.PyAudio()
+            self.stream = self.py_audio.open(rate=self.rate, channels=1, format=pyaudio.paInt16, input=True,
+                                             frames_per_buffer=self.frame_length,
+                                             input_device_index=self.device_index)
+            self.running = True
+        self.start()
+        return self
+
+    def run(self) -> NoReturn:
+        """Reads frames from the input device into the ring buffer until stopped."""
+        try:
+            while self.running:
+                frame = self.stream.read(num_frames=self.frame_length, exception_on_overflow=False)
+                with self.condition:
+                    self.frames[self.written % self.capacity] = frame
+                    self.written += 1
+                    self.condition.notify_all()
+        except OSError as error:
+            logger.error(f"Audio capture stopped: {error}")
+        finally:
+            self.running = False
+            with self.condition:
+                self.condition.notify_all()
+
+    @property
+    def position(self) -> int:
+        """Sequence number of the next frame to be captured."""
+        return self.written
+
+    def reader(self, position: int = None, preroll: Union[int, float] = 0) -> Reader:
+        """Creates a reader for the ring buffer.
+
+        Args:
+            position: Sequence number of the first frame to be read. Defaults to the next frame to be captured.
+            preroll: Seconds of audio before the position that are included.
+
+        Returns:
+            Reader:
+            Reader positioned within the ring buffer.
+        """
+        position = self.written if position is None else position
+        position -= int(preroll * self.rate / self.frame_length)
+        return Reader(capture=self, position=max(position, self.written - self.capacity, 0))
+
+    def source(self, position: int = None, preroll: Union[int, float] = 0) -> Source:
+        """Creates an audio source for ``speech_recognition``, starting the capture if necessary.
+
+        Args:
+            position: Sequence number of the first frame to be read. Defaults to the next frame to be captured.
+            preroll: Seconds of audio before the position that are included.
+
+        Returns:
+            Source:
+            Audio source that reads from the ring buffer.
+        """
+        self.begin()
+        return Source(capture=self, position=position, preroll=preroll)
+
+    def stop(self) -> NoReturn:
+        """Stops capturing and releases the input device."""
+        if not self.running:
+            return
+        self.running = False
+        self.join(timeout=2)
+        if self.stream:
+            self.stream.stop_stream()
+            self.stream.close()
+        if self.py_audio:
+            self.py_audio.terminate()
+        self.stream, self.py_audio = None, None
+
+
+capture = Capture(seconds=models.env.capture_buffer)
@@ -5,23 +5,35 @@
 
 """
 import sys
-from typing import Union
+import time
+from typing import NoReturn, Union
 
 import requests.exceptions
-from playsound import playsound
-from speech_recognition import (Microphone, Recognizer, RequestError,
-                                UnknownValueError, WaitTimeoutError)
+from speech_recognition import (Recognizer, RequestError, UnknownValueError,
+                                WaitTimeoutError)
 
 from executors.logger import logger
+from modules.audio import sounds, speaker
+from modules.audio.capture import capture
+from modules.audio.recognizer import load_engine
+from modules.audio.vad import capture_stats, endpointer
 from modules.models import models
 from modules.utils import support
 
-recognizer = Recognizer()  # initiates recognizer that uses google's translation
-microphone = Microphone()  # initiates microphone object
+recognizer = Recognizer()  # initiates recognizer that detects the phrase when endpointing is disabled
+
+
+def partial(text: str) -> NoReturn:
+    """Writes the text recognized so far on screen.
+
+    Args:
+        text: Partial text.
+    """
+    sys.stdout.write(f"\rListener activated... {text}")
 
 
 def listen(timeout: Union[int, float], phrase_limit: Union[int, float], sound: bool = True,
-           stdout: bool = True) -> Union[str, None]:
+           stdout: bool = True, position: int = None) -> Union[str, None]:
     """Function to activate listener, this function will be called by most upcoming functions to listen to user input.
 
     Args:
@@ -29,19 +41,44 @@ def listen(timeout: Union[int, float], phrase_limit: Union[int, float], sound: b
         phrase_limit: Time in seconds for the listener to actively listen to a sound.
         sound: Flag whether to play the listener indicator sound. Defaults to True unless set to False.
         stdout: Flag whether to print the listener status on screen.
+        position: Position in the capture buffer from which the audio is read. Defaults to the latest audio.
+
+    See Also:
+        - Audio is read from the capture buffer, so the microphone is not opened for every phrase.
+        - ``LISTENER_PREROLL`` seconds of audio before the position are included, to catch the syllables spoken early.
+        - With ``LISTENER_VAD`` enabled, capture ends after ``LISTENER_SILENCE`` seconds of silence following the
+          speech, instead of waiting for the energy threshold of the recognizer.
+        - Time taken to capture each phrase is logged along with the running statistics for the endpointing mode.
+        - Waits for the queued speech to be spoken, so that the listener does not hear Jarvis.
+        - Audio is converted to text using the ``RECOGNIZER`` engine. With ``LISTENER_VAD`` enabled, each frame is sent
+          to the engine as it is captured, so an offline engine decodes while the phrase is spoken.
 
     Returns:
         str:
          - Returns recognized statement from the microphone.
     """
-    with microphone as source:
+    speaker.output.wait()
+    with capture.source(position=position, preroll=models.env.listener_preroll) as source:
         try:
-            playsound(sound=models.indicators.start, block=False) if sound else None
+            sounds.play(sound=models.indicators.start, block=False) if sound else None
             sys.stdout.write("\rListener activated...") if stdout else None
-            listened = recognizer.listen(source=source, timeout=timeout, phrase_time_limit=phrase_limit)
-            playsound(sound=models.indicators.end, block=False) if sound else None
+            engine, stream = load_engine(), None
+            start = time.perf_counter()
+            if models.env.listener_vad:
+                stream = engine.stream(sample_rate=source.SAMPLE_RATE, sample_width=source.SAMPLE_WIDTH,
+                                       on_partial=partial if stdout else None)
+                listened = endpointer.listen(source=source, timeout=timeout, phrase_limit=phrase_limit, stream=stream)
+            else:
+                listened = recognizer.listen(source=source, timeout=timeout, phrase_time_limit=phrase_limit)
+            capture_stats.record(mode="vad" if models.env.listener_vad else "energy",
+                                 duration=time.perf_counter() - start,
+                                 audio=len(listened.frame_data) / (listened.sample_rate * listened.sample_width))
+            sounds.play(sound=models.indicators.end, block=False) if sound else None
             support.flush_screen()
-            recognized = recognizer.recognize_google(audio_data=listened)
+            start = time.perf_counter()
+            recognized = stream.result() if stream else engine.recognize(audio=listened)
+            logger.info(f"Recognized in {round(time.perf_counter() - start, 3)}s after the end of speech "
+                        f"using {engine.name}")
             logger.info(recognized)
             return recognized
         except (UnknownValueError, RequestError, WaitTimeoutError):
@@ -0,0 +1,92 @@
+# noinspection PyUnresolvedReferences
+"""Module for playing audio from memory buffers.
+
+>>> Player
+
+"""
+
+import io
+import wave
+from threading import Event, Lock
+from typing import NoReturn, Tuple, Union
+
+import pyaudio
+
+from executors.logger import logger
+
+
+class Player:
+    """Plays wav content from memory through an output stream that is reused as long as the format stays the same.
+
+    >>> Player
+
+    """
+
+    CHUNK = 1_024  # frames written at a time, when the playback can be interrupted
+
+    def __init__(self):
+        """Instantiates the player without opening the audio device."""
+        self.py_audio: Union[pyaudio.PyAudio, None] = None
+        self.stream: Union[pyaudio.Stream, None] = None
+        self.params: Union[Tuple[int, int, int], None] = None
+        self._lock = Lock()
+
+    def _open(self, params: Tuple[int, int, int]) -> NoReturn:
+        """Opens an output stream for the given format, closing the existing one if the format differs.
+
+        Args:
+            params: Sample width, number of channels and the frame rate.
+        """
+        if self.stream and self.params == params:
+            return
+        self._close()
+        if not self.py_audio:
+            self.py_audio = pyaudio.PyAudio()
+        sample_width, channels, rate = params
+        self.stream = self.py_audio.open(format=self.py_audio.get_format_from_width(width=sample_width),
+                                         channels=channels, rate=rate, output=True)
+        self.params = params
+
+    def play(self, content: bytes, interrupt: Event = None) -> bool:
+        """Plays the wav content and blocks until it is written to the audio device.
+
+        Args:
+            content: Content of a wav file.
+            interrupt: Event that stops the playback when set, checked after every chunk of audio.
+
+        Returns:
+            bool:
+            A boolean flag to indicate whether the audio was played completely.
+        """
+        with self._lock:
+            try:
+                with wave.open(io.BytesIO(content)) as wav:
+                    self._open(params=(wav.getsampwidth(), wav.getnchannels(), wav.getframerate()))
+                    if not interrupt:
+                        self.stream.write(wav.readframes(wav.getnframes()))
+                        return True
+                    while frames := wav.readframes(self.CHUNK):
+                        if interrupt.is_set():
+                            return False
+                        self.stream.write(frames)
+                return True
+            except (wave.Error, EOFError, OSError) as error:
+                logger.error(error)
+                self._close()
+                return False
+
+    def _close(self) -> NoReturn:
+        """Closes the output stream."""
+        if self.stream:
+            self.stream.stop_stream()
+            self.stream.close()
+        self.stream = None
+        self.params = None
+
+    def close(self) -> NoReturn:
+        """Closes the output stream and releases the audio device."""
+        with self._lock:
+            self._close()
+            if self.py_audio:
+                self.py_audio.terminate()
+                self.py_audio = None
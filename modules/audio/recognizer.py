@@ -0,0 +1,293 @@
+# noinspection PyUnresolvedReferences
+"""Module for speech to text engines that are interchangeable, with an offline engine that decodes while listening.
+
+>>> Recognizer
+
+"""
+
+import functools
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Callable, List, NoReturn
+
+from speech_recognition import AudioData, Recognizer, UnknownValueError
+
+from executors.logger import logger
+from modules.models import models
+
+
+class Stream(ABC):
+    """Receives the frames of a phrase as they are captured, and converts the phrase to text once it ends.
+
+    >>> Stream
+
+    """
+
+    def __init__(self, sample_rate: int, sample_width: int = 2, on_partial: Callable[[str], None] = None):
+        """Instantiates the stream.
+
+        Args:
+            sample_rate: Sample rate of the frames.
+            sample_width: Sample width of the frames in bytes.
+            on_partial: Function that receives the partial text, for engines that decode while listening.
+        """
+        self.sample_rate = sample_rate
+        self.sample_width = sample_width
+        self.on_partial = on_partial
+
+    @abstractmethod
+    def feed(self, frame: bytes) -> NoReturn:
+        """Receives a frame of the phrase.
+
+        Args:
+            frame: Frame of 16-bit PCM audio.
+        """
+
+    @abstractmethod
+    def result(self) -> str:
+        """Converts the phrase to text.
+
+        Raises:
+            UnknownValueError:
+            If the phrase could not be recognized.
+
+        Returns:
+            str:
+            Recognized text.
+        """
+
+
+class GoogleStream(Stream):
+    """Holds the frames in memory, since the phrase is uploaded only after it ends.
+
+    >>> GoogleStream
+
+    """
+
+    def __init__(self, recognizer: Recognizer, **kwargs):
+        """Instantiates the stream.
+
+        Args:
+            recognizer: Recognizer that uploads the phrase.
+        """
+        super().__init__(**kwargs)
+        self.recognizer = recognizer
+        self.frames: List[bytes] = []
+
+    def feed(self, frame: bytes) -> NoReturn:
+        """Holds a frame of the phrase.
+
+        Args:
+            frame: Frame of 16-bit PCM audio.
+        """
+        self.frames.append(frame)
+
+    def result(self) -> str:
+        """Uploads the phrase and gets the recognized text.
+
+        Returns:
+            str:
+            Recognized text.
+        """
+        return self.recognizer.recognize_google(audio_data=AudioData(frame_data=b"".join(self.frames),
+                                                                     sample_rate=self.sample_rate,
+                                                                     sample_width=self.sample_width))
+
+
+class VoskStream(Stream):
+    """Decodes each frame as it is received, so that only the last few frames are left to decode once the phrase ends.
+
+    >>> VoskStream
+
+    """
+
+    def __init__(self, model: Any, **kwargs):
+        """Instantiates the stream.
+
+        Args:
+            model: Vosk model loaded in memory.
+        """
+        import vosk  # imported only when vosk is used, since it is an optional engine
+
+        super().__init__(**kwargs)
+        self.decoder = vosk.KaldiRecognizer(model, self.sample_rate)
+        self.texts: List[str] = []
+
+    def feed(self, frame: bytes) -> NoReturn:
+        """Decodes a frame of the phrase and sends the partial text.
+
+        Args:
+            frame: Frame of 16-bit PCM audio.
+        """
+        if self.decoder.AcceptWaveform(frame):
+            if text := json.loads(self.decoder.Result()).get('text'):
+                self.texts.append(text)
+            partial = None
+        else:
+            partial = json.loads(self.decoder.PartialResult()).get('partial')
+        if self.on_partial and (partial or self.texts):
+            self.on_partial(' '.join(self.texts + [partial] if partial else self.texts))
+
+    def result(self) -> str:
+        """Decodes the remaining frames and gets the recognized text.
+
+        Returns:
+            str:
+            Recognized text.
+        """
+        if text := json.loads(self.decoder.FinalResult()).get('text'):
+            self.texts.append(text)
+        if not self.texts:
+            raise UnknownValueError()
+        return ' '.join(self.texts)
+
+
+class Engine(ABC):
+    """Creates streams for a speech to text engine, and converts recorded audio to text.
+
+    >>> Engine
+
+    """
+
+    name: str = None
+
+    @abstractmethod
+    def stream(self, sample_rate: int, sample_width: int = 2, on_partial: Callable[[str], None] = None) -> Stream:
+        """Creates a stream for a phrase.
+
+        Args:
+            sample_rate: Sample rate of the frames.
+            sample_width: Sample width of the frames in bytes.
+            on_partial: Function that receives the partial text, for engines that decode while listening.
+
+        Returns:
+            Stream:
+            Stream that receives the frames of the phrase.
+        """
+
+    def recognize(self, audio: AudioData, chunk: int = 4_000) -> str:
+        """Converts recorded audio to text.
+
+        Args:
+            audio: Recorded audio.
+            chunk: Number of samples sent to the stream at a time.
+
+        Raises:
+            UnknownValueError:
+            If the audio could not be recognized.
+
+        Returns:
+            str:
+            Recognized text.
+        """
+        stream = self.stream(sample_rate=audio.sample_rate, sample_width=2)
+        data = audio.get_raw_data(convert_width=2)
+        for index in range(0, len(data), chunk * 2):
+            stream.feed(frame=data[index:index + chunk * 2])
+        return stream.result()
+
+
+class Google(Engine):
+    """Uploads the phrase to google's speech recognition API.
+
+    >>> Google
+
+    """
+
+    name = "google"
+
+    def __init__(self):
+        """Instantiates the recognizer."""
+        self.recognizer = Recognizer()
+
+    def stream(self, sample_rate: int, sample_width: int = 2, on_partial: Callable[[str], None] = None) -> Stream:
+        """Creates a stream for a phrase.
+
+        Args:
+            sample_rate: Sample rate of the frames.
+            sample_width: Sample width of the frames in bytes.
+            on_partial: Ignored, since the API returns the text only after the phrase is uploaded.
+
+        Returns:
+            GoogleStream:
+            Stream that holds the frames of the phrase.
+        """
+        return GoogleStream(recognizer=self.recognizer, sample_rate=sample_rate, sample_width=sample_width)
+
+    def recognize(self, audio: AudioData, chunk: int = 4_000) -> str:
+        """Uploads the recorded audio as is.
+
+        Args:
+            audio: Recorded audio.
+            chunk: Ignored, since the audio is uploaded at once.
+
+        Returns:
+            str:
+            Recognized text.
+        """
+        return self.recognizer.recognize_google(audio_data=audio)
+
+
+class Vosk(Engine):
+    """Decodes the phrase offline using a vosk model, while the phrase is being spoken.
+
+    >>> Vosk
+
+    See Also:
+        - The model is loaded once when the engine is created, and shared by every stream.
+        - ``vosk`` is imported only when the engine is created, so it is not required to use the other engines.
+        - Models can be downloaded from https://alphacephei.com/vosk/models
+    """
+
+    name = "vosk"
+
+    def __init__(self, model: str):
+        """Loads the model.
+
+        Args:
+            model: Directory of the vosk model.
+        """
+        import vosk
+
+        vosk.SetLogLevel(-1)
+        self.model = vosk.Model(model)
+
+    def stream(self, sample_rate: int, sample_width: int = 2, on_partial: Callable[[str], None] = None) -> Stream:
+        """Creates a stream for a phrase.
+
+        Args:
+            sample_rate: Sample rate of the frames.
+            sample_width: Sample width of the frames in bytes. Vosk expects 16-bit audio.
+            on_partial: Function that receives the partial text.
+
+        Returns:
+            VoskStream:
+            Stream that decodes the frames as they are received.
+        """
+        return VoskStream(model=self.model, sample_rate=sample_rate, sample_width=sample_width, on_partial=on_partial)
+
+
+@functools.lru_cache(maxsize=None)
+def load_engine(name: str = None) -> Engine:
+    """Loads the speech to text engine set in the env vars, once per process.
+
+    Args:
+        name: Name of the engine. Defaults to ``RECOGNIZER``
+
+    See Also:
+        - Falls back to google's speech recognition, if the vosk model cannot be loaded.
+
+    Returns:
+        Engine:
+        Speech to text engine.
+    """
+    name = name or models.env.recognizer
+    if name == Vosk.name:
+        if not models.env.recognizer_model:
+            logger.error("RECOGNIZER_MODEL is required to use vosk, falling back to google.")
+            return Google()
+        try:
+            return Vosk(model=str(models.env.recognizer_model))
+        except Exception as error:  # vosk raises a bare Exception when the model fails to load
+            logger.error(f"Unable to load vosk model: {error}, falling back to google.")
+    return Google()
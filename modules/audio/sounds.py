@@ -0,0 +1,212 @@
+# noinspection PyUnresolvedReferences
+"""Module for indicator sounds that are decoded once and mixed into a persistent output stream.
+
+>>> Sounds
+
+"""
+
+import os
+import shutil
+import subprocess
+from threading import Event, Lock, Thread
+from typing import Dict, List, NoReturn, Tuple, Union
+
+import numpy
+import pyaudio
+from playsound import playsound
+from pydantic import FilePath
+
+from executors.logger import logger
+from modules.models import models
+
+RATE = 44_100
+CHANNELS = 2
+FRAMES_PER_BUFFER = 256  # ~6ms of audio per callback
+
+
+def ffmpeg() -> Union[str, None]:
+    """Locates the ffmpeg binary, either in the ``PATH`` or in the ``ffmpeg`` directory downloaded on Windows.
+
+    Returns:
+        str:
+        Path of the ffmpeg binary.
+    """
+    return shutil.which("ffmpeg") or shutil.which("ffmpeg", path=os.path.join(os.getcwd(), "ffmpeg", "bin"))
+
+
+def decode(filepath: Union[FilePath, str]) -> Union[numpy.ndarray, None]:
+    """Decodes an audio file into 16-bit PCM samples.
+
+    Args:
+        filepath: Audio file.
+
+    Returns:
+        numpy.ndarray:
+        Interleaved samples of the audio.
+    """
+    if not (binary := ffmpeg()):
+        logger.warning("ffmpeg codec is missing!")
+        return
+    try:
+        output = subprocess.run([binary, "-loglevel", "error", "-i", filepath, "-f", "s16le", "-acodec", "pcm_s16le",
+                                 "-ac", str(CHANNELS), "-ar", str(RATE), "-"], capture_output=True, check=True,
+                                timeout=10).stdout
+    except (subprocess.SubprocessError, OSError) as error:
+        logger.error(f"Unable to decode {filepath}: {error}")
+        return
+    return numpy.frombuffer(output, dtype=numpy.int16)
+
+
+class Mixer:
+    """Plays decoded sounds through a single output stream that stays open, mixing the sounds that overlap.
+
+    >>> Mixer
+
+    See Also:
+        - Sounds are decoded once and held in memory, so playing a sound only adds it to the list of active voices.
+        - The stream runs in callback mode with a small buffer, so a sound starts within a few milliseconds.
+        - Sounds that could not be decoded are played with ``playsound`` instead.
+        - A sound played before it is decoded, or before the stream is open, is played with ``playsound`` while it is
+          prepared in the background, so that the caller is never held up by the decoder or the audio device.
+    """
+
+    def __init__(self):
+        """Instantiates the mixer without opening the audio device."""
+        self.sounds: Dict[str, Union[numpy.ndarray, None]] = {}
+        self.voices: List[Tuple[numpy.ndarray, List[int], Event]] = []
+        self.py_audio: Union[pyaudio.PyAudio, None] = None
+        self.stream: Union[pyaudio.Stream, None] = None
+        self._lock = Lock()
+        self._load_lock = Lock()
+
+    def load(self, filepath: Union[FilePath, str]) -> Union[numpy.ndarray, None]:
+        """Decodes a sound, if not decoded already.
+
+        Args:
+            filepath: Audio file.
+
+        Returns:
+            numpy.ndarray:
+            Interleaved samples of the sound, ``None`` if it could not be decoded.
+        """
+        if filepath in self.sounds:
+            return self.sounds[filepath]
+        with self._load_lock:
+            if filepath not in self.sounds:
+                self.sounds[filepath] = decode(filepath=filepath)
+        return self.sounds[filepath]
+
+    def prepare(self, filepath: Union[FilePath, str]) -> NoReturn:
+        """Decodes a sound and opens the output stream.
+
+        Args:
+            filepath: Audio file.
+        """
+        self.load(filepath=filepath)
+        self._open()
+
+    def preload(self) -> NoReturn:
+        """Decodes the indicator sounds and opens the output stream, in a background thread."""
+        def loader() -> NoReturn:
+            """Decodes the sounds one after the other."""
+            for filepath in models.indicators.dict().values():
+                if filepath != models.indicators.alarm:  # minutes long, and played by the system player
+                    self.load(filepath=filepath)
+            self._open()
+        Thread(target=loader, daemon=True).start()
+
+    def _open(self) -> bool:
+        """Opens the output stream, if not opened already.
+
+        Returns:
+            bool:
+            A boolean flag to indicate whether the stream is open.
+        """
+        with self._lock:
+            if self.stream:
+                return True
+            try:
+                self.py_audio = self.py_audio or pyaudio.PyAudio()
+                self.stream = self.py_audio.open(format=pyaudio.paInt16, channels=CHANNELS, rate=RATE, output=True,
+                                                 frames_per_buffer=FRAMES_PER_BUFFER, stream_callback=self._callback)
+            except OSError as error:
+                logger.error(f"Unable to open the output stream: {error}")
+                self.stream = None
+            return self.stream is not None
+
+    def _callback(self, in_data: None, frame_count: int, time_info: dict, status: int) -> Tuple[bytes, int]:
+        """Mixes the next chunk of every active voice, called by the stream whenever it needs audio.
+
+        Args:
+            in_data: Input audio, ``None`` for an output stream.
+            frame_count: Number of frames requested.
+            time_info: Timing information of the stream.
+            status: Status flags of the stream.
+
+        Returns:
+            tuple:
+            Mixed audio and the flag to continue the stream.
+        """
+        size = frame_count * CHANNELS
+        with self._lock:
+            if not self.voices:
+                return bytes(size * 2), pyaudio.paContinue
+            mixed = numpy.zeros(size, dtype=numpy.int32)
+            active = []
+            for samples, position, done in self.voices:
+                chunk = samples[position[0]:position[0] + size]
+                mixed[:len(chunk)] += chunk
+                position[0] += size
+                if position[0] < len(samples):
+                    active.append((samples, position, done))
+                else:
+                    done.set()
+            self.voices = active
+        return numpy.clip(mixed, -32_768, 32_767).astype(numpy.int16).tobytes(), pyaudio.paContinue
+
+    def play(self, sound: Union[FilePath, str], block: bool = False) -> NoReturn:
+        """Plays a sound.
+
+        Args:
+            sound: Audio file.
+            block: Boolean flag to wait until the sound is played.
+        """
+        if sound not in self.sounds or not self.stream:
+            Thread(target=self.prepare, args=(sound,), daemon=True).start()
+            playsound(sound=sound, block=block)
+            return
+        if (samples := self.sounds[sound]) is None:
+            playsound(sound=sound, block=block)
+            return
+        done = Event()
+        with self._lock:
+            self.voices.append((samples, [0], done))
+        if block:
+            done.wait(timeout=len(samples) / CHANNELS / RATE + 1)
+
+    def close(self) -> NoReturn:
+        """Closes the output stream and releases the audio device."""
+        with self._lock:
+            stream, py_audio = self.stream, self.py_audio
+            self.stream, self.py_audio = None, None
+            for _, _, done in self.voices:
+                done.set()
+            self.voices = []
+        if stream:  # stopped outside the lock, since stopping waits for the callback to return
+            stream.stop_stream()
+            stream.close()
+        if py_audio:
+            py_audio.terminate()
+
+
+mixer = Mixer()
+
+
+def play(sound: Union[FilePath, str], block: bool = False) -> NoReturn:
+    """Plays a sound through the mixer.
+
+    Args:
+        sound: Audio file.
+        block: Boolean flag to wait until the sound is played.
+    """
+    mixer.play(sound=sound, block=block)
@@ -4,28 +4,78 @@
 >>> Speaker
 
 """
-import os
+import heapq
+import itertools
 import re
 import sys
+from concurrent.futures import Future
 from datetime import datetime
-from threading import Thread
-from typing import NoReturn, Union
+from enum import IntEnum
+from queue import Queue
+from threading import Condition, Event, Thread, current_thread
+from typing import Any, Callable, List, NoReturn, Tuple, Union
 
 import pyttsx3
-import requests
-import yaml
-from playsound import playsound
+from pyttsx3.engine import Engine
 
 from executors.logger import logger
+from modules.audio import backends, cache
+from modules.audio.player import Player
 from modules.conditions import conversation, keywords
 from modules.models import models
-from modules.utils import shared
+from modules.utils import shared, usage
 
-audio_driver = pyttsx3.init()
+if not models.settings.macos:
+    # noinspection PyUnresolvedReferences,PyPackageRequirements
+    import pythoncom
+
+player = Player()
 
 KEYWORDS = [__keyword for __keyword in dir(keywords) if not __keyword.startswith('__')]
 CONVERSATION = [__conversation for __conversation in dir(conversation) if not __conversation.startswith('__')]
-FUNCTIONS_TO_TRACK = KEYWORDS + CONVERSATION
+FUNCTIONS_TO_TRACK = frozenset(KEYWORDS + CONVERSATION)
+
+
+def normalize(text: str) -> str:
+    """Converts the time and IP address in a text to a format that sounds natural after speech synthesis.
+
+    Args:
+        text: Text that has to be normalized.
+
+    Returns:
+        str:
+        Normalized text.
+    """
+    if time_in_str := re.findall(r'(\d+:\d+\s?(?:AM|PM|am|pm:?))', text):
+        for t_12 in time_in_str:
+            t_24 = datetime.strftime(datetime.strptime(t_12, "%I:%M %p"), "%H:%M")
+            logger.info(f"Converted {t_12} -> {t_24}")
+            text = text.replace(t_12, t_24)
+    if 'IP' in text.split():
+        ip_new = '-'.join([i for i in text.split(' ')[-1]]).replace('-.-', ', ')  # 192.168.1.1 -> 1-9-2, 1-6-8, 1, 1
+        text = text.replace(text.split(' ')[-1], ip_new).replace(' IP ', ' I.P. ')
+    return text
+
+
+def synthesize(text: str, timeout: Union[int, float], quality: str, voice: str) -> Union[bytes, None]:
+    """Gets the audio for a text from the speech synthesis cache or the least loaded healthy backend.
+
+    Args:
+        text: Normalized text that has to be converted to audio.
+        timeout: Time to wait for the docker image to process text-to-speech request.
+        quality: Quality at which the conversion is to be done.
+        voice: Voice for speech synthesis.
+
+    Returns:
+        bytes:
+        Content of the wav file.
+    """
+    if cached := cache.speech_cache.get(text=text, voice=voice, quality=quality):
+        with open(cached, 'rb') as file:
+            return file.read()
+    if content := backends.pool.synthesize(text=text, timeout=timeout, quality=quality, voice=voice):
+        cache.speech_cache.put(text=text, voice=voice, quality=quality, content=content)
+        return content
 
 
 def speech_synthesizer(text: str, timeout: Union[int, float] = models.env.speech_synthesis_timeout,
@@ -41,89 +91,336 @@ def speech_synthesizer(text: str, timeout: Union[int, float] = models.env.speech
     Returns:
         bool:
         A boolean flag to indicate whether speech synthesis has worked.
+
+    See Also:
+        - Audio is looked up in the speech synthesis cache first, to skip the round trip to the docker container.
     """
     logger.info(f"Request for speech synthesis: {text}")
-    if time_in_str := re.findall(r'(\d+:\d+\s?(?:AM|PM|am|pm:?))', text):
-        for t_12 in time_in_str:
-            t_24 = datetime.strftime(datetime.strptime(t_12, "%I:%M %p"), "%H:%M")
-            logger.info(f"Converted {t_12} -> {t_24}")
-            text = text.replace(t_12, t_24)
-    if 'IP' in text.split():
-        ip_new = '-'.join([i for i in text.split(' ')[-1]]).replace('-.-', ', ')  # 192.168.1.1 -> 1-9-2, 1-6-8, 1, 1
-        text = text.replace(text.split(' ')[-1], ip_new).replace(' IP ', ' I.P. ')
-    try:
-        response = requests.post(
-            url=f"http://{models.env.speech_synthesis_host}:{models.env.speech_synthesis_port}/api/tts",
-            headers={"Content-Type": "text/plain"}, params={"voice": voice, "quality": quality}, data=text,
-            verify=False, timeout=timeout
-        )
-        if response.ok:
-            with open(file=models.fileio.speech_synthesis_wav, mode="wb") as file:
-                file.write(response.content)
-            return True
-        logger.error(f"{response.status_code}::"
-                     f"http://{models.env.speech_synthesis_host}:{models.env.speech_synthesis_port}/api/tts")
-        return False
-    except UnicodeError as error:
-        logger.error(error)
-    except (ConnectionError, TimeoutError, requests.exceptions.RequestException, requests.exceptions.Timeout) as error:
-        logger.error(error)
-        logger.info("Disabling speech synthesis")
-        models.env.speech_synthesis_timeout = 0
-
-
-def speak(text: str = None, run: bool = False, block: bool = True) -> NoReturn:
-    """Calls ``audio_driver.say`` to speak a statement from the received text.
+    if content := synthesize(text=normalize(text=text), timeout=timeout, quality=quality, voice=voice):
+        with open(file=models.fileio.speech_synthesis_wav, mode="wb") as file:
+            file.write(content)
+        return True
+    return False
+
+
+def sentences(text: str, min_length: int = 20) -> List[str]:
+    """Splits text into sentences, merging the short ones with the next so that each request is worth a round trip.
 
     Args:
-        text: Takes the text that has to be spoken as an argument.
-        run: Takes a boolean flag to choose whether to run the ``audio_driver.say`` loop.
-        block: Takes a boolean flag to wait other tasks while speaking. [Applies only for larynx running on docker]
+        text: Text that has to be split.
+        min_length: Minimum number of characters in a sentence.
+
+    Returns:
+        list:
+        List of sentences.
     """
-    caller = sys._getframe(1).f_code.co_name  # noqa
-    if text:
-        text = text.replace('\n', '\t').strip()
-        shared.text_spoken = text
-        if shared.called_by_offline:
-            shared.offline_caller = caller
-            return
-        logger.info(f'Speaker called by: {caller}')
-        logger.info(f'Response: {text}')
-        sys.stdout.write(f"\r{text}")
-        if models.env.speech_synthesis_timeout and \
-                speech_synthesizer(text=text) and \
-                os.path.isfile(models.fileio.speech_synthesis_wav):
-            playsound(sound=models.fileio.speech_synthesis_wav, block=block)
-            os.remove(models.fileio.speech_synthesis_wav)
+    split, buffer = [], ""
+    for sentence in re.split(r'(?<=[.!?;])\s+', text.strip()):
+        buffer = f"{buffer} {sentence}".strip()
+        if len(buffer) >= min_length:
+            split.append(buffer)
+            buffer = ""
+    if buffer:
+        if split:
+            split[-1] = f"{split[-1]} {buffer}"
         else:
-            audio_driver.say(text=text)
-    if run:
-        audio_driver.runAndWait()
-    Thread(target=frequently_used, kwargs={"function_name": caller}).start() if caller in FUNCTIONS_TO_TRACK else None
+            split.append(buffer)
+    return split
 
 
-def frequently_used(function_name: str) -> NoReturn:
-    """Writes the function called and the number of times into a yaml file.
+def stream_synthesizer(text: str, timeout: Union[int, float] = models.env.speech_synthesis_timeout,
+                       quality: str = "high", voice: str = "en-us_northern_english_male-glow_tts",
+                       interrupt: Event = None) -> str:
+    """Synthesizes the next sentence while the current one is being played from memory.
 
     Args:
-        function_name: Name of the function that called the speaker.
+        text: Takes the text that has to be spoken as an argument.
+        timeout: Time to wait for the docker image to process text-to-speech request.
+        quality: Quality at which the conversion is to be done.
+        voice: Voice for speech synthesis.
+        interrupt: Event that stops the playback when set.
+
+    Returns:
+        str:
+        Part of the text that could not be synthesized, to be spoken by the default audio driver.
+
+    See Also:
+        - Time to the first audio is the time taken to synthesize the first sentence, instead of the whole text.
+        - The queue holds one sentence ahead of the one being played, so synthesis never runs too far ahead.
+    """
+    logger.info(f"Request for streaming speech synthesis: {text}")
+    split = sentences(text=normalize(text=text))
+    queue = Queue(maxsize=1)
+
+    def producer() -> NoReturn:
+        """Synthesizes each sentence and hands it over to the player, stopping at the first failure."""
+        for sentence in split:
+            if interrupt and interrupt.is_set():
+                break
+            if not (content := synthesize(text=sentence, timeout=timeout, quality=quality, voice=voice)):
+                break
+            queue.put(content)
+        queue.put(None)
+
+    Thread(target=producer, daemon=True).start()
+    played = 0
+    while (content := queue.get()) and player.play(content=content, interrupt=interrupt):
+        played += 1
+    while content is not None:  # unblocks the producer if playback failed
+        content = queue.get()
+    return " ".join(split[played:])
+
+
+class Priority(IntEnum):
+    """Priorities of the speech output, lower values are spoken first.
+
+    >>> Priority
+
+    """
+
+    ALERT = 0
+    RESPONSE = 1
+    REPORT = 2
+
+
+class Utterance:
+    """Text waiting to be spoken.
+
+    >>> Utterance
+
+    """
+
+    def __init__(self, text: str, priority: Priority, sequence: int):
+        """Instantiates the utterance.
+
+        Args:
+            text: Text that has to be spoken.
+            priority: Priority of the text.
+            sequence: Order in which the text was received.
+        """
+        self.text = text
+        self.priority = priority
+        self.sequence = sequence
+        self.done = Event()
+
+    def __lt__(self, other: 'Utterance') -> bool:
+        """Orders the utterances by priority, and by the order in which they were received."""
+        return (self.priority, self.sequence) < (other.priority, other.sequence)
+
+
+class SpeechQueue(Thread):
+    """Speaks the queued text in a dedicated thread, so that the callers can continue working while audio plays.
+
+    >>> SpeechQueue
 
     See Also:
-        - This function does not have purpose, but to analyze and re-order the conditions' module at a later time.
+        - Text with a higher priority interrupts the text being spoken, which is spoken again after it.
+        - Cancelling stops the text being spoken and discards the rest of the queue (eg: when the wake word is heard).
+        - Speech synthesis is streamed one sentence at a time, so an interrupted text resumes from the same sentence.
+        - Falls back to the default audio driver, when speech synthesis is disabled or fails.
+        - The audio driver is created and used only in this thread, since neither SAPI5 nor NSSpeechSynthesizer can be
+          shared across threads. Other threads change its properties through ``call``
     """
-    if os.path.isfile(models.fileio.frequent):
+
+    def __init__(self):
+        """Instantiates the thread without starting it."""
+        super().__init__(daemon=True)
+        self.condition = Condition()
+        self.interrupt = Event()
+        self.queue: List[Utterance] = []
+        self.current: Union[Utterance, None] = None
+        self.counter = itertools.count()
+        self.commands: List[Tuple[Callable[[Engine], Any], Future]] = []
+        self.driver: Union[Engine, None] = None
+
+    def put(self, text: str, priority: Priority = Priority.RESPONSE) -> Utterance:
+        """Queues a text to be spoken, starting the thread on first use.
+
+        Args:
+            text: Text that has to be spoken.
+            priority: Priority of the text.
+
+        Returns:
+            Utterance:
+            Utterance whose ``done`` event is set once the text is spoken or cancelled.
+        """
+        utterance = Utterance(text=text, priority=priority, sequence=next(self.counter))
+        with self.condition:
+            if not self.is_alive():
+                self.start()
+            heapq.heappush(self.queue, utterance)
+            if self.current and utterance < self.current:
+                logger.info(f"Interrupting {self.current.priority.name} speech for {priority.name} speech")
+                self._stop_current()
+            self.condition.notify_all()
+        return utterance
+
+    def call(self, function: Callable[[Engine], Any]) -> Any:
+        """Runs a function with the audio driver in this thread, and waits for it to return.
+
+        Args:
+            function: Function that receives the audio driver (eg: to get or set its properties).
+
+        Raises:
+            RuntimeError:
+            If the audio driver could not be created.
+
+        Returns:
+            Any:
+            Value returned by the function.
+
+        See Also:
+            - The function runs before the next text in the queue, but never while a text is being spoken.
+        """
+        if current_thread() is self:
+            return function(self.driver)
+        future = Future()
+        with self.condition:
+            if not self.is_alive():
+                self.start()
+            self.commands.append((function, future))
+            self.condition.notify_all()
+        return future.result()
+
+    def _stop_current(self) -> NoReturn:
+        """Stops the text being spoken, the audio driver stops itself at the next word, refer ``_on_word``"""
+        self.interrupt.set()
+
+    def _on_word(self, name: str, location: int, length: int) -> NoReturn:
+        """Callback from the audio driver before each word, which stops the driver from its own thread if interrupted.
+
+        Args:
+            name: Name of the utterance.
+            location: Position of the word in the text.
+            length: Length of the word.
+        """
+        if self.interrupt.is_set():
+            self.driver.stop()
+
+    def cancel(self) -> NoReturn:
+        """Stops the text being spoken and discards the queue."""
+        with self.condition:
+            for utterance in self.queue:
+                utterance.done.set()
+            self.queue.clear()
+            if self.current:
+                self.current.text = ""
+                self._stop_current()
+            self.condition.notify_all()
+
+    def wait(self) -> NoReturn:
+        """Blocks until every queued text is spoken or cancelled."""
+        with self.condition:
+            while self.queue or self.current:
+                self.condition.wait()
+
+    def _speak(self, text: str) -> str:
+        """Speaks a text using speech synthesis if available, or the default audio driver.
+
+        Args:
+            text: Text that has to be spoken.
+
+        Returns:
+            str:
+            Part of the text that was not spoken due to an interruption.
+        """
+        if models.env.speech_synthesis_timeout and models.env.speech_synthesis_stream:
+            remaining = stream_synthesizer(text=text, interrupt=self.interrupt)
+            if self.interrupt.is_set():
+                return remaining
+            text = remaining
+        elif models.env.speech_synthesis_timeout and \
+                (content := synthesize(text=normalize(text=text), timeout=models.env.speech_synthesis_timeout,
+                                       quality="high", voice="en-us_northern_english_male-glow_tts")):
+            if player.play(content=content, interrupt=self.interrupt) or not self.interrupt.is_set():
+                return ""
+            return text
+        if text and self.driver and not self.interrupt.is_set():
+            self.driver.say(text=text)
+            self.driver.runAndWait()
+            if self.interrupt.is_set():  # the audio driver does not report where it stopped
+                return text
+        return ""
+
+    def _execute(self, commands: List[Tuple[Callable[[Engine], Any], Future]]) -> NoReturn:
+        """Runs the functions received through ``call`` with the audio driver.
+
+        Args:
+            commands: Functions and the futures that receive their results.
+        """
+        for function, future in commands:
+            if not self.driver:
+                future.set_exception(RuntimeError("Audio driver is not available."))
+                continue
+            try:
+                future.set_result(function(self.driver))
+            except Exception as error:
+                future.set_exception(error)
+
+    def run(self) -> NoReturn:
+        """Creates the audio driver, and speaks the queued text in the order of priority."""
         try:
-            with open(models.fileio.frequent) as file:
-                data = yaml.load(stream=file, Loader=yaml.FullLoader) or {}
-        except yaml.YAMLError as error:
-            data = {}
-            logger.error(error)
-        if data.get(function_name):
-            data[function_name] += 1
-        else:
-            data[function_name] = 1
-    else:
-        data = {function_name: 1}
-    with open(models.fileio.frequent, 'w') as file:
-        yaml.dump(data={k: v for k, v in sorted(data.items(), key=lambda x: x[1], reverse=True)},
-                  stream=file, sort_keys=False)
+            if not models.settings.macos:
+                pythoncom.CoInitialize()  # SAPI5 is a COM object, which needs COM to be initialized in each thread
+            self.driver = pyttsx3.init()
+            self.driver.connect(topic='started-word', cb=self._on_word)
+        except Exception as error:  # speech synthesis can still be used without the audio driver
+            logger.error(f"Unable to load the audio driver: {error}")
+        while True:
+            with self.condition:
+                while not self.queue and not self.commands:
+                    player.close()  # releases the audio device while idle
+                    self.condition.wait()
+                commands, self.commands = self.commands, []
+                if not commands:
+                    self.current = heapq.heappop(self.queue)
+                    self.interrupt.clear()
+            if commands:
+                self._execute(commands=commands)
+                continue
+            try:
+                remaining = self._speak(text=self.current.text)
+            except RuntimeError as error:  # raised by the audio driver, when its loop is already running
+                logger.error(error)
+                remaining = ""
+            with self.condition:
+                if remaining and self.current.text:  # interrupted by a higher priority text
+                    self.current.text = remaining
+                    heapq.heappush(self.queue, self.current)
+                else:
+                    self.current.done.set()
+                self.current = None
+                self.condition.notify_all()
+
+
+output = SpeechQueue()
+
+
+def speak(text: str = None, run: bool = False, block: bool = False,
+          priority: Priority = Priority.RESPONSE) -> NoReturn:
+    """Queues a statement to be spoken from the received text.
+
+    Args:
+        text: Takes the text that has to be spoken as an argument.
+        run: Takes a boolean flag to wait until everything that was queued is spoken.
+        block: Takes a boolean flag to wait until the text is spoken.
+        priority: Priority of the text. ``ALERT`` interrupts responses, which in turn interrupt reports.
+
+    See Also:
+        - Text is spoken in a dedicated thread, so the callers can fetch the next piece of information while the
+          current one is being spoken. Use ``run`` before listening for a reply, so that the mic does not hear Jarvis.
+    """
+    caller = sys._getframe(1).f_code.co_name  # noqa
+    if text:
+        text = text.replace('\n', '\t').strip()
+        shared.text_spoken.set(text)
+        if shared.called_by_offline.get():
+            return
+        logger.info(f'Speaker called by: {caller}')
+        logger.info(f'Response: {text}')
+        sys.stdout.write(f"\r{text}")
+        utterance = output.put(text=text, priority=priority)
+        utterance.done.wait() if block else None
+    if run:
+        output.wait()
+    usage.counter.increment(name=caller) if caller in FUNCTIONS_TO_TRACK else None
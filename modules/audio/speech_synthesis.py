@@ -7,60 +7,111 @@
 
 import os
 import pathlib
-from typing import NoReturn
+from threading import Thread
+from typing import NoReturn, TextIO
 
 import docker
 import requests
+from docker.models.containers import Container
 
 from executors.logger import logger
 from executors.port_handler import is_port_in_use, kill_port_pid
+from modules.audio import backends, cache
+from modules.conditions import conversation
 from modules.models import models
 
 
-def check_existing() -> bool:
+def check_existing(port: int) -> bool:
     """Checks for existing connection.
 
+    Args:
+        port: Port of the container.
+
     Returns:
         bool:
         A boolean flag whether a valid connection is present.
     """
-    if is_port_in_use(port=models.env.speech_synthesis_port):
-        logger.info(f'{models.env.speech_synthesis_port} is currently in use.')
+    if is_port_in_use(port=port):
+        logger.info(f'{port} is currently in use.')
         try:
-            res = requests.get(url=f"http://{models.env.speech_synthesis_host}:{models.env.speech_synthesis_port}",
-                               timeout=1)
+            res = requests.get(url=f"http://{models.env.speech_synthesis_host}:{port}", timeout=1)
             if res.ok:
-                logger.info(f'http://{models.env.speech_synthesis_host}:{models.env.speech_synthesis_port} '
-                            'is accessible.')
+                logger.info(f'http://{models.env.speech_synthesis_host}:{port} is accessible.')
                 return True
             return False
         except (ConnectionError, TimeoutError, requests.exceptions.RequestException, requests.exceptions.Timeout) as \
                 error:
             logger.error(error)
-            if not kill_port_pid(port=models.env.speech_synthesis_port):
+            if not kill_port_pid(port=port):
                 logger.critical('Failed to kill existing PID. Attempting to re-create session.')
 
 
+def prewarm(quality: str = "high", voice: str = backends.VOICE) -> NoReturn:
+    """Synthesizes the static conversation phrases into the speech synthesis cache once a backend is ready.
+
+    Args:
+        quality: Quality at which the conversion is to be done.
+        voice: Voice for speech synthesis.
+    """
+    if not backends.pool.wait(timeout=60):
+        logger.error("No speech synthesis backend is ready, skipping pre-warm.")
+        return
+    phrases = conversation.wake_up1 + conversation.wake_up2 + conversation.wake_up3 + conversation.acknowledgement
+    for phrase in phrases:
+        key = cache.speech_cache.key(text=phrase, voice=voice, quality=quality)
+        if os.path.isfile(cache.speech_cache.filepath(key=key)):
+            continue
+        if not (content := backends.pool.synthesize(text=phrase, timeout=30, quality=quality, voice=voice)):
+            return
+        cache.speech_cache.put(text=phrase, voice=voice, quality=quality, content=content)
+    logger.info(f"Speech synthesis cache has been pre-warmed: {cache.speech_cache.stats()}")
+
+
+def stream_logs(container: Container, log_file: TextIO) -> NoReturn:
+    """Writes the logs of a container into the log file, until the container stops.
+
+    Args:
+        container: Docker container.
+        log_file: Log file.
+    """
+    for line in container.logs(stream=True):
+        log_file.write(str(line).strip())
+
+
 def synthesizer() -> NoReturn:
-    """Initiates speech synthesizer using docker."""
-    if check_existing():
+    """Initiates speech synthesizers using docker, one container for each port starting at ``SPEECH_SYNTHESIS_PORT``.
+
+    See Also:
+        - Containers that are already running on a port are reused.
+        - Health checks and warm-up of each container are done by the backend pool in the processes that speak.
+    """
+    warm = models.env.speech_synthesis_prewarm and models.env.speech_synthesis_cache
+    ports = [port for port in range(models.env.speech_synthesis_port,
+                                    models.env.speech_synthesis_port + models.env.speech_synthesis_containers)
+             if not check_existing(port=port)]
+    if not ports:
+        prewarm() if warm else None
         return
     if not os.path.isfile(models.fileio.speech_synthesis_log):
         pathlib.Path(models.fileio.speech_synthesis_log).touch()
     with open(models.fileio.speech_synthesis_log, "a") as log_file:
         try:
             client = docker.from_env()
-            result = client.containers.run(
-                image="rhasspy/larynx",
-                ports={f"{models.env.speech_synthesis_port}/tcp": models.env.speech_synthesis_port},
-                environment=[f"HOME={models.env.home}"],
-                volumes={models.env.home: {"bind": models.env.home, "mode": "rw"}},
-                working_dir=os.getcwd(),
-                user=f"{os.getuid()}:{os.getgid()}", detach=True
-            )
-            container = client.containers.get(container_id=result.short_id)
-            for line in container.logs(stream=True):
-                log_file.write(str(line).strip())
+            containers = []
+            for port in ports:
+                result = client.containers.run(
+                    image="rhasspy/larynx",
+                    ports={f"{port}/tcp": port},
+                    environment=[f"HOME={models.env.home}"],
+                    volumes={models.env.home: {"bind": models.env.home, "mode": "rw"}},
+                    working_dir=os.getcwd(),
+                    user=f"{os.getuid()}:{os.getgid()}", detach=True
+                )
+                containers.append(client.containers.get(container_id=result.short_id))
+            Thread(target=prewarm, daemon=True).start() if warm else None
+            for container in containers[1:]:
+                Thread(target=stream_logs, kwargs={'container': container, 'log_file': log_file}, daemon=True).start()
+            stream_logs(container=containers[0], log_file=log_file)
         except Exception as error:
             log_file.write(str(error))
             models.env.speech_synthesis_timeout = 0
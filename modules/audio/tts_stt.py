@@ -5,63 +5,139 @@
 
 """
 
+import atexit
+import io
 import os
-import time
-from multiprocessing import Process
+import tempfile
+from multiprocessing import TimeoutError
+from multiprocessing.pool import Pool
+from threading import Lock
 from typing import NoReturn, Union
 
+import pyttsx3
 import soundfile
 from pydantic import FilePath
+from pyttsx3.engine import Engine
 from speech_recognition import AudioFile, Recognizer, UnknownValueError
 
 from executors.logger import logger
 from modules.audio import voices
-from modules.utils import shared
+from modules.audio.recognizer import load_engine
+from modules.models import models
 
 recognizer = Recognizer()
 
-audio_driver = voices.voice_default()
+audio_driver: Union[Engine, None] = None  # loaded in each worker process, refer ``_load_driver``
 
 
-def _generate_audio_file(filename: Union[FilePath, str], text: str) -> NoReturn:
-    """Generates an audio file from text.
+def _load_driver() -> NoReturn:
+    """Loads the speech engine of a worker process with the default voice, when the worker starts."""
+    global audio_driver
+    audio_driver = voices.voice_default(driver=pyttsx3.init())
+
+
+def _generate_audio(text: str) -> bytes:
+    """Generates wav content from text, using the speech engine of the worker process.
 
     Args:
-        filename: Filename to be generated.
         text: Text that has to be converted into audio.
+
+    See Also:
+        - The speech engine can only save to a file, so the file is read back and removed within the worker.
+        - Audio that is not saved as wav (eg: aiff on macOS) is converted in memory.
+
+    Returns:
+        bytes:
+        Content of a wav file.
     """
-    logger.info(f"Generating audio into {filename} from the text: {text}")
+    filename = os.path.join(tempfile.gettempdir(), f"text_to_audio_{os.getpid()}.wav")
     audio_driver.save_to_file(filename=filename, text=text)
     audio_driver.runAndWait()
+    with open(filename, 'rb') as file:
+        content = file.read()
+    os.remove(filename)
+    if content.startswith(b'RIFF'):
+        return content
+    data, samplerate = soundfile.read(file=io.BytesIO(content))
+    buffer = io.BytesIO()
+    soundfile.write(file=buffer, data=data, samplerate=samplerate, format='WAV')
+    return buffer.getvalue()
+
 
+class Synthesizer:
+    """Converts text to audio in a bounded pool of worker processes, each of which keeps its speech engine loaded.
 
-def text_to_audio(text: str, filename: Union[FilePath, str] = None) -> Union[FilePath, str]:
-    """Converts text into an audio file.
+    >>> Synthesizer
+
+    See Also:
+        - Workers are started on first use, and reused for every conversion until the process exits.
+        - Completion is signalled by the pool, so the caller waits without polling the file system.
+    """
+
+    def __init__(self, workers: int, timeout: Union[int, float] = 30):
+        """Instantiates the synthesizer without starting the workers.
+
+        Args:
+            workers: Number of worker processes.
+            timeout: Seconds to wait for a conversion.
+        """
+        self.workers = workers
+        self.timeout = timeout
+        self._pool: Union[Pool, None] = None
+        self._lock = Lock()
+        atexit.register(self.stop)
+
+    def convert(self, text: str) -> Union[bytes, None]:
+        """Converts text into wav content.
+
+        Args:
+            text: Text that has to be converted to audio.
+
+        Returns:
+            bytes:
+            Content of a wav file.
+        """
+        with self._lock:
+            if self._pool is None:
+                self._pool = Pool(processes=self.workers, initializer=_load_driver)
+        logger.info(f"Generating audio from the text: {text}")
+        try:
+            content = self._pool.apply_async(func=_generate_audio, kwds={'text': text}).get(timeout=self.timeout)
+        except TimeoutError:
+            logger.error(f"Unable to generate audio within {self.timeout}s")
+            return
+        except (OSError, RuntimeError) as error:
+            logger.error(error)
+            return
+        logger.info(f"Generated {len(content)} bytes of audio")
+        return content
+
+    def stop(self) -> NoReturn:
+        """Terminates the worker processes."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.terminate()
+                self._pool = None
+
+
+synthesizer = Synthesizer(workers=models.env.text_to_audio_workers)
+
+
+def text_to_audio(text: str) -> Union[bytes, None]:
+    """Converts text into audio.
 
     Args:
-        filename: Name of the file that has to be generated.
         text: Text that has to be converted to audio.
+
+    Returns:
+        bytes:
+        Content of a wav file.
     """
-    if not filename:
-        if shared.offline_caller:
-            filename = f"{shared.offline_caller}.wav"
-            shared.offline_caller = None  # Reset caller after using it
-        else:
-            filename = f"{int(time.time())}.wav"
-    process = Process(target=_generate_audio_file, kwargs={'filename': filename, 'text': text})
-    process.start()
-    while True:
-        if os.path.isfile(filename) and os.stat(filename).st_size:
-            time.sleep(0.5)
-            break
-    logger.info(f"Generated {filename}")
-    data, samplerate = soundfile.read(file=filename)
-    soundfile.write(file=filename, data=data, samplerate=samplerate)
-    return filename
+    return synthesizer.convert(text=text)
 
 
 def audio_to_text(filename: Union[FilePath, str]) -> str:
-    """Converts audio to text using speech recognition.
+    """Converts audio to text using the speech to text engine set in ``RECOGNIZER``.
 
     Args:
         filename: Filename to process the information from.
@@ -75,6 +151,6 @@ def audio_to_text(filename: Union[FilePath, str]) -> str:
         with file as source:
             audio = recognizer.record(source)
         os.remove(filename)
-        return recognizer.recognize_google(audio)
+        return load_engine().recognize(audio=audio)
     except UnknownValueError:
         logger.error("Unrecognized audio or language.")
@@ -0,0 +1,194 @@
+# noinspection PyUnresolvedReferences
+"""Module for voice activity detection that ends the capture of a phrase as soon as the speaker stops talking.
+
+>>> VAD
+
+"""
+
+import math
+import statistics
+from collections import deque
+from threading import Lock
+from typing import Deque, Dict, List, Union
+
+import numpy
+from speech_recognition import AudioData, AudioSource, WaitTimeoutError
+
+from executors.logger import logger
+from modules.audio.recognizer import Stream
+from modules.models import models
+
+
+class Endpointer:
+    """Captures a phrase using the energy of each frame against a noise floor that is estimated continuously.
+
+    >>> Endpointer
+
+    See Also:
+        - The noise floor is tracked from every frame that is not speech, and is retained across phrases.
+        - The floor also rises slowly towards the quietest frame of the past ``window`` seconds, so that it follows a
+          sustained rise in the background noise that is loud enough to be mistaken for speech.
+        - A frame is speech when its energy exceeds the noise floor by ``ratio``, or ``min_energy`` whichever is higher.
+        - Speech starts after ``start_duration`` seconds of speech, and the frames just before it are included.
+        - Capture ends once ``silence`` seconds of non-speech follow the speech, or when the phrase limit is reached.
+    """
+
+    def __init__(self, silence: Union[int, float], ratio: float = 3.0, min_energy: float = 150.0,
+                 start_duration: float = 0.1, padding: float = 0.3, window: float = 2.0):
+        """Instantiates the endpointer.
+
+        Args:
+            silence: Seconds of trailing silence after which the capture ends.
+            ratio: Ratio of the energy of speech to the noise floor.
+            min_energy: Minimum energy (RMS) of a frame to be considered speech.
+            start_duration: Seconds of consecutive speech frames that mark the start of a phrase.
+            padding: Seconds of audio before the start of the phrase that are included.
+            window: Seconds of recent frames, whose quietest frame the noise floor rises towards.
+        """
+        self.silence = silence
+        self.ratio = ratio
+        self.min_energy = min_energy
+        self.start_duration = start_duration
+        self.padding = padding
+        self.window = window
+        self.noise_floor = 100.0  # threshold starts at 300, which is the default energy threshold of speech_recognition
+
+    @property
+    def threshold(self) -> float:
+        """Energy above which a frame is considered speech."""
+        return max(self.noise_floor * self.ratio, self.min_energy)
+
+    @staticmethod
+    def energy(frame: bytes) -> float:
+        """Computes the energy (RMS) of a frame of 16-bit PCM audio.
+
+        Args:
+            frame: Frame of audio.
+
+        Returns:
+            float:
+            Root mean square of the samples.
+        """
+        samples = numpy.frombuffer(frame, dtype=numpy.int16).astype(numpy.float32)
+        return math.sqrt(float(numpy.dot(samples, samples)) / len(samples)) if len(samples) else 0.0
+
+    def track(self, energy: float, recent: Deque[float]) -> None:
+        """Raises the noise floor slowly when even the quietest of the recent frames is louder than the floor.
+
+        Args:
+            energy: Energy of the latest frame.
+            recent: Energy of the recent frames, with the length of ``window``.
+        """
+        recent.append(energy)
+        # speech has pauses in between words, so only a sustained rise in noise lifts every frame within the window
+        if len(recent) == recent.maxlen and (quietest := min(recent)) > self.noise_floor:
+            self.noise_floor = self.noise_floor * 0.98 + quietest * 0.02
+
+    def listen(self, source: AudioSource, timeout: Union[int, float],
+               phrase_limit: Union[int, float], stream: Stream = None) -> AudioData:
+        """Captures a phrase from the source.
+
+        Args:
+            source: Audio source that is already entered.
+            timeout: Seconds to wait for the speech to start.
+            phrase_limit: Maximum seconds of speech.
+            stream: Stream of a speech to text engine that receives each frame of the phrase as it is captured.
+
+        Raises:
+            WaitTimeoutError:
+            If the speech does not start within the timeout.
+
+        Returns:
+            AudioData:
+            Audio of the phrase.
+        """
+        frame_duration = source.CHUNK / source.SAMPLE_RATE
+        start_frames = max(math.ceil(self.start_duration / frame_duration), 1)
+        silence_frames = max(math.ceil(self.silence / frame_duration), 1)
+        padding: Deque[bytes] = deque(maxlen=math.ceil(self.padding / frame_duration) + start_frames)
+        recent: Deque[float] = deque(maxlen=max(math.ceil(self.window / frame_duration), 1))
+        waited, streak = 0.0, 0
+        while True:  # waits for the speech to start
+            if waited > timeout:
+                raise WaitTimeoutError("listening timed out while waiting for phrase to start")
+            frame = source.stream.read(source.CHUNK)
+            waited += frame_duration
+            padding.append(frame)
+            energy = self.energy(frame=frame)
+            self.track(energy=energy, recent=recent)
+            if energy > self.threshold:
+                streak += 1
+                if streak >= start_frames:
+                    break
+            else:
+                streak = 0
+                # rises slowly and falls quickly, so that a burst of noise does not raise the floor
+                self.noise_floor = self.noise_floor * (0.95 if energy > self.noise_floor else 0.7) + \
+                    energy * (0.05 if energy > self.noise_floor else 0.3)
+        frames: List[bytes] = list(padding)
+        if stream:
+            for frame in frames:
+                stream.feed(frame=frame)
+        spoken, quiet = start_frames * frame_duration, 0
+        while spoken < phrase_limit and quiet < silence_frames:
+            frame = source.stream.read(source.CHUNK)
+            frames.append(frame)
+            stream.feed(frame=frame) if stream else None
+            spoken += frame_duration
+            energy = self.energy(frame=frame)
+            self.track(energy=energy, recent=recent)
+            if energy > self.threshold:
+                quiet = 0
+            else:
+                quiet += 1
+                self.noise_floor = self.noise_floor * 0.95 + min(energy, self.noise_floor) * 0.05
+        logger.debug(f"Speech ended after {round(spoken, 2)}s, noise floor: {round(self.noise_floor, 2)}")
+        return AudioData(frame_data=b"".join(frames), sample_rate=source.SAMPLE_RATE,
+                         sample_width=source.SAMPLE_WIDTH)
+
+
+class CaptureStats:
+    """Keeps track of the time taken to capture each phrase, for every endpointing mode.
+
+    >>> CaptureStats
+
+    """
+
+    def __init__(self, size: int = 100):
+        """Instantiates the statistics.
+
+        Args:
+            size: Number of recent phrases retained for each mode.
+        """
+        self.size = size
+        self._durations: Dict[str, Deque[float]] = {}
+        self._lock = Lock()
+
+    def record(self, mode: str, duration: float, audio: float) -> None:
+        """Records the capture of a phrase.
+
+        Args:
+            mode: Endpointing mode.
+            duration: Seconds from the start of the listener until the end of capture.
+            audio: Seconds of audio captured.
+        """
+        with self._lock:
+            self._durations.setdefault(mode, deque(maxlen=self.size)).append(duration)
+        logger.info(f"Captured {round(audio, 2)}s of audio in {round(duration, 2)}s using {mode} endpointing. "
+                    f"Stats: {self.report().get(mode)}")
+
+    def report(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        """Summarizes the capture duration for each mode.
+
+        Returns:
+            dict:
+            Number of phrases along with the mean, median and maximum capture duration in seconds.
+        """
+        with self._lock:
+            return {mode: {"count": len(durations), "mean": round(statistics.mean(durations), 3),
+                           "median": round(statistics.median(durations), 3), "max": round(max(durations), 3)}
+                    for mode, durations in self._durations.items() if durations}
+
+
+endpointer = Endpointer(silence=models.env.listener_silence)
+capture_stats = CaptureStats()
@@ -19,16 +19,27 @@ from modules.conditions import conversation, keywords
 from modules.models import models
 
 
-def voice_default() -> Engine:
-    """Sets voice module to default."""
+def voice_default(driver: Engine = None) -> Engine:
+    """Sets voice module to default.
+
+    Args:
+        driver: Audio driver owned by the calling thread. Defaults to the speech queue's driver, which is changed in
+            the speech queue's thread.
+
+    Returns:
+        Engine:
+        Audio driver with the default voice.
+    """
+    if driver is None:
+        return speaker.output.call(function=voice_default)
     voice_model = "Daniel" if models.settings.macos else "David"
-    for voice in speaker.audio_driver.getProperty("voices"):
+    for voice in driver.getProperty("voices"):
         if voice.name == voice_model or voice_model in voice.name:
             if current_process().name == 'MainProcess':
                 logger.info(voice.__dict__)
-            speaker.audio_driver.setProperty("voice", voice.id)
+            driver.setProperty("voice", voice.id)
             break
-    return speaker.audio_driver
+    return driver
 
 
 def voice_changer(phrase: str = None) -> None:
@@ -41,14 +52,15 @@ def voice_changer(phrase: str = None) -> None:
         voice_default()
         return
 
-    voices: Union[list, object] = speaker.audio_driver.getProperty("voices")  # gets the list of voices available
+    # gets the list of voices available
+    voices: Union[list, object] = speaker.output.call(function=lambda driver: driver.getProperty("voices"))
 
     choices_to_say = ["My voice module has been reconfigured. Would you like me to retain this?",
                       "Here's an example of one of my other voices. Would you like me to use this one?",
                       "How about this one?"]
 
     for ind, voice in enumerate(voices):
-        speaker.audio_driver.setProperty("voice", voices[ind].id)
+        speaker.output.call(function=lambda driver: driver.setProperty("voice", voices[ind].id))
         speaker.speak(text=f"I am {voice.name} {models.env.title}!")
         sys.stdout.write(f"\rVoice module has been re-configured to {ind}::{voice.name}")
         if ind < len(choices_to_say):
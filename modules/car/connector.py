@@ -4,13 +4,17 @@ import json
 import os
 import time
 import urllib.error
-import urllib.request
 from typing import NoReturn, Union
 from uuid import UUID, uuid4
 
+import requests
+
 from executors.logger import logger
 
 
+client = requests.Session()
+
+
 def _open(url: str, headers: dict = None, data: dict = None) -> dict:
     """Open a connection to post the request.
 
@@ -22,21 +26,23 @@ def _open(url: str, headers: dict = None, data: dict = None) -> dict:
     Returns:
         dict:
         JSON loaded response from post request.
+
+    See Also:
+        - Uses a shared session, so that the connection to each host is kept alive across requests.
+        - Raises ``urllib.error.HTTPError`` for unsuccessful responses, to retain the existing error handling.
     """
-    request = urllib.request.Request(url=url, headers=headers)
     if data:
-        request.data = bytes(json.dumps(data), encoding="utf8")
-
-    response = urllib.request.build_opener().open(request)
+        response = client.post(url=url, headers=headers, data=json.dumps(data).encode("utf8"), timeout=30)
+    else:
+        response = client.get(url=url, headers=headers, timeout=30)
 
-    if not 200 <= response.code <= 300:
-        logger.debug(f'Response: {response.code}')
-        raise urllib.error.HTTPError(code=response.code, msg='HTTPError', url=url,
-                                     hdrs=response.headers, fp=response.fp)
+    if not 200 <= response.status_code <= 300:
+        logger.debug(f'Response: {response.status_code}')
+        raise urllib.error.HTTPError(code=response.status_code, msg=response.reason, url=url,
+                                     hdrs=response.headers, fp=None)
 
-    charset = response.info().get('charset', 'utf-8')
-    if resp_data := response.read().decode(charset):
-        return json.loads(resp_data)
+    if response.text:
+        return response.json()
 
 
 class Connect:
@@ -101,13 +107,64 @@ class Connect:
             dict:
             JSON loaded response from post request.
         """
-        if time.time() > self.expiration:
+        if self.expired:
             logger.debug('Authentication expired, reconnecting.')
-            self.connect()
+            self.reconnect()
             if headers['Authorization']:
                 headers['Authorization'] = self.head['Authorization']
         return _open(url=f"{url}/{command}", headers=headers, data=data)
 
+    @property
+    def expired(self) -> bool:
+        """Checks if the access token has expired or is about to expire within a minute.
+
+        Returns:
+            bool:
+            A boolean flag to indicate whether the tokens have to be refreshed.
+        """
+        return time.time() > self.expiration - 60
+
+    def reconnect(self) -> NoReturn:
+        """Refreshes the tokens if a refresh token is available, and falls back to a new login if that fails."""
+        if getattr(self, 'refresh_token', None):
+            try:
+                self.refresh_tokens()
+                return
+            except (urllib.error.HTTPError, requests.exceptions.RequestException) as error:
+                logger.error(f"Failed to refresh tokens: {error}")
+        self.connect()
+
+    def dump(self) -> dict:
+        """Gets the session state that is required to resume the connection without logging in.
+
+        Returns:
+            dict:
+            Tokens, expiration, device ID and user ID.
+        """
+        return {
+            "username": self.username,
+            "device_id": self.device_id,
+            "user_id": getattr(self, 'user_id', None),
+            "access_token": getattr(self, 'access_token', None),
+            "auth_token": getattr(self, 'auth_token', None),
+            "refresh_token": getattr(self, 'refresh_token', None),
+            "expiration": self.expiration
+        }
+
+    def load(self, state: dict) -> NoReturn:
+        """Resumes the connection from a session state created by ``dump``.
+
+        Args:
+            state: Session state.
+        """
+        self.device_id = state["device_id"]
+        self.user_id = state["user_id"]
+        self.access_token = state["access_token"]
+        self.auth_token = state["auth_token"]
+        self.refresh_token = state["refresh_token"]
+        self.expiration = state["expiration"]
+        self._set_header(access_token=self.access_token)
+
     def connect(self) -> NoReturn:
         """Authenticates device and establishes connection."""
         logger.debug("Connecting...")
@@ -0,0 +1,123 @@
+"""Module to cache the InControl session, so that car commands skip the login, registration and vehicle lookup."""
+
+import os
+import urllib.error
+from threading import Lock
+from typing import NoReturn, Tuple, Union
+
+import requests
+import yaml
+
+from executors.logger import logger
+from modules.car.connector import Connect
+from modules.models import models
+
+
+class Session:
+    """Holds an authenticated connection and the primary vehicle's VIN, persisted on disk across restarts.
+
+    >>> Session
+
+    See Also:
+        - The session is restored from disk only if it belongs to the same ``CAR_EMAIL``.
+        - Tokens are refreshed before they expire, and a new login is done only if the refresh fails.
+        - The file is readable and writable only by the owner, since it contains tokens.
+    """
+
+    def __init__(self, filepath: str):
+        """Instantiates the session without connecting.
+
+        Args:
+            filepath: File where the session state is stored.
+        """
+        self.filepath = filepath
+        self.connection: Union[Connect, None] = None
+        self.vin: Union[str, None] = None
+        self.brand: Union[str, None] = None
+        self._lock = Lock()
+
+    def get(self) -> Tuple[Union[Connect, None], Union[str, None]]:
+        """Gets an authenticated connection and the VIN of the primary vehicle.
+
+        Returns:
+            tuple:
+            Returns the connection object and the VIN.
+        """
+        with self._lock:
+            if not self.connection and not self._restore():
+                self._login()
+            elif self.connection.expired:
+                self.connection.reconnect()
+                self._save()
+            return self.connection, self.vin
+
+    def _restore(self) -> bool:
+        """Restores the session from disk.
+
+        Returns:
+            bool:
+            A boolean flag to indicate whether the session was restored.
+        """
+        if not os.path.isfile(self.filepath):
+            return False
+        try:
+            with open(self.filepath) as file:
+                state = yaml.load(stream=file, Loader=yaml.FullLoader) or {}
+            if state.get("username") != models.env.car_email or not state.get("vin"):
+                return False
+            connection = Connect(username=models.env.car_email, password=models.env.car_pass,
+                                 device_id=state["device_id"])
+            connection.load(state=state)
+            if expired := connection.expired:
+                connection.reconnect()
+        except (yaml.YAMLError, KeyError, TypeError) as error:
+            logger.error(error)
+            return False
+        except (urllib.error.HTTPError, urllib.error.URLError, requests.exceptions.RequestException) as error:
+            logger.error(f"Unable to resume the InControl session: {error}")
+            return False
+        self.connection, self.vin, self.brand = connection, state["vin"], state.get("brand")
+        if expired:
+            self._save()
+        logger.info("Restored InControl session.")
+        return True
+
+    def _login(self) -> NoReturn:
+        """Logs in with the email and password, and looks up the primary vehicle."""
+        connection = Connect(username=models.env.car_email, password=models.env.car_pass)
+        connection.connect()
+        if not connection.head:
+            return
+        vehicles = connection.get_vehicles(headers=connection.head).get("vehicles")
+        primary_vehicle = [each_vehicle for each_vehicle in vehicles if each_vehicle.get("role") == "Primary"][0]
+        self.connection, self.vin, self.brand = connection, primary_vehicle.get("vin"), None
+        self._save()
+
+    def _save(self) -> NoReturn:
+        """Stores the session state on disk."""
+        state = self.connection.dump()
+        state["vin"] = self.vin
+        state["brand"] = self.brand
+        with open(os.open(self.filepath, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600), 'w') as file:
+            yaml.dump(data=state, stream=file)
+
+    def set_brand(self, brand: str) -> NoReturn:
+        """Stores the vehicle's brand, so that it is not requested after every command.
+
+        Args:
+            brand: Brand of the vehicle.
+        """
+        with self._lock:
+            self.brand = brand
+            if self.connection:
+                self._save()
+
+    def invalidate(self) -> NoReturn:
+        """Drops the session in memory and on disk, forcing a new login on the next command."""
+        with self._lock:
+            self.connection, self.vin, self.brand = None, None, None
+            if os.path.isfile(self.filepath):
+                os.remove(self.filepath)
+
+
+session = Session(filepath=models.fileio.car_session)
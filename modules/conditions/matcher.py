@@ -0,0 +1,103 @@
+# noinspection PyUnresolvedReferences
+"""Module that compiles the keywords and conversations into a single-pass intent matcher.
+
+>>> Matcher
+
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Tuple
+
+from modules.conditions import conversation, keywords
+
+
+class IntentMatcher:
+    """Initiates an Aho-Corasick automaton to match every intent's keywords in a single pass over a phrase.
+
+    >>> IntentMatcher
+
+    See Also:
+        - Matching is case-sensitive against the lower-cased phrase, mirroring ``word_match``.
+        - Each intent resolves to the keyword that appears first in its list, just like ``word_match`` does.
+    """
+
+    def __init__(self, intents: Dict[str, Iterable[str]]):
+        """Builds the trie, failure links and output sets for all the intents.
+
+        Args:
+            intents: Dictionary of intent names and the list of keywords for each of them.
+        """
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[List[Tuple[str, int, str]]] = [[]]
+        for intent, words in intents.items():
+            for rank, word in enumerate(words):
+                self._insert(word=word, entry=(intent, rank, word))
+        self._link()
+
+    def _insert(self, word: str, entry: Tuple[str, int, str]) -> None:
+        """Adds a keyword to the trie.
+
+        Args:
+            word: Keyword to be added.
+            entry: Tuple of intent name, position of the keyword in its list and the keyword itself.
+        """
+        state = 0
+        for char in word:
+            if char not in self.goto[state]:
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+                self.goto[state][char] = len(self.goto) - 1
+            state = self.goto[state][char]
+        self.output[state].append(entry)
+
+    def _link(self) -> None:
+        """Computes failure links using a breadth first traversal and merges the outputs along them."""
+        queue = deque(self.goto[0].values())  # failure links for the first level always point to the root
+        while queue:
+            state = queue.popleft()
+            for char, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                self.output[child] = self.output[child] + self.output[self.fail[child]]
+
+    def search(self, phrase: str) -> Dict[str, str]:
+        """Walks the automaton once over the phrase and gathers every intent that matched.
+
+        Args:
+            phrase: Takes the phrase that has to be matched as an argument.
+
+        Returns:
+            dict:
+            Intent names as keys and the keyword that was matched as values.
+        """
+        matched, ranks, state = {}, {}, 0
+        for char in phrase.lower():
+            while state and char not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(char, 0)
+            for intent, rank, word in self.output[state]:
+                if intent not in ranks or rank < ranks[intent]:
+                    ranks[intent] = rank
+                    matched[intent] = word
+        return matched
+
+
+def compile_intents(**extras: Iterable[str]) -> IntentMatcher:
+    """Compiles the lists in ``keywords`` and ``conversation`` modules along with any extras into an ``IntentMatcher``.
+
+    Args:
+        **extras: Additional intents that are not a part of the keywords or conversation modules.
+
+    Returns:
+        IntentMatcher:
+        Compiled intent matcher.
+    """
+    intents = {k: v for k, v in conversation.__dict__.items() if isinstance(v, list)}
+    intents.update({k: v for k, v in keywords.__dict__.items() if isinstance(v, list)})
+    intents.update(extras)
+    return IntentMatcher(intents=intents)
@@ -0,0 +1,172 @@
+# noinspection PyUnresolvedReferences
+"""Module for a cross-process control channel that delivers stop and restart signals and alerts to the main process.
+
+>>> Channel
+
+"""
+
+import sqlite3
+from collections import deque
+from threading import Event, Lock, Thread
+from typing import Callable, NoReturn, Tuple, Union
+
+from executors.logger import logger
+from modules.database import database
+from modules.models import models
+
+db = database.Database(database=models.fileio.base_db)
+
+
+def publish(table: str, caller: str) -> NoReturn:
+    """Publishes a signal to the control channel by storing it in the base db.
+
+    Args:
+        table: Table that holds the signal. Either ``stopper`` or ``restart``.
+        caller: Name of the function or process that is publishing the signal.
+    """
+    with db.connection:
+        cursor = db.connection.cursor()
+        cursor.execute(f"INSERT or REPLACE INTO {table} (flag, caller) VALUES (?,?);", (True, caller))
+        cursor.connection.commit()
+
+
+def request_stop(caller: str) -> NoReturn:
+    """Publishes a stop signal.
+
+    Args:
+        caller: Name of the function or process that requested the stop.
+    """
+    publish(table="stopper", caller=caller)
+
+
+def request_restart(caller: str) -> NoReturn:
+    """Publishes a restart signal.
+
+    Args:
+        caller: Name of the function or process that has to be restarted.
+    """
+    publish(table="restart", caller=caller)
+
+
+def announce(text: str, caller: str) -> NoReturn:
+    """Publishes an alert to be spoken by the main process, ahead of any other speech.
+
+    Args:
+        text: Text that has to be spoken.
+        caller: Name of the function or process that is publishing the alert.
+    """
+    with db.connection:
+        cursor = db.connection.cursor()
+        cursor.execute("INSERT INTO announcements (text, caller) VALUES (?,?);", (text, caller))
+        cursor.connection.commit()
+
+
+class Subscriber(Thread):
+    """Watches the base db for signals and exposes them through an in-memory event.
+
+    >>> Subscriber
+
+    See Also:
+        - ``PRAGMA data_version`` changes only when another connection commits to the database.
+        - The signal tables are read and cleared only when the data version changes, so an idle channel costs no I/O
+          beyond reading the version.
+        - Consumers only check ``pending`` which is an in-memory event.
+        - Alerts are handed to ``on_announce`` as soon as they are read, since they have to interrupt the speech of
+          the main process rather than wait for the wake word loop.
+    """
+
+    def __init__(self, interval: Union[int, float] = 0.25, on_announce: Callable[[str], None] = None):
+        """Instantiates the subscriber as a daemon thread.
+
+        Args:
+            interval: Seconds between each data version check.
+            on_announce: Function that receives the text of each alert.
+        """
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.on_announce = on_announce
+        self.pending = Event()
+        self.halted = Event()
+        self._lock = Lock()
+        self._stops: deque = deque()
+        self._restarts: deque = deque()
+
+    def run(self) -> NoReturn:
+        """Polls the data version and drains the signal tables whenever it changes."""
+        connection = database.connect(database=models.fileio.base_db)
+        version = None
+        while not self.halted.wait(timeout=self.interval):
+            try:
+                if (current := connection.execute("PRAGMA data_version").fetchone()[0]) == version:
+                    continue
+                version = current
+                self._drain(connection=connection)
+            except sqlite3.Error as error:
+                logger.error(error)
+        connection.close()
+
+    def _drain(self, connection: sqlite3.Connection) -> NoReturn:
+        """Moves the signals from the database into memory.
+
+        Args:
+            connection: Connection that belongs to this thread.
+        """
+        with connection:
+            # takes the write lock before reading, so that a signal published in between is not deleted unread
+            connection.execute("BEGIN IMMEDIATE")
+            stops = connection.execute("SELECT flag, caller FROM stopper").fetchall()
+            restarts = connection.execute("SELECT flag, caller FROM restart").fetchall()
+            announcements = connection.execute("SELECT text, caller FROM announcements").fetchall()
+            if stops:
+                connection.execute("DELETE FROM stopper")
+            if restarts:
+                connection.execute("DELETE FROM restart")
+            if announcements:
+                connection.execute("DELETE FROM announcements")
+        for text, caller in announcements:
+            logger.info(f"Alert from {caller}: {text}")
+            self.on_announce(text) if self.on_announce else None
+        if not (stops or restarts):
+            return
+        with self._lock:
+            self._stops.extend(stops)
+            self._restarts.extend(restarts)
+            self.pending.set()
+
+    def _pop(self, signals: deque) -> Union[Tuple[str, str], None]:
+        """Pops the oldest signal from the given queue and clears the pending flag when nothing is left.
+
+        Args:
+            signals: Queue of signals.
+
+        Returns:
+            tuple:
+            Returns the flag and the caller.
+        """
+        with self._lock:
+            signal = signals.popleft() if signals else None
+            if not (self._stops or self._restarts):
+                self.pending.clear()
+        return signal
+
+    def check_restart(self) -> Union[Tuple[str, str], None]:
+        """Gets the oldest restart signal.
+
+        Returns:
+            tuple:
+            Returns the flag, caller from the restart signal.
+        """
+        return self._pop(signals=self._restarts)
+
+    def check_stop(self) -> Union[Tuple[str, str], None]:
+        """Gets the oldest stop signal.
+
+        Returns:
+            tuple:
+            Returns the flag, caller from the stop signal.
+        """
+        return self._pop(signals=self._stops)
+
+    def stop(self) -> NoReturn:
+        """Stops watching for signals."""
+        self.halted.set()
@@ -1,6 +1,6 @@
 import calendar
 import datetime
-from typing import Tuple, Union
+from typing import Dict, List, Tuple, Union
 
 from modules.exceptions import InvalidArgument
 
@@ -103,7 +103,7 @@ class CronExpression:
         Notes:
             This method should only be called by the user if the string_tab member is modified.
         """
-        self.numerical_tab = []
+        numerical_tab = []
 
         for field_str, span in zip(self.string_tab, self.FIELD_RANGES):
             split_field_str = field_str.split(',')
@@ -121,18 +121,25 @@ class CronExpression:
                 else:
                     unified.update(parse_atom(cron_atom, span))
 
-            self.numerical_tab.append(unified)
+            numerical_tab.append(frozenset(unified))
 
         if self.string_tab[2] == "*" and self.string_tab[4] != "*":
-            self.numerical_tab[2] = set()
+            numerical_tab[2] = frozenset()
+
+        # Compiled once, so that the trigger checks do not parse anything
+        self.numerical_tab = tuple(numerical_tab)
+        self.static_time = '%' not in self.string_tab[0] and '%' not in self.string_tab[1]
+        self.minutes = tuple(sorted(self.numerical_tab[0])) if self.static_time else tuple(range(60))
+        self.hours = tuple(sorted(self.numerical_tab[1])) if self.static_time else tuple(range(24))
 
     def check_trigger(self, date_tuple: Union[Tuple[int, int, int, int, int], Tuple[int, ...]],
-                      utc_offset: int = 0) -> bool:
+                      utc_offset: int = 0, date_only: bool = False) -> bool:
         """Returns boolean indicating if the trigger is active at the given time.
 
         Args:
             date_tuple: Tuple of year, month, date, hour and minute.
             utc_offset: UTC offset.
+            date_only: Boolean flag to skip the minute and hour fields.
 
         See Also:
             - | The date tuple should be in the local time. Unless periodicities are used, utc_offset does not need to
@@ -168,7 +175,7 @@ class CronExpression:
 
         for value, valid_values, field_str, delta_t, field_type in quintuple:
             # All valid, static values for the fields are stored in sets
-            if value in valid_values:
+            if value in valid_values or (date_only and field_type in (self.MINUTES, self.HOURS)):
                 continue
 
             # The following for loop implements the logic for context
@@ -231,6 +238,93 @@ class CronExpression:
         # of all fields; the associated trigger should be fired.
         return True
 
+    def next_trigger(self, after: datetime.datetime, limit: int = 10_228) -> Union[datetime.datetime, None]:
+        """Computes the first time after the given datetime when the trigger is active.
+
+        Args:
+            after: Datetime after which the next trigger is to be found. Seconds and microseconds are ignored.
+            limit: Number of days to look ahead. Defaults to 28 years, after which the calendar repeats.
+
+        See Also:
+            - Walks day by day checking only the date fields, and looks at the hours and minutes only on matching days.
+            - Hours and minutes are taken from the compiled sets, unless periodicities are used in those fields.
+
+        Returns:
+            datetime:
+            Datetime of the next trigger, ``None`` if the expression never triggers within the limit.
+        """
+        start = after.replace(second=0, microsecond=0) + datetime.timedelta(minutes=1)
+        day = start.date()
+        for _ in range(limit):
+            if self.check_trigger(date_tuple=(day.year, day.month, day.day, 0, 0), date_only=True):
+                same_day = day == start.date()
+                for hour in self.hours:
+                    if same_day and hour < start.hour:
+                        continue
+                    for minute in self.minutes:
+                        if same_day and hour == start.hour and minute < start.minute:
+                            continue
+                        if self.static_time or self.check_trigger(date_tuple=(day.year, day.month, day.day,
+                                                                              hour, minute)):
+                            return datetime.datetime(day.year, day.month, day.day, hour, minute)
+            day += datetime.timedelta(days=1)
+
+
+class CronSchedule:
+    """Holds compiled cron expressions along with their next trigger, to evaluate all of them at once.
+
+    >>> CronSchedule
+
+    See Also:
+        - Expressions are compiled once, and identical expressions share the same computation.
+        - Only the expressions that triggered are recomputed, so checking many entries costs a dictionary lookup.
+    """
+
+    def __init__(self, lines: List[str]):
+        """Compiles the cron expressions.
+
+        Args:
+            lines: List of crontab entries.
+        """
+        self.jobs = [CronExpression(line=line) for line in lines]
+        self.groups: Dict[str, List[CronExpression]] = {}
+        for job in self.jobs:
+            self.groups.setdefault(job.expression, []).append(job)
+        self.upcoming: Dict[str, Union[datetime.datetime, None]] = {}
+        self.after: Union[datetime.datetime, None] = None
+
+    def next_trigger(self, after: datetime.datetime) -> Union[datetime.datetime, None]:
+        """Computes the earliest trigger across all the expressions.
+
+        Args:
+            after: Datetime after which the next trigger is to be found.
+
+        Returns:
+            datetime:
+            Datetime of the earliest trigger, ``None`` if none of the expressions trigger.
+        """
+        after = after.replace(second=0, microsecond=0)
+        if after != self.after:
+            for key, jobs in self.groups.items():
+                if key not in self.upcoming or self.upcoming[key] is None or self.upcoming[key] <= after:
+                    self.upcoming[key] = jobs[0].next_trigger(after=after)
+            self.after = after
+        return min(filter(None, self.upcoming.values()), default=None)
+
+    def due(self, moment: datetime.datetime) -> List[CronExpression]:
+        """Gets all the expressions that trigger at the given minute.
+
+        Args:
+            moment: Datetime to be checked.
+
+        Returns:
+            list:
+            List of expressions that trigger at the given minute.
+        """
+        moment = moment.replace(second=0, microsecond=0)
+        self.next_trigger(after=moment - datetime.timedelta(minutes=1))
+        return [job for key, jobs in self.groups.items() if self.upcoming[key] == moment for job in jobs]
+
 
 def parse_atom(parse: str, minmax: tuple) -> set:
     """Returns a set containing valid values for a given cron-style range of numbers.
@@ -1,30 +1,171 @@
+import atexit
 import importlib
 import logging
 import os
 import random
 import sqlite3
-from typing import NoReturn, Union
+import threading
+import time
+from typing import Any, Dict, Iterable, List, NoReturn, Tuple, Union
 
 from pydantic import FilePath
 
+_metrics: Dict[str, List[Union[int, float]]] = {}
+_metrics_lock = threading.Lock()
+METRICS_LIMIT = 256  # Distinct statements tracked per process, the rest are grouped under 'other'
+
+
+def _record(statement: str, elapsed: float) -> NoReturn:
+    """Records the latency of a statement.
+
+    Args:
+        statement: SQL statement that was executed.
+        elapsed: Seconds taken to execute the statement.
+    """
+    statement = " ".join(statement.split())
+    with _metrics_lock:
+        if statement not in _metrics and len(_metrics) >= METRICS_LIMIT:
+            statement = "other"
+        metric = _metrics.setdefault(statement, [0, 0.0, 0.0])
+        metric[0] += 1
+        metric[1] += elapsed
+        metric[2] = max(metric[2], elapsed)
+
+
+def metrics() -> Dict[str, Dict[str, Union[int, float]]]:
+    """Gets the latency of all the statements executed in the current process.
+
+    Returns:
+        dict:
+        Number of executions, average and maximum latency in milliseconds for each statement.
+    """
+    with _metrics_lock:
+        return {statement: {"count": count, "average": round(total / count * 1_000, 3),
+                            "maximum": round(maximum * 1_000, 3)}
+                for statement, (count, total, maximum) in _metrics.items()}
+
+
+class TimedCursor(sqlite3.Cursor):
+    """Cursor that records the latency of every statement it executes.
+
+    >>> TimedCursor
+
+    """
+
+    def execute(self, sql: str, parameters: Iterable = ()) -> sqlite3.Cursor:
+        """Executes a statement and records its latency."""
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            _record(statement=sql, elapsed=time.perf_counter() - start)
+
+    def executemany(self, sql: str, seq_of_parameters: Iterable[Iterable]) -> sqlite3.Cursor:
+        """Executes a statement against all the parameters and records its latency."""
+        start = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            _record(statement=sql, elapsed=time.perf_counter() - start)
+
+
+class TimedConnection(sqlite3.Connection):
+    """Connection that hands out cursors which record the latency of every statement.
+
+    >>> TimedConnection
+
+    """
+
+    def cursor(self, factory: type = TimedCursor) -> sqlite3.Cursor:
+        """Creates a timed cursor."""
+        return super().cursor(factory)
+
+    def execute(self, sql: str, parameters: Iterable = ()) -> sqlite3.Cursor:
+        """Executes a statement with a timed cursor."""
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters: Iterable[Iterable]) -> sqlite3.Cursor:
+        """Executes a statement against all the parameters with a timed cursor."""
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+
+def connect(database: Union[FilePath, str], timeout: int = 10, **kwargs) -> sqlite3.Connection:
+    """Opens a connection in WAL mode with ``synchronous=NORMAL``, that caches prepared statements and records latency.
+
+    Args:
+        database: Name of the database file.
+        timeout: Timeout for the connection to database.
+        **kwargs: Keyword arguments for ``sqlite3.connect``
+
+    Returns:
+        sqlite3.Connection:
+        Returns the connection object.
+    """
+    connection = sqlite3.connect(database=database, timeout=timeout, factory=TimedConnection,
+                                 cached_statements=256, **kwargs)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
 
 class Database:
-    """Creates a connection to the base DB.
+    """Hands out a connection per thread to the base DB, and batches writes that do not need to be read back instantly.
 
     >>> Database
 
+    See Also:
+        - WAL mode lets readers and the writer proceed concurrently, and ``synchronous=NORMAL`` syncs only on
+          checkpoints, so the small transactions on the control tables do not wait on each other.
+        - Connections are never shared between threads, and are re-opened after a fork.
+        - Buffered writes are committed through a single writer connection that is opened once per process, and is
+          shared by the short-lived flush threads under a lock.
+        - Latency of every statement is available through ``metrics()`` for the current process.
     """
 
-    def __init__(self, database: Union[FilePath, str], timeout: int = 10):
-        """Instantiates the class ``Database`` to create a connection and a cursor.
+    def __init__(self, database: Union[FilePath, str], timeout: int = 10, batch_interval: float = 0.05):
+        """Instantiates the class ``Database`` without opening a connection.
 
         Args:
             database: Name of the database file.
             timeout: Timeout for the connection to database.
+            batch_interval: Seconds for which writes are buffered before they are committed together.
         """
         if not database.endswith('.db'):
             database = database + '.db'
-        self.connection = sqlite3.connect(database=database, check_same_thread=False, timeout=timeout)
+        self.database = database
+        self.timeout = timeout
+        self.batch_interval = batch_interval
+        self._local = threading.local()
+        self._pid = os.getpid()
+        self._pending: List[Tuple[str, Tuple[Any, ...]]] = []
+        self._pending_lock = threading.Lock()
+        self._flusher: Union[threading.Timer, None] = None
+        self._writer: Union[sqlite3.Connection, None] = None
+        self._writer_lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def _after_fork(self) -> NoReturn:
+        """Drops the connections and the buffered writes inherited from the parent process after a fork."""
+        if self._pid == os.getpid():
+            return
+        self._local = threading.local()
+        self._pending, self._pending_lock, self._flusher = [], threading.Lock(), None
+        self._writer, self._writer_lock = None, threading.Lock()
+        self._pid = os.getpid()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Connection that belongs to the current thread.
+
+        Returns:
+            sqlite3.Connection:
+            Returns the connection object.
+        """
+        self._after_fork()
+        if (connection := getattr(self._local, 'connection', None)) is None:
+            connection = connect(database=self.database, timeout=self.timeout)
+            self._local.connection = connection
+        return connection
 
     def create_table(self, table_name: str, columns: list[str]) -> NoReturn:
         """Creates the table with the required columns.
@@ -37,6 +178,38 @@ class Database:
             cursor = self.connection.cursor()
             cursor.execute(f"CREATE TABLE IF NOT EXISTS {table_name} ({', '.join(columns)})")
 
+    def write(self, statement: str, parameters: Tuple[Any, ...] = ()) -> NoReturn:
+        """Buffers a write, which gets committed along with the other writes within the batch interval.
+
+        Args:
+            statement: SQL statement to be executed.
+            parameters: Parameters for the statement.
+        """
+        self._after_fork()
+        with self._pending_lock:
+            self._pending.append((statement, parameters))
+            if self._flusher is None:
+                self._flusher = threading.Timer(interval=self.batch_interval, function=self.flush)
+                self._flusher.daemon = True
+                self._flusher.start()
+
+    def flush(self) -> NoReturn:
+        """Commits all the buffered writes in a single transaction."""
+        with self._pending_lock:
+            pending, self._pending, self._flusher = self._pending, [], None
+        if not pending:
+            return
+        try:
+            with self._writer_lock:
+                if self._writer is None:
+                    self._writer = connect(database=self.database, timeout=self.timeout, check_same_thread=False)
+                with self._writer:
+                    cursor = self._writer.cursor()
+                    for statement, parameters in pending:
+                        cursor.execute(statement, parameters)
+        except sqlite3.Error as error:
+            logging.error(f"Failed to commit {len(pending)} buffered writes: {error}")
+
 
 class __TestDatabase:
     """Basic examples of a test database.
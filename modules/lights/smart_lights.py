@@ -2,10 +2,14 @@ import socket
 import struct
 import sys
 import time
-from typing import NoReturn
+from threading import Lock
+from typing import Dict, NoReturn
 
 from executors.logger import logger
 
+API_PORT = 5577
+IDLE_TIMEOUT = 290  # devices drop idle connections after 5 minutes
+
 
 def check_number_range(number: int) -> int:
     """Check if the given number is in the allowed range.
@@ -38,6 +42,105 @@ def calculate_checksum(bytes_: list) -> int:
     return sum(bytes_) & 0xFF
 
 
+class Connection:
+    """Holds a persistent connection to a ``MagicHome`` device.
+
+    >>> Connection
+
+    See Also:
+        - A socket that has been idle for longer than ``IDLE_TIMEOUT`` is replaced before writing to it.
+        - A write that fails on a reused socket is retried once on a new socket.
+    """
+
+    def __init__(self, device_ip: str):
+        """Instantiates a connection without connecting to the device.
+
+        Args:
+            device_ip: Takes device IP address as argument.
+        """
+        self.device_ip = device_ip
+        self.sock = None
+        self.last_used = 0
+        self.lock = Lock()
+
+    def _connect(self) -> NoReturn:
+        """Establishes a connection with the device."""
+        self.sock = socket.create_connection(address=(self.device_ip, API_PORT), timeout=3)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+    def close(self) -> NoReturn:
+        """Closes the socket."""
+        if self.sock:
+            self.sock.close()
+        self.sock = None
+
+    def send(self, message: bytes, response: int = 0) -> bytes:
+        """Writes a message to the device and optionally reads the response.
+
+        Args:
+            message: Message to be sent.
+            response: Number of bytes to read as response.
+
+        Returns:
+            bytes:
+            Response from the device.
+        """
+        with self.lock:
+            if self.sock and time.time() - self.last_used >= IDLE_TIMEOUT:
+                self.close()
+            while True:
+                reused = self.sock is not None
+                try:
+                    if not reused:
+                        self._connect()
+                    self.sock.sendall(message)
+                    data = self.sock.recv(response) if response else b''
+                    self.last_used = time.time()
+                    return data
+                except socket.error:
+                    self.close()
+                    if not reused:
+                        raise
+
+
+class ConnectionPool:
+    """Shares one connection per device across all the commands.
+
+    >>> ConnectionPool
+
+    """
+
+    def __init__(self):
+        """Instantiates the pool."""
+        self.connections: Dict[str, Connection] = {}
+        self._lock = Lock()
+
+    def get(self, device_ip: str) -> Connection:
+        """Gets the connection for a device, creating it if necessary.
+
+        Args:
+            device_ip: Takes device IP address as argument.
+
+        Returns:
+            Connection:
+            Connection to the device.
+        """
+        with self._lock:
+            if device_ip not in self.connections:
+                self.connections[device_ip] = Connection(device_ip=device_ip)
+            return self.connections[device_ip]
+
+    def close(self) -> NoReturn:
+        """Closes all the connections."""
+        with self._lock:
+            for connection in self.connections.values():
+                connection.close()
+            self.connections.clear()
+
+
+pool = ConnectionPool()
+
+
 class MagicHomeApi:
     """Controller for ``MagicHome`` smart devices.
 
@@ -52,24 +155,14 @@ class MagicHomeApi:
             device_ip: Takes device IP address as argument.
             device_type: Specific device type. Commonly 1 or 2.
             operation: Takes the operation that the calling function is trying to perform and logs it.
+
+        See Also:
+            - The connection is taken from the pool, so instantiating the object does not connect to the device.
         """
         self.device_ip = device_ip
         self.device_type = device_type
         self.operation = operation
-        self.API_PORT = 5577
-        self.latest_connection = time.time()
-        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.sock.settimeout(3)
-        try:
-            # Establishing connection with the device.
-            self.sock.connect((self.device_ip, self.API_PORT))
-        except socket.error as error:
-            self.sock.close()
-            error_msg = f"\rSocket error on {device_ip}: {error}"
-            logger.error(f'{error_msg} while performing "{self.operation}"')
-            raise socket.error(
-                error
-            )
+        self.connection = pool.get(device_ip=device_ip)
 
     def turn_on(self) -> NoReturn:
         """Turn a device on."""
@@ -87,11 +180,9 @@ class MagicHomeApi:
             A signal to socket.
         """
         if self.device_type == 2:
-            self.send_bytes(0x81, 0x8A, 0x8B, 0x96)
-            return self.sock.recv(15)
+            return self.send_bytes(0x81, 0x8A, 0x8B, 0x96, response=15)
         else:
-            self.send_bytes(0x81, 0x8A, 0x8B, 0x96)
-            return self.sock.recv(14)
+            return self.send_bytes(0x81, 0x8A, 0x8B, 0x96, response=14)
 
     def update_device(self, r: int = 0, g: int = 0, b: int = 0, warm_white: int = None, cool_white: int = None) -> None:
         """Updates a device based upon what we're sending to it.
@@ -180,23 +271,21 @@ class MagicHomeApi:
             message = [0x61, preset_number, speed, 0x0F]
             self.send_bytes(*(message + [calculate_checksum(message)]))
 
-    def send_bytes(self, *bytes_) -> NoReturn:
-        """Send commands to the device.
-
-        If the device hasn't been communicated to in 5 minutes, reestablish the connection.
+    def send_bytes(self, *bytes_, response: int = 0) -> bytes:
+        """Send commands to the device through the pooled connection.
 
         Args:
             *bytes_: Takes a tuple value as argument.
+            response: Number of bytes to read as response.
+
+        Returns:
+            bytes:
+            Response from the device.
         """
-        check_connection_time = time.time() - self.latest_connection
         try:
-            if check_connection_time >= 290:
-                sys.stdout.write("\rConnection timed out, reestablishing.")
-                self.sock.connect((self.device_ip, self.API_PORT))
-            message_length = len(bytes_)
-            self.sock.send(struct.pack("B" * message_length, *bytes_))
+            return self.connection.send(message=struct.pack("B" * len(bytes_), *bytes_), response=response)
         except socket.error as error:
             error_msg = f"\rSocket error on {self.device_ip}: {error}"
             sys.stdout.write(error_msg)
             logger.error(f'{error_msg} while performing "{self.operation}"')
-        self.sock.close()
+            raise
@@ -25,14 +25,11 @@ def events_writer() -> NoReturn:
     This function runs in a dedicated process to avoid wait time when events information is requested.
     """
     info = events_gatherer()
-    query = f"INSERT OR REPLACE INTO {models.env.event_app} (info, date) VALUES " \
-            f"{(info, datetime.now().strftime('%Y_%m_%d'))}"
     with db.connection:
         cursor = db.connection.cursor()
         cursor.execute(f"DELETE FROM {models.env.event_app}")
-        cursor.connection.commit()
-        cursor.execute(query)
-        cursor.connection.commit()
+        cursor.execute(f"INSERT OR REPLACE INTO {models.env.event_app} (info, date) VALUES (?,?)",
+                       (info, datetime.now().strftime('%Y_%m_%d')))
     return
 
 
@@ -123,7 +120,7 @@ def events() -> None:
                        f"({datetime.now().strftime('%Y_%m_%d')})")
         speaker.speak(text=f"Events table is outdated {models.env.title}. Please try again in a minute or two.")
     else:
-        if shared.called_by_offline:
+        if shared.called_by_offline.get():
             Process(target=events_writer).start()
             speaker.speak(text=f"Events table is empty {models.env.title}. Please try again in a minute or two.")
             return
@@ -29,9 +29,8 @@ def meetings_writer() -> NoReturn:
     with db.connection:
         cursor = db.connection.cursor()
         cursor.execute("DELETE FROM ics")
-        cursor.connection.commit()
-        cursor.execute(f"INSERT OR REPLACE INTO ics (info, date) VALUES {(info, datetime.now().strftime('%Y_%m_%d'))}")
-        cursor.connection.commit()
+        cursor.execute("INSERT OR REPLACE INTO ics (info, date) VALUES (?,?)",
+                       (info, datetime.now().strftime('%Y_%m_%d')))
     return
 
 
@@ -93,7 +92,7 @@ def meetings() -> None:
                        f"({datetime.now().strftime('%Y_%m_%d')})")
         speaker.speak(text=f"Meetings table is outdated {models.env.title}. Please try again in a minute or two.")
     else:
-        if shared.called_by_offline:
+        if shared.called_by_offline.get():
             Process(target=meetings_writer).start()
             speaker.speak(text=f"Meetings table is empty {models.env.title}. Please try again in a minute or two.")
             return
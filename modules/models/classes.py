@@ -18,8 +18,8 @@ from typing import List, Union
 import psutil
 from packaging.version import parse as parser
 from pydantic import (BaseModel, BaseSettings, DirectoryPath, EmailStr, Field,
-                      FilePath, HttpUrl, PositiveFloat, PositiveInt, constr,
-                      validator)
+                      FilePath, HttpUrl, PositiveFloat, PositiveInt, confloat,
+                      conint, constr, validator)
 
 from modules.exceptions import InvalidEnvVars, UnsupportedOS
 
@@ -77,6 +77,17 @@ class EventApp(str, Enum):
     OUTLOOK = 'outlook'
 
 
+class RecognizerEngine(str, Enum):
+    """Speech to text engines supported by Jarvis.
+
+    >>> RecognizerEngine
+
+    """
+
+    GOOGLE = 'google'
+    VOSK = 'vosk'
+
+
 class CustomDict(BaseModel):
     """Custom links model."""
 
@@ -110,6 +121,9 @@ class EnvConfig(BaseSettings):
     offline_host: str = Field(default=socket.gethostbyname('localhost'), env='OFFLINE_HOST')
     offline_port: PositiveInt = Field(default=4483, env='OFFLINE_PORT')
     offline_pass: str = Field(default='OfflineComm', env='OFFLINE_PASS')
+    offline_workers: PositiveInt = Field(default=4, env='OFFLINE_WORKERS')
+    offline_queue: conint(ge=0) = Field(default=10, env='OFFLINE_QUEUE')
+    offline_queue_timeout: Union[PositiveFloat, PositiveInt] = Field(default=30, env='OFFLINE_QUEUE_TIMEOUT')
     sync_meetings: PositiveInt = Field(default=3_600, env='SYNC_MEETINGS')
     sync_events: PositiveInt = Field(default=3_600, env='SYNC_EVENTS')
     icloud_user: EmailStr = Field(default=None, env='ICLOUD_USER')
@@ -142,6 +156,13 @@ class EnvConfig(BaseSettings):
     sensitivity: Union[Sensitivity, List[Sensitivity]] = Field(default=0.5, le=1, ge=0, env='SENSITIVITY')
     timeout: Union[PositiveFloat, PositiveInt] = Field(default=3, env='TIMEOUT')
     phrase_limit: Union[PositiveFloat, PositiveInt] = Field(default=3, env='PHRASE_LIMIT')
+    capture_buffer: Union[PositiveFloat, PositiveInt] = Field(default=10, env='CAPTURE_BUFFER')
+    listener_preroll: Union[confloat(ge=0), conint(ge=0)] = Field(default=0, env='LISTENER_PREROLL')
+    listener_vad: bool = Field(default=True, env='LISTENER_VAD')
+    listener_silence: Union[PositiveFloat, PositiveInt] = Field(default=0.6, env='LISTENER_SILENCE')
+    recognizer: RecognizerEngine = Field(default=RecognizerEngine.GOOGLE, env='RECOGNIZER')
+    recognizer_model: DirectoryPath = Field(default=None, env='RECOGNIZER_MODEL')
+    text_to_audio_workers: PositiveInt = Field(default=1, env='TEXT_TO_AUDIO_WORKERS')
     bot_token: str = Field(default=None, env='BOT_TOKEN')
     bot_chat_ids: List[int] = Field(default=[], env='BOT_CHAT_IDS')
     bot_users: List[str] = Field(default=[], env='BOT_USERS')
@@ -152,6 +173,11 @@ class EnvConfig(BaseSettings):
     speech_synthesis_timeout: int = Field(default=3, env='SPEECH_SYNTHESIS_TIMEOUT')
     speech_synthesis_host: str = Field(default=socket.gethostbyname('localhost'), env='SPEECH_SYNTHESIS_HOST')
     speech_synthesis_port: int = Field(default=5002, env='SPEECH_SYNTHESIS_PORT')
+    speech_synthesis_containers: conint(ge=0) = Field(default=1, env='SPEECH_SYNTHESIS_CONTAINERS')
+    speech_synthesis_endpoints: List[HttpUrl] = Field(default=[], env='SPEECH_SYNTHESIS_ENDPOINTS')
+    speech_synthesis_cache: conint(ge=0) = Field(default=100, env='SPEECH_SYNTHESIS_CACHE')
+    speech_synthesis_prewarm: bool = Field(default=False, env='SPEECH_SYNTHESIS_PREWARM')
+    speech_synthesis_stream: bool = Field(default=True, env='SPEECH_SYNTHESIS_STREAM')
     title: str = Field(default='sir', env='TITLE')
     name: str = Field(default='Vignesh', env='NAME')
     tasks: List[CustomDict] = Field(default=[], env="TASKS")
@@ -191,14 +217,18 @@ class FileIO(BaseModel):
     tmp_automation: FilePath = os.path.join('fileio', 'tmp_automation.yaml')
     base_db: FilePath = os.path.join('fileio', 'database.db')
     task_db: FilePath = os.path.join('fileio', 'tasks.db')
+    schedule_db: FilePath = os.path.join('fileio', 'schedule.db')
     frequent: FilePath = os.path.join('fileio', 'frequent.yaml')
     location: FilePath = os.path.join('fileio', 'location.yaml')
+    car_session: FilePath = os.path.join('fileio', 'car_session.yaml')
     notes: FilePath = os.path.join('fileio', 'notes.txt')
     robinhood: FilePath = os.path.join('fileio', 'robinhood.html')
     smart_devices: FilePath = os.path.join('fileio', 'smart_devices.yaml')
     training: FilePath = os.path.join('fileio', 'training_data.yaml')
+    training_log: FilePath = os.path.join('fileio', 'training_data.jsonl')
     event_script: FilePath = os.path.join('fileio', f'{env.event_app}.scpt')
     speech_synthesis_wav: FilePath = os.path.join('fileio', 'speech_synthesis.wav')
+    speech_synthesis_cache: DirectoryPath = os.path.join('fileio', 'speech_synthesis')
     speech_synthesis_log: FilePath = datetime.now().strftime(os.path.join('logs', 'speech_synthesis_%d-%m-%Y.log'))
 
 
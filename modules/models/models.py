@@ -59,7 +59,7 @@ if env.ics_url and not env.ics_url.endswith('.ics'):
 if env.tv_mac and isinstance(env.tv_mac, str):
     env.tv_mac = [env.tv_mac]
 
-if env.speech_synthesis_port == env.offline_port:
+if env.speech_synthesis_port <= env.offline_port < env.speech_synthesis_port + env.speech_synthesis_containers:
     raise InvalidEnvVars(
         "Speech synthesizer and offline communicator cannot run simultaneously on the same port number."
     )
@@ -81,5 +81,6 @@ db.create_table(table_name=env.event_app, columns=["info", "date"])
 db.create_table(table_name="ics", columns=["info", "date"])
 db.create_table(table_name="stopper", columns=["flag", "caller"])
 db.create_table(table_name="restart", columns=["flag", "caller"])
+db.create_table(table_name="announcements", columns=["text", "caller"])
 db.create_table(table_name="children", columns=["meetings", "events", "crontab"])
 db.create_table(table_name="vpn", columns=["state"])
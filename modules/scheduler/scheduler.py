@@ -0,0 +1,254 @@
+# noinspection PyUnresolvedReferences
+"""Module for an event driven scheduler that sleeps until the next due task or a change notification.
+
+>>> Scheduler
+
+"""
+
+import os
+import time
+from datetime import datetime, timedelta
+from threading import Event
+from typing import Any, Callable, Dict, Iterable, List, NoReturn, Tuple, Union
+
+from executors.logger import logger
+
+
+def minute_start(moment: datetime) -> datetime:
+    """Truncates a datetime object to the beginning of its minute.
+
+    Args:
+        moment: Datetime object to be truncated.
+
+    Returns:
+        datetime:
+        Datetime object with seconds and microseconds set to zero.
+    """
+    return moment.replace(second=0, microsecond=0)
+
+
+def next_occurrence(clock: str, fmt: str, now: datetime, days: Iterable[int] = None) -> datetime:
+    """Computes the next time a wall clock value occurs, including the current minute.
+
+    Args:
+        clock: Time as a string. Example: ``07:30 AM``
+        fmt: Format of the time string. Example: ``%I:%M %p``
+        now: Reference datetime.
+        days: Weekdays (Monday is 0) on which the time is valid. Defaults to every day.
+
+    Returns:
+        datetime:
+        Datetime at which the clock value occurs next.
+    """
+    parsed = datetime.strptime(clock, fmt)
+    candidate = minute_start(now).replace(hour=parsed.hour, minute=parsed.minute)
+    if candidate < minute_start(now):
+        candidate += timedelta(days=1)
+    if days:
+        days = set(days)
+        while candidate.weekday() not in days:
+            candidate += timedelta(days=1)
+    return candidate
+
+
+class Job:
+    """Holds a task along with the function that computes when it is due next.
+
+    >>> Job
+
+    """
+
+    def __init__(self, name: str, due: Callable[[datetime], Union[datetime, None]], action: Callable[[datetime], Any]):
+        """Instantiates a job.
+
+        Args:
+            name: Name of the job used for logging.
+            due: Function that takes the current datetime and returns the next datetime when the job is due.
+            action: Function that takes the current datetime and executes everything that is due.
+
+        See Also:
+            - A due time at or before the current time means the job is due immediately.
+            - The action is expected to consume whatever was due, so that the next due time moves forward.
+            - ``None`` as due time means the job has nothing scheduled until the next change notification.
+        """
+        self.name = name
+        self.due = due
+        self.action = action
+        self.last_run: Union[datetime, None] = None
+        self.next_run: Union[datetime, None] = None
+
+    def refresh(self, now: datetime) -> None:
+        """Recomputes the next run time of the job.
+
+        Args:
+            now: Current datetime.
+        """
+        try:
+            self.next_run = self.due(now)
+        except Exception as error:
+            logger.error(f"Unable to compute the next run for {self.name}: {error}")
+            self.next_run = minute_start(now) + timedelta(minutes=1)
+
+
+class Scheduler:
+    """Runs jobs at their due time and sleeps until the next due time or a change notification arrives.
+
+    >>> Scheduler
+
+    """
+
+    def __init__(self, poll_interval: Union[int, float] = 1, max_sleep: Union[int, float] = 60):
+        """Instantiates the scheduler.
+
+        Args:
+            poll_interval: Seconds between each check on the watched paths for changes.
+            max_sleep: Upper limit on the sleep time, to recover from system sleep and wall clock adjustments.
+        """
+        self.jobs: List[Job] = []
+        self.wakeup = Event()
+        self.poll_interval = poll_interval
+        self.max_sleep = max_sleep
+        self.watched: Dict[str, Tuple[int, int, int]] = {}
+
+    def add_job(self, name: str, due: Callable[[datetime], Union[datetime, None]],
+                action: Callable[[datetime], Any]) -> Job:
+        """Adds a job to the scheduler.
+
+        Args:
+            name: Name of the job used for logging.
+            due: Function that returns the next datetime when the job is due.
+            action: Function that executes everything that is due.
+
+        Returns:
+            Job:
+            The job object that was added.
+        """
+        job = Job(name=name, due=due, action=action)
+        job.refresh(now=datetime.now())
+        self.jobs.append(job)
+        return job
+
+    def add_interval(self, name: str, interval: Callable[[], Union[int, float]],
+                     action: Callable[[datetime], Any]) -> Job:
+        """Adds a job that runs immediately and then repeats after the given interval.
+
+        Args:
+            name: Name of the job used for logging.
+            interval: Function that returns the interval in seconds, evaluated every time the job is rescheduled.
+            action: Function that executes the task.
+
+        Returns:
+            Job:
+            The job object that was added.
+        """
+        job = Job(name=name, due=lambda now: job.last_run + timedelta(seconds=interval()) if job.last_run else now,
+                  action=action)
+        job.refresh(now=datetime.now())
+        self.jobs.append(job)
+        return job
+
+    def watch(self, *paths: str) -> None:
+        """Adds files or directories whose changes should wake up the scheduler.
+
+        Args:
+            *paths: Paths to be watched.
+        """
+        for path in paths:
+            self.watched[path] = self._signature(path=path)
+
+    def notify(self) -> None:
+        """Wakes up the scheduler to recompute due times."""
+        self.wakeup.set()
+
+    @staticmethod
+    def _signature(path: str) -> Tuple[int, int, int]:
+        """Gets a cheap signature of a path that changes whenever the path is modified.
+
+        Args:
+            path: Path to a file or a directory.
+
+        Returns:
+            tuple:
+            Modified time in nanoseconds, inode and size of the path or zeros if the path does not exist.
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return 0, 0, 0
+        return stat.st_mtime_ns, stat.st_ino, stat.st_size
+
+    def _changed(self) -> bool:
+        """Checks if any of the watched paths have changed since the last check.
+
+        Returns:
+            bool:
+            A boolean flag to indicate whether any of the watched paths have changed.
+        """
+        changed = False
+        for path, signature in self.watched.items():
+            if (current := self._signature(path=path)) != signature:
+                self.watched[path] = current
+                changed = True
+        return changed
+
+    def run_pending(self, now: datetime) -> None:
+        """Runs all the jobs that are due and recomputes their next run time.
+
+        Args:
+            now: Current datetime.
+        """
+        for job in self.jobs:
+            if job.next_run is None or job.next_run > now:
+                continue
+            try:
+                job.action(now)
+            except Exception as error:
+                logger.error(f"{job.name} failed with: {error}")
+            job.last_run = now
+            job.refresh(now=now)
+            if job.next_run and job.next_run <= now:
+                # Guard against a job that did not consume what was due, retries in a second instead of spinning
+                job.next_run = now + timedelta(seconds=1)
+
+    def sleep_time(self, now: datetime) -> float:
+        """Computes the number of seconds until the earliest job is due.
+
+        Args:
+            now: Current datetime.
+
+        Returns:
+            float:
+            Number of seconds to sleep, capped at ``max_sleep``.
+        """
+        upcoming = [job.next_run for job in self.jobs if job.next_run]
+        if not upcoming:
+            return self.max_sleep
+        return min(max((min(upcoming) - now).total_seconds(), 0), self.max_sleep)
+
+    def wait(self, seconds: float) -> bool:
+        """Sleeps for the given number of seconds unless notified or a watched path changes.
+
+        Args:
+            seconds: Number of seconds to sleep.
+
+        Returns:
+            bool:
+            A boolean flag to indicate whether the sleep was interrupted.
+        """
+        deadline = time.monotonic() + seconds
+        while (remaining := deadline - time.monotonic()) > 0:
+            if self.wakeup.wait(timeout=min(remaining, self.poll_interval) if self.watched else remaining):
+                self.wakeup.clear()
+                return True
+            if self._changed():
+                return True
+        return False
+
+    def run(self) -> NoReturn:
+        """Runs the jobs in a forever loop, sleeping between due times."""
+        while True:
+            self.run_pending(now=datetime.now())
+            if self.wait(seconds=self.sleep_time(now=datetime.now())):
+                now = datetime.now()
+                for job in self.jobs:
+                    job.refresh(now=now)
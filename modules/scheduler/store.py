@@ -0,0 +1,259 @@
+# noinspection PyUnresolvedReferences
+"""Module for an indexed store of alarms and reminders with recurrence rules and an in-memory min-heap.
+
+>>> Store
+
+"""
+
+import heapq
+import os
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Dict, Iterable, List, NoReturn, Tuple, Union
+
+from executors.logger import logger
+from modules.database import database
+from modules.models import models
+from modules.scheduler import scheduler
+
+WEEKDAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+EVERYDAY = tuple(range(7))
+
+
+class Store:
+    """Stores alarms or reminders in a table indexed by the next fire time, and keeps a min-heap of the same in memory.
+
+    >>> Store
+
+    See Also:
+        - Each entry holds a 24-hour clock value and the weekdays on which it repeats, empty for a one time entry.
+        - The heap is rebuilt only when ``PRAGMA data_version`` changes, which happens when another process commits.
+        - Checking for due entries pops from the heap, so the cost is ``O(log n)`` per entry that is due.
+        - Repeated entries that were missed by more than a minute (eg: Jarvis was not running) move to their next
+          occurrence, unless the store is set to catch up, in which case they are due right away.
+        - One time entries that were missed are due right away if they are within the grace period, and removed
+          otherwise, unless the store is set to catch up.
+    """
+
+    def __init__(self, filepath: str, table: str, catch_up: bool = False, grace: int = 15):
+        """Creates the table and its index without loading the entries.
+
+        Args:
+            filepath: Database file.
+            table: Table that holds the entries. Either ``alarms``, ``reminders`` or ``delays``.
+            catch_up: Boolean flag to execute the missed entries instead of moving them to their next occurrence.
+            grace: Minutes after which a missed one time entry is removed instead of being executed.
+        """
+        self.table = table
+        self.catch_up = catch_up
+        self.grace = grace
+        self.connection = database.connect(database=filepath, check_same_thread=False)
+        self._lock = Lock()
+        self._heap: List[Tuple[float, int]] = []
+        self._entries: Dict[int, float] = {}
+        self._version: Union[int, None] = None
+        with self.connection:
+            self.connection.execute(f"CREATE TABLE IF NOT EXISTS {table} (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                                    "fire_at REAL NOT NULL, clock TEXT NOT NULL, days TEXT, message TEXT)")
+            self.connection.execute(f"CREATE INDEX IF NOT EXISTS {table}_fire_at ON {table} (fire_at)")
+
+    def _sync(self) -> NoReturn:
+        """Rebuilds the heap from the table, if the table was modified by another connection."""
+        if (version := self.connection.execute("PRAGMA data_version").fetchone()[0]) == self._version:
+            return
+        self._version = version
+        self._entries = dict(self.connection.execute(f"SELECT id, fire_at FROM {self.table}").fetchall())
+        self._heap = [(fire_at, identifier) for identifier, fire_at in self._entries.items()]
+        heapq.heapify(self._heap)
+
+    def _peek(self) -> Union[Tuple[float, int], None]:
+        """Drops the heap items that were cancelled or rescheduled, and gets the earliest valid item.
+
+        Returns:
+            tuple:
+            Fire time as a timestamp and the ID of the entry.
+        """
+        while self._heap and self._entries.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+        return self._heap[0] if self._heap else None
+
+    def _schedule(self, identifier: int, fire_at: float) -> NoReturn:
+        """Tracks the fire time of an entry in memory.
+
+        Args:
+            identifier: ID of the entry.
+            fire_at: Fire time as a timestamp.
+        """
+        self._entries[identifier] = fire_at
+        heapq.heappush(self._heap, (fire_at, identifier))
+
+    @staticmethod
+    def next_fire(clock: str, days: Union[str, None], now: datetime) -> datetime:
+        """Computes the next fire time of an entry, including the current minute.
+
+        Args:
+            clock: Time in 24-hour format. Example: ``07:30``
+            days: Comma separated weekdays (Monday is 0) on which the entry repeats.
+            now: Reference datetime.
+
+        Returns:
+            datetime:
+            Datetime at which the entry fires next.
+        """
+        return scheduler.next_occurrence(clock=clock, fmt="%H:%M", now=now,
+                                         days=[int(day) for day in days.split(',')] if days else None)
+
+    def add(self, clock: str, days: Iterable[int] = None, message: str = None) -> int:
+        """Adds an entry to the store.
+
+        Args:
+            clock: Time in 24-hour format. Example: ``07:30``
+            days: Weekdays (Monday is 0) on which the entry repeats. Defaults to a one time entry.
+            message: Message stored along with the entry.
+
+        Returns:
+            int:
+            ID of the entry.
+        """
+        days = ','.join(str(day) for day in sorted(set(days))) if days else None
+        fire_at = self.next_fire(clock=clock, days=days, now=datetime.now()).timestamp()
+        with self._lock, self.connection:
+            self._sync()
+            cursor = self.connection.execute(f"INSERT INTO {self.table} (fire_at, clock, days, message) "
+                                             "VALUES (?,?,?,?)", (fire_at, clock, days, message))
+            self._schedule(identifier=cursor.lastrowid, fire_at=fire_at)
+        return cursor.lastrowid
+
+    def add_at(self, fire_at: datetime, message: str = None) -> int:
+        """Adds a one time entry that fires at the given datetime.
+
+        Args:
+            fire_at: Datetime when the entry has to fire.
+            message: Message stored along with the entry.
+
+        Returns:
+            int:
+            ID of the entry.
+        """
+        with self._lock, self.connection:
+            self._sync()
+            cursor = self.connection.execute(f"INSERT INTO {self.table} (fire_at, clock, days, message) "
+                                             "VALUES (?,?,?,?)", (fire_at.timestamp(), fire_at.strftime("%H:%M"),
+                                                                  None, message))
+            self._schedule(identifier=cursor.lastrowid, fire_at=fire_at.timestamp())
+        return cursor.lastrowid
+
+    def remove(self, identifier: int) -> bool:
+        """Removes an entry from the store.
+
+        Args:
+            identifier: ID of the entry.
+
+        Returns:
+            bool:
+            A boolean flag to indicate whether the entry existed.
+        """
+        with self._lock, self.connection:
+            self._sync()
+            removed = self.connection.execute(f"DELETE FROM {self.table} WHERE id=?", (identifier,)).rowcount
+            self._entries.pop(identifier, None)
+        return bool(removed)
+
+    def entries(self) -> List[Dict[str, Union[int, str, datetime, List[int], None]]]:
+        """Gets all the entries ordered by their next fire time.
+
+        Returns:
+            list:
+            List of entries as dictionaries.
+        """
+        with self._lock:
+            rows = self.connection.execute(f"SELECT id, fire_at, clock, days, message FROM {self.table} "
+                                           "ORDER BY fire_at").fetchall()
+        return [{"id": identifier, "fire_at": datetime.fromtimestamp(fire_at), "clock": clock,
+                 "days": [int(day) for day in days.split(',')] if days else [], "message": message}
+                for identifier, fire_at, clock, days, message in rows]
+
+    def upcoming(self) -> Union[datetime, None]:
+        """Gets the earliest fire time across all the entries.
+
+        Returns:
+            datetime:
+            Datetime of the earliest entry, ``None`` if the store is empty.
+        """
+        with self._lock:
+            self._sync()
+            if item := self._peek():
+                return datetime.fromtimestamp(item[0])
+
+    def pop_due(self, now: datetime) -> List[Dict[str, Union[int, str, datetime, List[int], None]]]:
+        """Gets the entries that are due, removing the one time entries and moving the repeated ones forward.
+
+        Args:
+            now: Current datetime.
+
+        Returns:
+            list:
+            List of entries that are due, as dictionaries.
+        """
+        missed = (scheduler.minute_start(now) - timedelta(minutes=1)).timestamp()
+        expired = (now - timedelta(minutes=self.grace)).timestamp()
+        due = []
+        with self._lock, self.connection:
+            self._sync()
+            while (item := self._peek()) and item[0] <= now.timestamp():
+                heapq.heappop(self._heap)
+                fire_at, identifier = item
+                if not (row := self.connection.execute(f"SELECT clock, days, message FROM {self.table} WHERE id=?",
+                                                       (identifier,)).fetchone()):
+                    self._entries.pop(identifier)
+                    continue
+                clock, days, message = row
+                if fire_at < missed and not self.catch_up and (days or fire_at < expired):
+                    if not days:
+                        logger.warning(f"Missed {self.table} entry at {clock} by more than {self.grace} minutes, "
+                                       "removing it.")
+                        self.connection.execute(f"DELETE FROM {self.table} WHERE id=?", (identifier,))
+                        self._entries.pop(identifier)
+                        continue
+                    logger.warning(f"Missed {self.table} entry at {clock}, moving it to the next occurrence.")
+                    reference = now
+                else:
+                    due.append({"id": identifier, "fire_at": datetime.fromtimestamp(fire_at), "clock": clock,
+                                "days": [int(day) for day in days.split(',')] if days else [], "message": message})
+                    if not days:
+                        self.connection.execute(f"DELETE FROM {self.table} WHERE id=?", (identifier,))
+                        self._entries.pop(identifier)
+                        continue
+                    reference = scheduler.minute_start(now) + timedelta(minutes=1)
+                next_fire = self.next_fire(clock=clock, days=days, now=reference).timestamp()
+                self.connection.execute(f"UPDATE {self.table} SET fire_at=? WHERE id=?", (next_fire, identifier))
+                self._schedule(identifier=identifier, fire_at=next_fire)
+        return due
+
+
+def import_lock_files() -> NoReturn:
+    """Moves the alarms and reminders stored as lock files by the earlier versions into the store."""
+    for directory, table in (("alarm", alarms), ("reminder", reminders)):
+        if not os.path.isdir(directory):
+            continue
+        for file in os.listdir(directory):
+            if not file.endswith('.lock'):
+                continue
+            name, message = file.replace('.lock', '').lstrip('_').split('|') if '|' in file else (file[:-5], None)
+            parts = name.lstrip('_').replace('_repeat', '').split('_')
+            try:
+                days = [WEEKDAYS.index(parts.pop(0))] if len(parts) == 4 else None
+                clock = datetime.strptime(' '.join(parts), "%I %M %p").strftime("%H:%M")
+            except ValueError as error:
+                logger.error(f"Unable to import {file}: {error}")
+                continue
+            if not days and name.endswith('_repeat'):
+                days = EVERYDAY
+            table.add(clock=clock, days=days, message=message.replace('_', ' ') if message else None)
+            os.remove(os.path.join(directory, file))
+            logger.info(f"Imported {file} into {table.table}")
+
+
+alarms = Store(filepath=models.fileio.schedule_db, table="alarms")
+reminders = Store(filepath=models.fileio.schedule_db, table="reminders")
+delays = Store(filepath=models.fileio.schedule_db, table="delays", catch_up=True)
@@ -15,15 +15,13 @@ from executors.offline import offline_communicator
 from executors.word_match import word_match
 from modules.audio import tts_stt
 from modules.conditions import keywords
-from modules.database import database
+from modules.control import channel
 from modules.exceptions import BotInUse
 from modules.models import config, models
 from modules.offline import compatibles
 from modules.telegram import audio_handler
 from modules.utils import support
 
-db = database.Database(database=models.fileio.base_db)
-
 importlib.reload(module=logging)
 dictConfig(config.BotConfig().dict())
 logger = logging.getLogger('telegram')
@@ -159,22 +157,22 @@ class TelegramBot:
             logger.error(response.json())
         return response
 
-    def send_audio(self, chat_id: int, filename: str, parse_mode: str = 'HTML') -> requests.Response:
-        """Sends an audio file to the user.
+    def send_audio(self, chat_id: int, content: bytes, title: str = "response.wav",
+                   parse_mode: str = 'HTML') -> requests.Response:
+        """Sends audio to the user.
 
         Args:
             chat_id: Chat ID.
-            filename: Name of the audio file that has to be sent.
+            content: Content of the audio file that has to be sent.
+            title: Title of the audio.
             parse_mode: Parse mode. Defaults to ``HTML``
 
         Returns:
             Response:
             Response class.
         """
-        with open(filename, 'rb') as audio:
-            files = {'audio': audio.read()}
-        return self._make_request(url=self.BASE_URL + models.env.bot_token + '/sendAudio', files=files,
-                                  payload={'chat_id': chat_id, 'title': filename, 'parse_mode': parse_mode})
+        return self._make_request(url=self.BASE_URL + models.env.bot_token + '/sendAudio', files={'audio': content},
+                                  payload={'chat_id': chat_id, 'title': title, 'parse_mode': parse_mode})
 
     def reply_to(self, payload: dict, response: str, parse_mode: str = 'markdown') -> requests.Response:
         """Generates a payload to reply to a message received.
@@ -306,10 +304,7 @@ class TelegramBot:
         if "bypass" in payload.get('text', '').lower():
             logger.info(f"{payload['from']['username']} requested a STOP bypass.")
             self.reply_to(payload=payload, response=f"Shutting down now {models.env.title}!\n{support.exit_message()}")
-            with db.connection:
-                cursor = db.connection.cursor()
-                cursor.execute("INSERT or REPLACE INTO stopper (flag, caller) VALUES (?,?);", (True, 'TelegramAPI'))
-                cursor.connection.commit()
+            channel.request_stop(caller='TelegramAPI')
         else:
             self.reply_to(payload=payload,
                           response="Jarvis cannot be stopped via offline communication without a 'bypass' flag.")
@@ -359,10 +354,9 @@ class TelegramBot:
             logger.error(payload)
         # Catches both unconverted source ogg and unconverted audio to text
         title = USER_TITLE.get(payload['from']['username'], models.env.title)
-        filename = tts_stt.text_to_audio(text=f"I'm sorry {title}! I was unable to process your voice command. "
-                                              "Please try again!")
-        self.send_audio(filename=filename, chat_id=payload['from']['id'])
-        os.remove(filename)
+        if content := tts_stt.text_to_audio(text=f"I'm sorry {title}! I was unable to process your voice command. "
+                                                 "Please try again!"):
+            self.send_audio(content=content, chat_id=payload['from']['id'])
 
     def process_text(self, payload: dict) -> None:
         """Processes the payload received after checking for authentication.
@@ -472,10 +466,8 @@ class TelegramBot:
             response: Response from Jarvis.
             payload: Payload received, to extract information from.
         """
-        if payload.get('voice'):
-            filename = tts_stt.text_to_audio(text=response)
-            self.send_audio(chat_id=payload['from']['id'], filename=filename)
-            os.remove(filename)
+        if payload.get('voice') and (content := tts_stt.text_to_audio(text=response)):
+            self.send_audio(chat_id=payload['from']['id'], content=content)
             return
         self.send_message(chat_id=payload['from']['id'], response=response)
 
@@ -2,15 +2,16 @@ import os
 import socket
 import sys
 import time
-from typing import List, NoReturn
+from threading import Lock, Thread
+from typing import List, NoReturn, Union
 
 from dotenv import set_key
-from playsound import playsound
 from pywebostv.connection import WebOSClient
 from pywebostv.controls import (ApplicationControl, MediaControl,
                                 SourceControl, SystemControl)
 
 from executors.logger import logger
+from modules.audio import sounds
 from modules.exceptions import TVError
 from modules.models import models
 from modules.utils import shared
@@ -26,7 +27,7 @@ class TV:
     _init_status = False
     reconnect = False
 
-    def __init__(self, ip_address: str = None, client_key: str = None):
+    def __init__(self, ip_address: str = None, client_key: str = None, discover: bool = True, notify: bool = True):
         """Client key will be logged and stored as SSM param when you accept the connection for the first time.
 
         Store the dict value as an env variable and use it as below. Using TV's ip makes the initial
@@ -35,6 +36,8 @@ class TV:
         Args:
             ip_address: IP address of the TV.
             client_key: Client Key to authenticate connection.
+            discover: Boolean flag to scan the network for the TV if the IP address is unreachable.
+            notify: Boolean flag to notify the TV once connected.
         """
         store = {'client_key': client_key} if client_key else {}
 
@@ -43,9 +46,11 @@ class TV:
             self.client.connect()
         except (socket.gaierror, ConnectionRefusedError) as error:
             logger.error(error)
+            if not discover:
+                raise TVError
             self.reconnect = True
-            if not shared.called_by_offline:
-                playsound(sound=models.indicators.tv_scan, block=False)
+            if not shared.called_by_offline.get():
+                sounds.play(sound=models.indicators.tv_scan, block=False)
             if discovered := WebOSClient.discover():
                 self.client = discovered[0]
                 try:
@@ -64,7 +69,7 @@ class TV:
                 sys.stdout.write('\rConnected to the TV.')
                 break
             elif status == WebOSClient.PROMPTED:
-                playsound(sound=models.indicators.tv_connect, block=False)
+                sounds.play(sound=models.indicators.tv_connect, block=False)
                 self.reconnect = True
                 sys.stdout.write('\rPlease accept the connection request on your TV.')
 
@@ -76,8 +81,9 @@ class TV:
                 logger.critical('Client key has been generated. Store it in env vars to re-use.')
                 logger.critical(f"TV_CLIENT_KEY: {store.get('client_key')}")
 
+        self.ip_address = getattr(self.client, 'host', ip_address)
         self.system = SystemControl(self.client)
-        self.system.notify("Jarvis is controlling the TV now.") if not self._init_status else None
+        self.system.notify("Jarvis is controlling the TV now.") if notify and not self._init_status else None
         self.media = MediaControl(self.client)
         self.app = ApplicationControl(self.client)
         self.source_control = SourceControl(self.client)
@@ -224,3 +230,104 @@ class TV:
         self.system.notify('Jarvis::SHUTTING DOWN now')
         time.sleep(3)
         self.system.power_off()
+
+
+class TVSession:
+    """Holds a long-lived connection to the TV, checks on it with heartbeats and reconnects when it drops.
+
+    >>> TVSession
+
+    See Also:
+        - Commands reuse the open socket, so they do not need a ping, a handshake or a registration every time.
+        - The IP address that the TV was last reached on, including the one found by discovery, is re-used.
+        - Heartbeats stop once the TV is unreachable, and the next command connects again.
+    """
+
+    def __init__(self, interval: int = 30):
+        """Instantiates the session without connecting to the TV.
+
+        Args:
+            interval: Seconds between each heartbeat.
+        """
+        self.tv: Union[TV, None] = None
+        self.ip_address: Union[str, None] = None
+        self.client_key: Union[str, None] = None
+        self.interval = interval
+        self._lock = Lock()
+        self._heartbeat: Union[Thread, None] = None
+
+    @property
+    def alive(self) -> bool:
+        """Checks if the socket to the TV is open.
+
+        Returns:
+            bool:
+            A boolean flag to indicate whether the session can be used.
+        """
+        return bool(self.tv) and not getattr(self.tv.client, 'terminated', False)
+
+    def connect(self, ip_address: str, client_key: str) -> TV:
+        """Connects to the TV unless a session is already open.
+
+        Args:
+            ip_address: IP address of the TV.
+            client_key: Client Key to authenticate connection.
+
+        Returns:
+            TV:
+            Connected TV object.
+        """
+        with self._lock:
+            if self.alive:
+                return self.tv
+            self.tv = TV(ip_address=ip_address, client_key=client_key)
+            self.ip_address, self.client_key = self.tv.ip_address, client_key
+        if not (self._heartbeat and self._heartbeat.is_alive()):
+            self._heartbeat = Thread(target=self._beat, daemon=True)
+            self._heartbeat.start()
+        return self.tv
+
+    def _beat(self) -> NoReturn:
+        """Sends a request to the TV at regular intervals and reconnects once if it fails, until there is no session."""
+        while self.tv:
+            time.sleep(self.interval)
+            with self._lock:
+                if not self.tv:
+                    break
+                try:
+                    if not self.alive:
+                        raise ConnectionResetError("Socket was terminated.")
+                    self.tv.media.get_volume()
+                    continue
+                except Exception as error:
+                    logger.warning(f"TV heartbeat failed: {error}")
+                    self._close()
+                try:
+                    self.tv = TV(ip_address=self.ip_address, client_key=self.client_key, discover=False, notify=False)
+                    logger.info(f"Reconnected to the TV at {self.ip_address}")
+                except Exception as error:
+                    logger.error(f"Unable to reconnect to the TV: {error}")
+                    self.tv = None
+
+    def _close(self) -> NoReturn:
+        """Closes the socket to the TV."""
+        if self.tv:
+            try:
+                self.tv.client.close()
+            except Exception as error:
+                logger.error(error)
+        self.tv = None
+
+    def shutdown(self) -> NoReturn:
+        """Turns off the TV and ends the session."""
+        with self._lock:
+            tv, self.tv = self.tv, None
+        if tv:
+            tv.shutdown()
+            try:
+                tv.client.close()
+            except Exception as error:
+                logger.error(error)
+
+
+session = TVSession()
@@ -5,12 +5,13 @@
 
 """
 
+from contextvars import ContextVar
+
 greeting = False
-called_by_offline = False
 
-text_spoken = None
-offline_caller = None
-tv = None
+# Request scoped values, so that concurrent offline requests capture their own responses
+called_by_offline: ContextVar[bool] = ContextVar("called_by_offline", default=False)
+text_spoken: ContextVar[str] = ContextVar("text_spoken", default=None)
 
 processes = {}
 hosted_device = {}
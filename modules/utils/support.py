@@ -6,6 +6,7 @@
 """
 
 import hashlib
+import json
 import math
 import os
 import random
@@ -14,7 +15,7 @@ import socket
 import string
 import sys
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 from difflib import SequenceMatcher
 from typing import List, NoReturn, Union
 
@@ -27,11 +28,8 @@ from executors.internet import ip_address
 from executors.logger import logger
 from modules.audio import speaker
 from modules.conditions import keywords
-from modules.database import database
 from modules.models import models
 
-db = database.Database(database=models.fileio.base_db)
-
 
 def hostname_to_ip(hostname: str) -> List[str]:
     """Uses ``socket.gethostbyname_ex`` to translate a host name to IPv4 address format, extended interface.
@@ -180,12 +178,36 @@ def get_closest_match(text: str, match_list: list) -> str:
 
 
 def unrecognized_dumper(train_data: dict) -> NoReturn:
-    """If none of the conditions are met, converted text is written to a yaml file for training purpose.
+    """If none of the conditions are met, converted text is appended to a log file for training purpose.
 
     Args:
         train_data: Takes the dictionary that has to be written as an argument.
+
+    See Also:
+        - Every entry is a line of JSON appended with a single write, so writers never clobber each other.
+        - ``training_exporter`` moves the log into the yaml file, which is the sorted view used for analysis.
+    """
+    timestamp = datetime.now().isoformat(timespec='microseconds')
+    lines = "".join(json.dumps({"timestamp": timestamp, "function": key, "text": value}) + "\n"
+                    for key, value in train_data.items())
+    with open(models.fileio.training_log, 'a') as writer:
+        writer.write(lines)
+
+
+def training_exporter() -> NoReturn:
+    """Moves the entries from the training log into the yaml file, sorted with the most recent entries first.
+
+    See Also:
+        - The log is renamed before it is read, so that new entries go to a fresh log during the export.
+        - A renamed log that was left behind by an interrupted export is merged first.
+        - Different entries of a function with the same timestamp are kept apart by a microsecond, since the timestamp
+          is the key. Identical entries are merged, so that exporting a log again does not duplicate them.
     """
-    dt_string = datetime.now().strftime("%B %d, %Y %H:%M:%S.%f")[:-3]
+    compacting = f"{models.fileio.training_log}.compacting"
+    if not os.path.isfile(compacting):
+        if not os.path.isfile(models.fileio.training_log):
+            return
+        os.replace(models.fileio.training_log, compacting)
     data = {}
     if os.path.isfile(models.fileio.training):
         try:
@@ -195,24 +217,28 @@ def unrecognized_dumper(train_data: dict) -> NoReturn:
             logger.error(error)
             os.rename(src=models.fileio.training,
                       dst=str(models.fileio.training).replace(".", f"_{datetime.now().strftime('%m_%d_%Y_%H_%M')}."))
-        for key, value in train_data.items():
-            if data.get(key):
-                data[key].update({dt_string: value})
-            else:
-                data.update({key: {dt_string: value}})
-
-    if not data:
-        data = {key1: {dt_string: value1} for key1, value1 in train_data.items()}
-
+    entries = {func: {datetime.strptime(dt, "%B %d, %Y %H:%M:%S.%f"): unrec for dt, unrec in unrec_dict.items()}
+               for func, unrec_dict in data.items()}
+    with open(compacting) as reader:
+        for line in reader:
+            try:
+                entry = json.loads(line)
+                unrec_dict = entries.setdefault(entry['function'], {})
+                timestamp = datetime.fromisoformat(entry['timestamp'])
+                while timestamp in unrec_dict and unrec_dict[timestamp] != entry['text']:
+                    timestamp += timedelta(microseconds=1)
+                unrec_dict[timestamp] = entry['text']
+            except (json.JSONDecodeError, KeyError, ValueError) as error:
+                logger.error(f"Skipping malformed training entry: {error}")
     data = {
         func: {
-            dt: unrec for dt, unrec in sorted(unrec_dict.items(), reverse=True,
-                                              key=lambda item: datetime.strptime(item[0], "%B %d, %Y %H:%M:%S.%f"))
-        } for func, unrec_dict in data.items()
+            dt.strftime("%B %d, %Y %H:%M:%S.%f"): unrec for dt, unrec in sorted(unrec_dict.items(), reverse=True)
+        } for func, unrec_dict in entries.items()
     }
-
-    with open(models.fileio.training, 'w') as writer:
+    with open(f"{models.fileio.training}.tmp", 'w') as writer:
         yaml.dump(data=data, stream=writer, sort_keys=False)
+    os.replace(f"{models.fileio.training}.tmp", models.fileio.training)
+    os.remove(compacting)
 
 
 def size_converter(byte_size: int) -> str:
@@ -384,53 +410,6 @@ def number_to_words(input_: Union[int, str], capitalize: bool = False) -> str:
     return result[0].upper() + result[1:] if capitalize else result
 
 
-def lock_files(alarm_files: bool = False, reminder_files: bool = False) -> List[str]:
-    """Checks for ``*.lock`` files within the ``alarm`` directory if present.
-
-    Args:
-        alarm_files: Takes a boolean value to gather list of alarm lock files.
-        reminder_files: Takes a boolean value to gather list of reminder lock files.
-
-    Returns:
-        list:
-        List of ``*.lock`` file names ignoring other hidden files.
-    """
-    if alarm_files:
-        return [f for f in os.listdir("alarm") if not f.startswith(".")] if os.path.isdir("alarm") else None
-    if reminder_files:
-        return [f for f in os.listdir("reminder") if not f.startswith(".")] if os.path.isdir("reminder") else None
-
-
-def check_restart() -> List[str]:
-    """Checks for entries in the restart table in base db.
-
-    Returns:
-        list:
-        Returns the flag, caller from the restart table.
-    """
-    with db.connection:
-        cursor = db.connection.cursor()
-        flag = cursor.execute("SELECT flag, caller FROM restart").fetchone()
-        cursor.execute("DELETE FROM restart")
-        db.connection.commit()
-    return flag
-
-
-def check_stop() -> List[str]:
-    """Checks for entries in the stopper table in base db.
-
-    Returns:
-        list:
-        Returns the flag, caller from the stopper table.
-    """
-    with db.connection:
-        cursor = db.connection.cursor()
-        flag = cursor.execute("SELECT flag, caller FROM stopper").fetchone()
-        cursor.execute("DELETE FROM stopper")
-        db.connection.commit()
-    return flag
-
-
 def exit_message() -> str:
     """Variety of exit messages based on day of week and time of day.
 
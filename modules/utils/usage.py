@@ -0,0 +1,143 @@
+# noinspection PyUnresolvedReferences
+"""Module for in-memory usage counters that are flushed to a yaml file in batches.
+
+>>> Usage
+
+"""
+
+import atexit
+import contextlib
+import os
+from collections import Counter
+from threading import Event, Lock, Thread
+from typing import Dict, NoReturn, Union
+
+import yaml
+
+from executors.logger import logger
+from modules.models import models
+
+if models.settings.macos:
+    import fcntl
+else:
+    # noinspection PyUnresolvedReferences
+    import msvcrt
+
+
+class UsageCounter:
+    """Counts the functions that called the speaker in memory, and adds the counts to a yaml file periodically.
+
+    >>> UsageCounter
+
+    See Also:
+        - Incrementing a counter only updates a dictionary in memory, the file is written by a background thread.
+        - Counts that are not flushed yet are added to the file on every flush, so that processes do not overwrite
+          each other's counts.
+        - Each flush holds an exclusive lock on a sidecar ``.lock`` file while it reads, adds and replaces the file,
+          so that flushes from the API, the automator and the main process do not lose each other's counts.
+        - Pending counts are also flushed when the process exits.
+    """
+
+    def __init__(self, filepath: str, interval: Union[int, float] = 60):
+        """Instantiates the counter without starting the flush thread.
+
+        Args:
+            filepath: Yaml file where the counts are stored.
+            interval: Seconds between each flush.
+        """
+        self.filepath = filepath
+        self.interval = interval
+        self._pending: Counter = Counter()
+        self._lock = Lock()
+        self._file_lock = Lock()
+        self._stopped = Event()
+        self._flusher: Union[Thread, None] = None
+        atexit.register(self.stop)
+
+    def increment(self, name: str) -> NoReturn:
+        """Increments the count for a function.
+
+        Args:
+            name: Name of the function.
+        """
+        with self._lock:
+            self._pending[name] += 1
+            if self._flusher is None:
+                self._flusher = Thread(target=self._run, daemon=True)
+                self._flusher.start()
+
+    def _run(self) -> NoReturn:
+        """Flushes the pending counts at every interval until stopped."""
+        while not self._stopped.wait(timeout=self.interval):
+            self.flush()
+
+    def _load(self) -> Dict[str, int]:
+        """Loads the counts stored in the yaml file.
+
+        Returns:
+            dict:
+            Function names and their counts.
+        """
+        if not os.path.isfile(self.filepath):
+            return {}
+        try:
+            with open(self.filepath) as file:
+                return yaml.load(stream=file, Loader=yaml.FullLoader) or {}
+        except yaml.YAMLError as error:
+            logger.error(error)
+            return {}
+
+    @contextlib.contextmanager
+    def _locked(self) -> None:
+        """Holds the lock across threads and processes, while the yaml file is updated."""
+        with self._file_lock, open(f"{self.filepath}.lock", 'a') as lock:
+            if models.settings.macos:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            else:
+                msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if models.settings.macos:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+                else:
+                    msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def flush(self) -> NoReturn:
+        """Adds the pending counts to the yaml file, and replaces the file atomically."""
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+        if not pending:
+            return
+        try:
+            with self._locked():
+                data = Counter(self._load())
+                data.update(pending)
+                with open(f"{self.filepath}.tmp", 'w') as file:
+                    yaml.dump(data=dict(data.most_common()), stream=file, sort_keys=False)
+                os.replace(f"{self.filepath}.tmp", self.filepath)
+        except OSError as error:
+            logger.error(error)
+            with self._lock:
+                self._pending.update(pending)
+
+    def counts(self) -> Dict[str, int]:
+        """Gets the stored counts along with the pending counts of the current process.
+
+        Returns:
+            dict:
+            Function names and their counts, ordered from the most to the least used.
+        """
+        with self._file_lock:
+            data = Counter(self._load())
+        with self._lock:
+            data.update(self._pending)
+        return dict(data.most_common())
+
+    def stop(self) -> NoReturn:
+        """Stops the flush thread and flushes the pending counts."""
+        self._stopped.set()
+        self.flush()
+
+
+counter = UsageCounter(filepath=models.fileio.frequent)
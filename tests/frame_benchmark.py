@@ -0,0 +1,70 @@
+"""Micro-benchmark for the per-frame cost of handing audio to porcupine, using only the standard library.
+
+>>> python tests/frame_benchmark.py
+
+See Also:
+    - Times the previous path, which unpacks each frame into a tuple with ``struct``, side by side with the current
+      path in ``Activator.detect``, which copies each frame into a sample buffer that is allocated once.
+    - The stand-in for porcupine checks the frame length and builds the C array the same way porcupine's ``process``
+      does, so the result is the cost that each path adds to a frame, besides the wake word detection itself.
+    - The cost is shown against the duration of a frame, which is the time available to process it.
+"""
+
+import ctypes
+import struct
+import sys
+import timeit
+from array import array
+from typing import Sequence
+
+SAMPLE_RATE = 16_000  # porcupine's sample rate
+FRAME_LENGTH = 512  # porcupine's frame length
+
+
+def process(pcm: Sequence[int]) -> int:
+    """Stand-in for ``pvporcupine.Porcupine.process`` that builds the C array without running the detection.
+
+    Args:
+        pcm: Samples of a frame.
+
+    Returns:
+        int:
+        Index of the wake word, always ``-1``
+    """
+    if len(pcm) != FRAME_LENGTH:
+        raise ValueError(f"Invalid frame length. expected {FRAME_LENGTH} but received {len(pcm)}")
+    (ctypes.c_short * len(pcm))(*pcm)
+    return -1
+
+
+def unpacked(frame: bytes) -> int:
+    """Previous path, which unpacks the frame into a new tuple of samples.
+
+    Args:
+        frame: Frame of 16-bit PCM audio.
+    """
+    return process(pcm=struct.unpack_from("h" * FRAME_LENGTH, frame))
+
+
+pcm = array('h', bytes(FRAME_LENGTH * 2))
+buffer = memoryview(pcm).cast('B')
+
+
+def buffered(frame: bytes) -> int:
+    """Current path, which copies the frame into the preallocated sample buffer, like ``Reader.readinto`` does.
+
+    Args:
+        frame: Frame of 16-bit PCM audio.
+    """
+    buffer[:len(frame)] = frame
+    return process(pcm=pcm)
+
+
+if __name__ == '__main__':
+    frame = bytes(FRAME_LENGTH * 2)
+    number = 20_000
+    budget = FRAME_LENGTH / SAMPLE_RATE
+    for name, function in (("struct.unpack_from", unpacked), ("reusable buffer", buffered)):
+        best = min(timeit.repeat(lambda: function(frame), number=number, repeat=5)) / number
+        sys.stdout.write(f"{name}: {best * 1_000_000:.2f} µs per frame, "
+                         f"{best / budget * 100:.3f}% of the {budget * 1_000:.0f} ms frame\n")
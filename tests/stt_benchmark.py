@@ -0,0 +1,66 @@
+"""Benchmark for the speech to text engines on recorded wav files.
+
+>>> python tests/stt_benchmark.py fixtures/*.wav --engines google vosk
+
+See Also:
+    - Run from the root of the repository, so that the env vars and the vosk model set in ``RECOGNIZER_MODEL`` load.
+    - Each file is fed to the engine's stream in frames of 512 samples, the same way the listener feeds captured audio.
+    - ``latency`` is the time from the last frame of the phrase to the recognized text.
+    - ``cpu`` is the processor time spent on each second of audio, including the frames decoded while listening.
+"""
+
+import argparse
+import os
+import sys
+import time
+import wave
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.audio.recognizer import load_engine  # noqa: E402
+
+FRAME_LENGTH = 512  # frame length of the capture
+
+
+def benchmark(engine_name: str, filename: str) -> dict:
+    """Converts a wav file to text using the engine.
+
+    Args:
+        engine_name: Name of the engine.
+        filename: Mono 16-bit wav file.
+
+    Returns:
+        dict:
+        Recognized text, latency after the end of speech and the processor time per second of audio.
+    """
+    with wave.open(filename) as file:
+        assert file.getnchannels() == 1 and file.getsampwidth() == 2, f"{filename} is not mono 16-bit audio"
+        rate, data = file.getframerate(), file.readframes(file.getnframes())
+    stream = load_engine(name=engine_name).stream(sample_rate=rate)
+    cpu = time.process_time()
+    for index in range(0, len(data), FRAME_LENGTH * 2):
+        stream.feed(frame=data[index:index + FRAME_LENGTH * 2])
+    start = time.perf_counter()
+    try:
+        text = stream.result()
+    except Exception as error:  # noqa: broad exception to keep benchmarking the remaining files
+        text = f"<{type(error).__name__}>"
+    latency = time.perf_counter() - start
+    return {"text": text, "latency": latency, "cpu": (time.process_time() - cpu) / (len(data) / 2 / rate)}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark for the speech to text engines.")
+    parser.add_argument("files", nargs="+", help="Mono 16-bit wav files.")
+    parser.add_argument("--engines", nargs="+", default=["google", "vosk"], help="Engines to benchmark.")
+    args = parser.parse_args()
+    for name in args.engines:
+        if load_engine(name=name).name != name:
+            sys.stdout.write(f"{name}: unable to load the engine, skipping\n\n")
+            continue
+        results = [benchmark(engine_name=name, filename=filename) for filename in args.files]
+        for filename, result in zip(args.files, results):
+            sys.stdout.write(f"{name} | {os.path.basename(filename)} | {result['latency'] * 1_000:.0f} ms | "
+                             f"{result['cpu']:.3f} cpu s/s | {result['text']}\n")
+        sys.stdout.write(f"{name}: {sum(result['latency'] for result in results) / len(results) * 1_000:.0f} ms "
+                         f"latency, {sum(result['cpu'] for result in results) / len(results):.3f} cpu s/s\n\n")